@@ -0,0 +1,166 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_validation import DEPARTMENTS, BED_TYPES
+
+# Pre-aggregated cube behind the cross-filtered charts. Admissions are counted once into
+# a dense array Admission_day x Department x Bed_type x Age_band x measure, plus its
+# prefix sums over days, so a filter change never touches the raw rows: a date range is
+# two prefix lookups, the other filters are cached boolean masks over small axes, and
+# every chart is one masked sum over the cube (a few milliseconds). New admissions can be
+# added to a built cube (add_rows) without re-aggregating the rows it already holds.
+#
+# Missing values count as 0 in the sums; Billed counts the admissions with charges, so
+# revenue means are taken over billed admissions only.
+#
+# Cross-filter convention: each chart is filtered by every selection except its own,
+# so the chart a selection was made in keeps showing the alternatives.
+
+DIMENSIONS = ['Admission_day', 'Department', 'Bed_type', 'Age_band']
+MEASURES = ['Admissions', 'LOS_sum', 'Readmissions', 'Revenue', 'Age_sum', 'Billed']
+CUBE_COLUMNS = ['Admission_date', 'Department', 'Bed_type', 'Age', 'Length_of_stay',
+                'readmitted_30_days', 'Total_charges']
+AGE_BAND_WIDTH = 5
+MAX_AGE = 100
+
+
+class AggregateCube:
+    def __init__(self, labels, values):
+        # labels: dimension -> pd.Index of the axis, values: float64 array of shape labels + (measures,)
+        self.labels = labels
+        self.values = values
+        # prefix[i] = sum of the first i days, a day range is prefix[stop] - prefix[start]
+        self.prefix = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)])
+        self._masks = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, df):
+        days = df['Admission_date'].dt.normalize()
+        first, last = days.min(), days.max()
+        if pd.isna(first):
+            first = last = pd.Timestamp.today().normalize()
+        labels = {
+            'Admission_day': pd.date_range(first, last, freq='D'),
+            'Department': pd.Index(DEPARTMENTS),
+            'Bed_type': pd.Index(BED_TYPES),
+            'Age_band': pd.Index(np.arange(0, MAX_AGE + 1, AGE_BAND_WIDTH))
+        }
+        return cls(labels, _aggregate(df, labels))
+
+    def add_rows(self, df):
+        # a new cube with the admissions of df added; the day axis grows to cover their dates,
+        # and the cube itself is left unchanged for the sessions still reading it
+        days = df['Admission_date'].dt.normalize()
+        current = self.labels['Admission_day']
+        first, last = current[0], current[-1]
+        if days.notna().any():
+            first, last = min(days.min(), first), max(days.max(), last)
+        labels = dict(self.labels, Admission_day=pd.date_range(first, last, freq='D'))
+        offset = (current[0] - first).days
+        values = np.zeros((len(labels['Admission_day']),) + self.values.shape[1:])
+        values[offset:offset + len(current)] = self.values
+        return type(self)(labels, values + _aggregate(df, labels))
+
+    def _day_range(self, selected):
+        # (start, stop) positions of an inclusive (first, last) date range
+        days = self.labels['Admission_day']
+        if selected is None:
+            return 0, len(days)
+        first, last = selected
+        return (int(days.searchsorted(pd.Timestamp(first), side='left')),
+                int(days.searchsorted(pd.Timestamp(last), side='right')))
+
+    def mask(self, dim, selected):
+        # boolean mask over a category axis, None = no filter; cached per selection
+        if selected is None:
+            return None
+        key = (dim, tuple(selected))
+        with self._lock:
+            if key not in self._masks:
+                self._masks[key] = self.labels[dim].isin(list(selected))
+            return self._masks[key]
+
+    def _reduce(self, filters, keep=None):
+        # sum over every axis but keep, applying the filters of the other dimensions
+        filters = {d: v for d, v in filters.items() if d != keep and v is not None}
+        if keep != 'Admission_day':
+            start, stop = self._day_range(filters.get('Admission_day'))
+            array = self.prefix[stop] - self.prefix[start]
+            dims = DIMENSIONS[1:]
+        else:
+            array = self.values
+            dims = DIMENSIONS
+        # reduce from the last axis so the positions of the remaining axes stay valid
+        for axis in reversed(range(len(dims))):
+            dim = dims[axis]
+            if dim == keep:
+                continue
+            mask = self.mask(dim, filters.get(dim))
+            array = array.sum(axis) if mask is None else np.compress(mask, array, axis).sum(axis)
+        return array
+
+    def total(self, filters):
+        return dict(zip(MEASURES, self._reduce(filters)))
+
+    def marginal(self, dim, filters):
+        # measures per value of dim, filtered by the selections on all other dimensions
+        return pd.DataFrame(self._reduce(filters, keep=dim), index=self.labels[dim], columns=MEASURES)
+
+
+def _aggregate(df, labels):
+    # measures of the rows of df summed into a dense array over the axes of labels
+    days = df['Admission_date'].dt.normalize()
+    codes = [
+        ((days - labels['Admission_day'][0]).dt.days).to_numpy(),
+        pd.Categorical(df['Department'], categories=DEPARTMENTS).codes,
+        pd.Categorical(df['Bed_type'], categories=BED_TYPES).codes,
+        np.clip(df['Age'].to_numpy() // AGE_BAND_WIDTH, 0, len(labels['Age_band']) - 1).astype(np.int64)
+    ]
+    # rows with values outside the validated enums (or no admission date) are left out,
+    # as in the validation step
+    shape = tuple(len(labels[d]) for d in DIMENSIONS)
+    valid = np.all([(c >= 0) & (c < n) for c, n in zip(codes, shape)], axis=0)
+    cell = np.ravel_multi_index([c[valid].astype(np.int64) for c in codes], shape)
+    size = int(np.prod(shape))
+    charges = df['Total_charges'].to_numpy(dtype=float)[valid]
+    measures = [
+        np.ones(int(valid.sum())),
+        df['Length_of_stay'].to_numpy(dtype=float)[valid],
+        df['readmitted_30_days'].to_numpy(dtype=float)[valid],
+        charges,
+        df['Age'].to_numpy(dtype=float)[valid],
+        ~np.isnan(charges)
+    ]
+    values = np.stack([np.bincount(cell, weights=np.nan_to_num(np.asarray(m, dtype=float)), minlength=size)
+                       for m in measures], axis=-1)
+    return values.reshape(shape + (len(MEASURES),))
+
+
+def cube_kpis(cube, filters):
+    # the Home Overview KPI and insight figures for the current selection
+    totals = cube.total(filters)
+    admissions = totals['Admissions']
+    departments = cube.marginal('Department', filters)
+    if filters.get('Department') is not None:
+        departments = departments.loc[list(filters['Department'])]
+    beds = cube.marginal('Bed_type', filters)
+    if filters.get('Bed_type') is not None:
+        beds = beds.loc[list(filters['Bed_type'])]
+    busiest = departments['Admissions'].idxmax() if admissions else None
+    # an empty selection shows zeros rather than NaN
+    per_admission = max(admissions, 1)
+    return {
+        'total_admissions': int(admissions),
+        'avg_los': float(totals['LOS_sum'] / per_admission),
+        'readmission_rate': float(totals['Readmissions'] / per_admission * 100),
+        'total_revenue': float(totals['Revenue']),
+        'billed_admissions': int(totals['Billed']),
+        'avg_revenue': float(totals['Revenue'] / max(totals['Billed'], 1)),
+        'avg_age': float(totals['Age_sum'] / per_admission),
+        'icu_percent': float(beds['Admissions'].get('ICU', 0) / per_admission * 100),
+        'busiest_department': busiest,
+        'busiest_department_admissions': int(departments['Admissions'].max()) if admissions else 0
+    }
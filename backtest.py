@@ -0,0 +1,90 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.metrics import roc_auc_score
+
+from data_loader import load_data
+from readmission_model import TARGET, encode_features, label_available_at, make_model
+
+# Rolling-origin backtests of the readmission models. Each fold trains on the
+# admissions whose 30-day label was observed before the cutoff (within a rolling
+# window) and scores the admissions of the following period. The design matrix is
+# encoded once; joblib memory-maps it into the worker processes.
+
+
+def make_folds(df, train_days=180, test_days=30, step_days=30):
+    # [(cutoff, train rows, test rows)] for every cutoff with labelled history and a full test period
+    admitted = pd.to_datetime(df['Admission_date']).to_numpy()
+    observed = label_available_at(df).to_numpy()
+    train_days, test_days, step_days = (pd.Timedelta(days=d) for d in (train_days, test_days, step_days))
+
+    first = pd.Timestamp(admitted.min()).normalize()
+    last = pd.Timestamp(admitted.max())
+    folds = []
+    cutoff = first + train_days
+    while cutoff + test_days <= last + pd.Timedelta(days=1):
+        # labels must be known by the cutoff, and the stay must start inside the training window
+        train = (observed <= cutoff) & (admitted >= cutoff - train_days)
+        test = (admitted >= cutoff) & (admitted < cutoff + test_days)
+        folds.append((cutoff, np.flatnonzero(train), np.flatnonzero(test)))
+        cutoff += step_days
+    return folds
+
+
+def run_fold(X, y, train_idx, test_idx, model_name, params=None):
+    result = {'Train_rows': len(train_idx), 'Test_rows': len(test_idx),
+              'Test_positive_rate': float(y[test_idx].mean()) if len(test_idx) else np.nan, 'ROC_AUC': np.nan}
+    # AUC is undefined when either side has a single class
+    if len(np.unique(y[train_idx])) < 2 or len(np.unique(y[test_idx])) < 2:
+        return result
+    model = make_model(model_name, **(params or {}))
+    model.fit(X[train_idx], y[train_idx])
+    result['ROC_AUC'] = roc_auc_score(y[test_idx], model.predict_proba(X[test_idx])[:, 1])
+    return result
+
+
+def backtest(df, models=('lr', 'rf'), train_days=180, test_days=30, step_days=30, workers=-1,
+             data_dir=None, params=None):
+    X = encode_features(df, data_dir).to_numpy()
+    y = df[TARGET].to_numpy()
+    folds = make_folds(df, train_days, test_days, step_days)
+    jobs = [(name, cutoff, train, test) for cutoff, train, test in folds for name in models]
+    results = Parallel(n_jobs=workers)(
+        delayed(run_fold)(X, y, train, test, name, (params or {}).get(name)) for name, cutoff, train, test in jobs
+    )
+    return pd.DataFrame([
+        {'Model': name, 'Cutoff': cutoff, **result} for (name, cutoff, _, _), result in zip(jobs, results)
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time-based backtests of the readmission models.")
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--models", nargs="+", choices=['lr', 'rf'], default=['lr', 'rf'])
+    parser.add_argument("--train-days", type=int, default=180, help="length of the rolling training window")
+    parser.add_argument("--test-days", type=int, default=30, help="length of each evaluation period")
+    parser.add_argument("--step-days", type=int, default=30, help="distance between cutoffs")
+    parser.add_argument("--workers", type=int, default=-1, help="parallel folds (-1 = all cores)")
+    parser.add_argument("--out", default=None, help="write the per-fold results to this CSV file")
+    args = parser.parse_args(argv)
+
+    df = load_data(args.data_dir)[0]
+    results = backtest(df, args.models, args.train_days, args.test_days, args.step_days,
+                       args.workers, args.data_dir)
+    if results.empty:
+        print("Not enough history for a single fold.")
+        return
+    print(results.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    print()
+    print(results.groupby('Model')['ROC_AUC'].agg(['mean', 'std', 'count']).round(3))
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        results.to_csv(args.out, index=False)
+        print("Written:", args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from data_loader import DATA_DIR
+from data_handle import DataHandle
+from patient_history import HISTORY_COLUMNS, load_history_features
+from readmission_model import (SCORING_COLUMNS, bundle_path, load_bundle, encode_features, history_matrix,
+                               predict_risk, score_frame)
+
+# Nightly batch scoring of the readmission model. History features are computed once
+# for the whole network (they need every stay of a patient), then row chunks of the
+# memory-mapped merged table are encoded and scored in worker processes. The scores
+# are written with the model version and scoring time to data/scores/risk_scores.arrow,
+# which the Critical Alerts page and the KPI API read instead of scoring themselves.
+# An --as-of run only rescores the current inpatients and merges them into the stored scores.
+
+SCORES_FILE = os.path.join("scores", "risk_scores.arrow")
+CHUNK_SIZE = 250_000
+
+# per worker process: the data handle and the model bundle, loaded once by _init_worker
+_worker = {}
+
+
+def scores_path(data_dir=None):
+    return os.path.join(data_dir or DATA_DIR, SCORES_FILE)
+
+
+def scores_mtime(data_dir=None):
+    path = scores_path(data_dir)
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def _init_worker(data_dir, model_path):
+    _worker['handle'] = DataHandle(data_dir)
+    _worker['bundle'] = load_bundle(model_path)
+
+
+def score_chunk(positions, history):
+    # rows of the merged table at positions, with their precomputed history features
+    data = _worker['handle'].merged(SCORING_COLUMNS).iloc[positions]
+    X = pd.concat([encode_features(data, history=False), history], axis=1)
+    return data['Admission_ID'].to_numpy(), predict_risk(_worker['bundle'], X)
+
+
+def current_inpatients(data, as_of):
+    # admitted on or before as_of and not yet discharged
+    as_of = pd.Timestamp(as_of)
+    return ((data['Admission_date'] <= as_of) & (data['Discharge_date'] > as_of)).to_numpy()
+
+
+def batch_score(data_dir=None, model_path=None, chunk_size=CHUNK_SIZE, workers=None, as_of=None):
+    bundle = load_bundle(model_path)
+    if bundle is None:
+        raise FileNotFoundError(f"No model bundle at {model_path or bundle_path()}")
+    handle = DataHandle(data_dir)
+    keys = handle.merged(HISTORY_COLUMNS)
+    history = history_matrix(load_history_features(keys, data_dir))
+
+    positions = np.flatnonzero(current_inpatients(keys, as_of)) if as_of is not None else np.arange(len(keys))
+    chunks = [positions[i:i + chunk_size] for i in range(0, len(positions), chunk_size)]
+    histories = [history.iloc[chunk].reset_index(drop=True) for chunk in chunks]
+
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(data_dir, model_path)
+        results = [score_chunk(c, h) for c, h in zip(chunks, histories)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_dir, model_path)) as pool:
+            results = list(pool.map(score_chunk, chunks, histories))
+
+    ids = np.concatenate([r[0] for r in results]) if results else np.array([], dtype=np.int64)
+    probabilities = np.concatenate([r[1] for r in results]) if results else np.array([], dtype=float)
+    return pd.DataFrame({
+        'Admission_ID': ids,
+        'Risk_probability': probabilities,
+        'Model_version': pd.Categorical([bundle['version']] * len(ids), categories=[bundle['version']]),
+        'Scored_at': pd.Timestamp.now().floor('s')
+    })
+
+
+def write_scores(scores, data_dir=None):
+    path = scores_path(data_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(scores, tmp, compression='uncompressed')
+    os.replace(tmp, path)
+    return path
+
+
+def merge_scores(stored, scores):
+    # stored scores with the rows of scores replaced or added by Admission_ID
+    if stored is None:
+        return scores
+    kept = stored[~stored['Admission_ID'].isin(scores['Admission_ID'])]
+    return pd.concat([kept, scores], ignore_index=True)
+
+
+def load_scores(data_dir=None, model_version=None):
+    # stored scores, None when missing or written by another model version
+    path = scores_path(data_dir)
+    if not os.path.exists(path):
+        return None
+    scores = feather.read_feather(path, memory_map=True)
+    if model_version is not None and list(scores['Model_version'].cat.categories) != [model_version]:
+        return None
+    return scores
+
+
+def current_scores(bundle, data, data_dir=None):
+    # Admission_ID + Risk_probability for the network merged table (SCORING_COLUMNS): stored
+    # batch scores where available, admissions added since the last batch run are scored here
+    stored = load_scores(data_dir, bundle['version'])
+    if stored is None:
+        return score_frame(bundle, data, data_dir)
+    positions = pd.Index(stored['Admission_ID']).get_indexer(data['Admission_ID'])
+    probabilities = stored['Risk_probability'].to_numpy()[positions]
+    missing = positions < 0
+    if missing.any():
+        X = encode_features(data, data_dir)
+        probabilities[missing] = predict_risk(bundle, X[missing])
+    return pd.DataFrame({'Admission_ID': data['Admission_ID'].to_numpy(), 'Risk_probability': probabilities})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score admissions with the trained readmission model.")
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--model", default=None, help="model bundle (default models/readmission_bundle.joblib)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="admissions per scoring task")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: all cores)")
+    parser.add_argument("--as-of", default=None,
+                        help="only score patients in hospital on this date (default: every admission)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    scores = batch_score(args.data_dir, args.model, args.chunk_size, args.workers, args.as_of)
+    scored = len(scores)
+    if args.as_of is not None:
+        # only the inpatients were scored, the other admissions keep their stored scores of this model
+        version = scores['Model_version'].cat.categories[0]
+        scores = merge_scores(load_scores(args.data_dir, version), scores)
+    path = write_scores(scores, args.data_dir)
+    print(f"Scored {scored:,} admissions in {time.perf_counter() - start:.1f}s -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Background precomputation of the dashboard's cached aggregates. Tasks are plain
+# callables that fill the app's caches; they run on a small shared thread pool as
+# soon as the data is loaded (or refreshed), and pages only wait for their own tasks.
+
+WORKERS = int(os.environ.get("HOSPITAL_WARM_WORKERS", "2"))
+# warm-ups kept per server, older data versions are dropped
+MAX_RUNS = 8
+
+
+class CacheWarmer:
+    def __init__(self, workers=WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-warmer")
+        self._lock = threading.Lock()
+        self._runs = {}
+
+    def warm(self, key, tasks):
+        # submit the tasks not yet started for this key, in the given order
+        with self._lock:
+            run = self._runs.setdefault(key, {})
+            for name, fn in tasks.items():
+                if name not in run:
+                    run[name] = self._pool.submit(self._run, fn)
+            while len(self._runs) > MAX_RUNS:
+                self._runs.pop(next(iter(self._runs)))
+        return run
+
+    @staticmethod
+    def _run(fn):
+        # results live in the app caches, the future only reports completion
+        fn()
+
+    def progress(self, key):
+        # (finished, total, failed task names)
+        with self._lock:
+            run = dict(self._runs.get(key, {}))
+        done = [name for name, f in run.items() if f.done()]
+        failed = [name for name in done if run[name].exception() is not None]
+        return len(done), len(run), failed
+
+    def pending(self, key, names):
+        with self._lock:
+            run = self._runs.get(key, {})
+            return [name for name in names if name in run and not run[name].done()]
+
+    def wait(self, key, names, timeout=None):
+        # block until the named tasks finished; failures are left to the page to recompute
+        with self._lock:
+            run = self._runs.get(key, {})
+            futures = [run[name] for name in names if name in run]
+        wait(futures, timeout=timeout)
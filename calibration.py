@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+# Probability calibration and operating-threshold selection for the readmission scores.
+# All threshold metrics come from one descending sort and cumulative sums, so every
+# candidate threshold is evaluated at once.
+
+# cost of a missed readmission relative to one unnecessary follow-up
+DEFAULT_COST_FN = 5.0
+DEFAULT_COST_FP = 1.0
+
+
+class Calibrator:
+    def __init__(self, method='isotonic'):
+        if method not in ('isotonic', 'platt'):
+            raise ValueError(f"Unknown calibration method: {method}")
+        self.method = method
+        self._model = None
+
+    def fit(self, scores, y):
+        scores = np.asarray(scores, dtype=float)
+        y = np.asarray(y)
+        if self.method == 'isotonic':
+            self._model = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds='clip').fit(scores, y)
+        else:
+            self._model = LogisticRegression().fit(scores.reshape(-1, 1), y)
+        return self
+
+    def transform(self, scores):
+        scores = np.asarray(scores, dtype=float)
+        if self.method == 'isotonic':
+            return self._model.predict(scores)
+        return self._model.predict_proba(scores.reshape(-1, 1))[:, 1]
+
+
+def threshold_curve(scores, y, cost_fp=DEFAULT_COST_FP, cost_fn=DEFAULT_COST_FN, days=None):
+    # one row per distinct score: flagging everything >= Threshold gives these counts
+    scores = np.asarray(scores, dtype=float)
+    y = np.asarray(y, dtype=np.int64)
+    order = np.argsort(-scores, kind='stable')
+    scores, y = scores[order], y[order]
+
+    tp = np.cumsum(y)
+    fp = np.cumsum(1 - y)
+    # the last row of each run of equal scores holds the counts for that threshold
+    last = np.r_[scores[1:] != scores[:-1], True] if len(scores) else np.array([], dtype=bool)
+    tp, fp, thresholds = tp[last], fp[last], scores[last]
+    positives = y.sum()
+    flagged = tp + fp
+
+    curve = pd.DataFrame({
+        'Threshold': thresholds,
+        'Flagged': flagged,
+        'True_positives': tp,
+        'False_positives': fp,
+        'Precision': tp / np.maximum(flagged, 1),
+        'Recall': tp / positives if positives else np.zeros(len(tp)),
+        'Cost': cost_fp * fp + cost_fn * (positives - tp)
+    })
+    total = (curve['Precision'] + curve['Recall']).to_numpy()
+    curve['F1'] = np.divide((2 * curve['Precision'] * curve['Recall']).to_numpy(), total,
+                            out=np.zeros(len(curve)), where=total > 0)
+    if days:
+        curve['Flagged_per_day'] = curve['Flagged'] / days
+    return curve
+
+
+def choose_threshold(curve, objective='cost', max_per_day=None):
+    # operating point: lowest cost (or best F1), optionally capped by alerts per day
+    candidates = curve
+    if max_per_day is not None and 'Flagged_per_day' in curve.columns:
+        candidates = curve[curve['Flagged_per_day'] <= max_per_day]
+        if candidates.empty:
+            candidates = curve.iloc[:1]
+    if objective == 'cost':
+        row = candidates.loc[candidates['Cost'].idxmin()]
+    elif objective == 'f1':
+        row = candidates.loc[candidates['F1'].idxmax()]
+    else:
+        raise ValueError(f"Unknown objective: {objective}")
+    return row.to_dict()
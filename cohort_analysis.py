@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+# Readmission cohorts derived from the admissions themselves instead of the generated
+# readmitted_30_days flag. Admissions are sorted once by (Patient_ID, Admission_date) -
+# a sorted self-join like merge_asof by Patient_ID - so every stay is linked to the
+# same patient's next stay with one shift, and chains, time-to-readmit curves and
+# monthly retention are bincounts and cumsums over that order.
+
+COHORT_COLUMNS = ['Admission_ID', 'Patient_ID', 'Admission_date', 'Discharge_date']
+READMIT_WINDOW = 30
+# follow-up horizon of the time-to-readmit curves
+MAX_FOLLOW_UP = 365
+
+
+def _days(values):
+    return pd.to_datetime(values).to_numpy().astype('datetime64[D]').astype('int64')
+
+
+def link_admissions(admissions, window=READMIT_WINDOW):
+    # one row per admission (input order): the next admission of the patient, the days from
+    # discharge to it, whether it is a readmission within window, and the readmission chain
+    adm = admissions[COHORT_COLUMNS]
+    n = len(adm)
+    patient = pd.factorize(adm['Patient_ID'])[0].astype('int64')
+    admit = _days(adm['Admission_date'])
+    discharge = _days(adm['Discharge_date'])
+    ids = adm['Admission_ID'].to_numpy()
+    order = np.lexsort((ids, admit, patient))
+    patient, admit, discharge, ids = patient[order], admit[order], discharge[order], ids[order]
+
+    has_next = np.r_[patient[1:] == patient[:-1], False]
+    next_row = np.minimum(np.arange(n) + 1, max(n - 1, 0))
+    # an admission starting before the previous discharge (a transfer) counts as day 0
+    gap = np.where(has_next, np.clip(admit[next_row] - discharge, 0, None), np.nan)
+    readmitted = has_next & (gap <= window)
+
+    # a chain starts at every admission that is not a readmission of the patient's previous stay
+    continues = np.r_[False, readmitted[:-1]]
+    chain = np.cumsum(~continues) - 1
+    chain_start = np.flatnonzero(~continues)
+    position = np.arange(n) - chain_start[chain]
+
+    links = pd.DataFrame({
+        'Admission_ID': ids,
+        'Next_admission_ID': pd.array(np.where(has_next, ids[next_row], 0), dtype='Int64'),
+        'Days_to_next_admission': gap,
+        'Readmitted': readmitted,
+        'Chain_ID': chain,
+        'Chain_position': position,
+        'Discharge_day': discharge
+    })
+    links.loc[~has_next, 'Next_admission_ID'] = pd.NA
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = np.arange(n)
+    return links.iloc[inverse].reset_index(drop=True)
+
+
+def chain_lengths(links):
+    # number of chains per length in admissions (1 = no readmission)
+    lengths = np.bincount(np.bincount(links['Chain_ID'].to_numpy()))
+    return pd.DataFrame({'Chain_length': np.arange(len(lengths)), 'Chains': lengths})[1:].query('Chains > 0')
+
+
+def time_to_readmit(links, max_days=MAX_FOLLOW_UP, end_day=None):
+    # per day d after discharge: next admissions on day d, and the share of discharges readmitted
+    # within d days over the discharges with at least d days of follow-up (right censoring)
+    discharge = links['Discharge_day'].to_numpy()
+    if len(discharge) == 0:
+        return pd.DataFrame({'Days': np.arange(max_days + 1), 'Readmissions': 0, 'At_risk': 0,
+                             'Readmitted_share': np.nan})
+    end_day = discharge.max() if end_day is None else end_day
+    follow_up = np.clip(end_day - discharge, 0, max_days)
+    gap = links['Days_to_next_admission'].to_numpy()
+    seen = ~np.isnan(gap) & (gap <= max_days)
+    readmits = np.bincount(gap[seen].astype(np.int64), minlength=max_days + 1)
+
+    # a discharge counts as readmitted from its gap until the end of its follow-up:
+    # +1 at the gap, -1 after the follow-up, then a running sum over days
+    counted = seen & (gap <= follow_up)
+    delta = (np.bincount(gap[counted].astype(np.int64), minlength=max_days + 2)
+             - np.bincount(follow_up[counted] + 1, minlength=max_days + 2))
+    readmitted = np.cumsum(delta)[:max_days + 1]
+    at_risk = np.cumsum(np.bincount(follow_up, minlength=max_days + 1)[::-1])[::-1]
+    return pd.DataFrame({
+        'Days': np.arange(max_days + 1),
+        'Readmissions': readmits,
+        'At_risk': at_risk,
+        'Readmitted_share': np.divide(readmitted, at_risk, out=np.full(max_days + 1, np.nan), where=at_risk > 0)
+    })
+
+
+def retention_matrix(admissions, periods=12):
+    # patients by month of their first admission (cohort) x months since it: share of the
+    # cohort with at least one admission in that month
+    patient = pd.factorize(admissions['Patient_ID'])[0].astype('int64')
+    month = pd.to_datetime(admissions['Admission_date']).to_numpy().astype('datetime64[M]').astype('int64')
+    first = np.full(patient.max() + 1 if len(patient) else 0, np.iinfo(np.int64).max)
+    np.minimum.at(first, patient, month)
+    offset = month - first[patient]
+    keep = offset < periods
+
+    # one count per (patient, offset): unique keys, then counts per (cohort, offset)
+    key = np.unique(patient[keep] * periods + offset[keep])
+    cohorts, cohort_code = np.unique(first[key // periods], return_inverse=True)
+    counts = np.zeros((len(cohorts), periods), dtype=np.int64)
+    np.add.at(counts, (cohort_code, key % periods), 1)
+    sizes = counts[:, 0]
+
+    index = pd.PeriodIndex(cohorts.astype('datetime64[M]'), freq='M', name='Cohort')
+    retention = pd.DataFrame(counts / np.maximum(sizes, 1)[:, None], index=index,
+                             columns=pd.Index(np.arange(periods), name='Months_since_first'))
+    # months after the end of the data are not observed yet
+    last = month.max() if len(month) else 0
+    observed = (last - cohorts)[:, None] >= np.arange(periods)[None, :]
+    return retention.where(observed), pd.Series(sizes, index=retention.index, name='Patients')
+
+
+def readmission_summary(links, flag=None):
+    # derived 30-day readmission figures, next to the generated flag when given
+    gap = links['Days_to_next_admission']
+    chains = np.bincount(links['Chain_ID'].to_numpy())
+    summary = {
+        'admissions': int(len(links)),
+        'readmission_rate': float(links['Readmitted'].mean() * 100) if len(links) else 0.0,
+        'median_days_to_readmit': float(gap[links['Readmitted']].median()) if links['Readmitted'].any() else np.nan,
+        'chains_with_readmission': int((chains > 1).sum()),
+        'longest_chain': int(chains.max()) if len(chains) else 0
+    }
+    if flag is not None:
+        flag = np.asarray(flag).astype(bool)
+        summary['flag_rate'] = float(flag.mean() * 100) if len(flag) else 0.0
+        summary['flag_agreement'] = float((flag == links['Readmitted'].to_numpy()).mean() * 100) if len(flag) else 0.0
+    return summary
@@ -0,0 +1,25 @@
+import importlib
+
+# Dashboard pages, one module each with a render(ctx) function. A page module (and the
+# plotting and analysis libraries it imports) is loaded the first time its page is shown,
+# so a cold start only pays for the app shell and the page being opened.
+
+PAGES = {
+    "Home Overview": "home",
+    "Network Overview": "network",
+    "Patient Analytics": "patients",
+    "Department Performance": "departments",
+    "Financial Insights": "financial",
+    "Doctor Workload": "doctors",
+    "Critical Alerts": "alerts",
+    "Readmission Cohorts": "cohorts",
+    "Data Drift": "drift"
+}
+
+
+def page_module(page):
+    return importlib.import_module(f"{__name__}.{PAGES[page]}")
+
+
+def render_page(page, ctx):
+    page_module(page).render(ctx)
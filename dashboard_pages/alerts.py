@@ -0,0 +1,255 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from batch_scoring import scores_mtime
+from paginated_table import paginated_table
+from .common import risk_model, load_risk_scores, load_risk_explanations
+
+# Critical Alerts: high-risk patients from the calibrated model (or the rule-based list) and
+# the factors behind each alert.
+
+
+def render(ctx):
+    data_handle, df, chart_df, rerun_timer = ctx.data_handle, ctx.df, ctx.chart_df, ctx.rerun_timer
+    show_chart, show_table, approximation_note = ctx.show_chart, ctx.show_table, ctx.approximation_note
+    
+    st.markdown("<h1> Critical Alerts & Risk Assessment</h1>", unsafe_allow_html=True)
+    
+    st.info(" This page identifies patients and scenarios requiring immediate attention")
+    
+    # Risk Thresholds
+    st.markdown("###  Set Alert Thresholds")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        los_threshold = st.slider("High LOS Threshold (days)", 1, 20, 7)
+    
+    with col2:
+        age_threshold = st.slider("High-Risk Age (years)", 40, 90, 65)
+    
+    with col3:
+        chronic_threshold = st.slider("Chronic Conditions Threshold", 0, 4, 2)
+    
+    # Identify Critical Cases - calibrated model risk at the persisted operating threshold when a model is trained
+    bundle = risk_model()
+    if bundle is not None:
+        scores = load_risk_scores(data_handle.version, bundle['version'], scores_mtime())
+        positions = pd.Index(scores['Admission_ID']).get_indexer(df['Admission_ID'])
+        df = df.assign(Risk_probability=np.where(
+            positions >= 0, scores['Risk_probability'].to_numpy()[positions], np.nan
+        ))
+        operating_point = bundle['threshold']
+        high_risk = df[df['Risk_probability'] >= operating_point['Threshold']].copy()
+        high_risk['Risk_Score'] = high_risk['Risk_probability'] * 100
+        alert_days = max(df['Admission_date'].dt.normalize().nunique(), 1)
+        st.caption(
+            f"Model: {bundle['model_name'].upper()} v{bundle['version']} - alert threshold "
+            f"{operating_point['Threshold']:.1%} risk (precision {operating_point['Precision']:.0%}, "
+            f"recall {operating_point['Recall']:.0%}) - {len(high_risk) / alert_days:.1f} alerts per day"
+        )
+    else:
+        st.caption("No trained model found - run readmission_predicton.py to score patients. "
+                   "Showing the rule-based risk list.")
+        high_risk = df[
+            ((df['Length_of_stay'] > los_threshold) |
+             (df['Age'] > age_threshold) |
+             (df['Chronic_conditions'] >= chronic_threshold)) &
+            (df['readmitted_30_days'] == 1)
+        ].copy()
+    
+    high_los = df[df['Length_of_stay'] > los_threshold].copy()
+    elderly_patients = df[df['Age'] > age_threshold].copy()
+    icu_patients = df[df['Bed_type'] == 'ICU'].copy()
+    rerun_timer.lap('filter')
+    
+    # Alert Metrics
+    st.markdown("---")
+    st.markdown("###  Critical Alerts Overview")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>⚠️ High-Risk Patients</h4>
+                <p style='font-size: 32px; font-weight: bold; margin: 10px 0;'>{len(high_risk):,}</p>
+                <p style='margin: 0;'>Requires immediate attention</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>⏱️ Extended Stay</h4>
+                <p style='font-size: 32px; font-weight: bold; margin: 10px 0;'>{len(high_los):,}</p>
+                <p style='margin: 0;'>LOS > {los_threshold} days</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #ff9a56 0%, #ff6a00 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>👴 Elderly Patients</h4>
+                <p style='font-size: 32px; font-weight: bold; margin: 10px 0;'>{len(elderly_patients):,}</p>
+                <p style='margin: 0;'>Age > {age_threshold} years</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #ff6a00 0%, #ee0979 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>🏥 ICU Patients</h4>
+                <p style='font-size: 32px; font-weight: bold; margin: 10px 0;'>{len(icu_patients):,}</p>
+                <p style='margin: 0;'>Critical care monitoring</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    # Visual Analysis
+    st.markdown("---")
+    st.markdown("###  Risk Distribution Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Readmission risk by department
+        dept_readmit = df.groupby('Department')['readmitted_30_days'].agg(['sum', 'count']).reset_index()
+        dept_readmit['rate'] = (dept_readmit['sum'] / dept_readmit['count']) * 100
+        dept_readmit = dept_readmit.sort_values('rate', ascending=True)
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                y=dept_readmit['Department'],
+                x=dept_readmit['rate'],
+                orientation='h',
+                marker=dict(
+                    color=dept_readmit['rate'],
+                    colorscale='Reds',
+                    showscale=True,
+                    colorbar=dict(title="Rate %"),
+                    line=dict(color='#2c3e50', width=1)
+                ),
+                text=[f"{x:.1f}%" for x in dept_readmit['rate']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Readmission Rate by Department",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=450,
+            xaxis_title="Readmission Rate (%)",
+            yaxis_title="Department",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=False)
+        )
+        show_chart(fig)
+    
+    with col2:
+        # LOS vs Readmission
+        rerun_timer.lap('aggregate')
+        fig = go.Figure()
+        
+        for status in [0, 1]:
+            data = chart_df[chart_df['readmitted_30_days'] == status]
+            fig.add_trace(go.Box(
+                y=data['Length_of_stay'],
+                name='Readmitted' if status == 1 else 'Not Readmitted',
+                marker=dict(color='#e74c3c' if status == 1 else '#27ae60'),
+                boxmean='sd'
+            ))
+        
+        fig.update_layout(
+            title="Length of Stay: Readmitted vs Not Readmitted",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=450,
+            yaxis_title="Length of Stay (days)",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+        approximation_note()
+    
+    # High-Risk Patient Table
+    st.markdown("---")
+    st.markdown("### 📋 High-Risk Patient List")
+    
+    if len(high_risk) > 0:
+        if bundle is None:
+            # Calculate risk score
+            high_risk['Risk_Score'] = (
+                high_risk['Length_of_stay'] * 0.3 +
+                high_risk['Age'] * 0.2 +
+                high_risk['Chronic_conditions'] * 5 +
+                high_risk['readmitted_30_days'] * 10
+            )
+        
+        display_cols = ['Patient_ID', 'Age', 'Gender', 'Department', 'Bed_type',
+                       'Length_of_stay', 'Chronic_conditions', 'Risk_Score']
+        if bundle is not None:
+            explanations = load_risk_explanations(data_handle.version, bundle['version'], scores_mtime())
+            high_risk = high_risk.merge(explanations, on='Admission_ID', how='left')
+            display_cols.append('Top_factors')
+        
+        # full cohort, sorted and sliced server-side - only the visible page is styled
+        paginated_table(
+            high_risk[display_cols],
+            key="high_risk",
+            default_sort='Risk_Score',
+            gradients={'Risk_Score': 'Reds', 'Length_of_stay': 'Oranges'},
+            formats={'Risk_Score': '{:.2f}'},
+            search_cols=['Patient_ID', 'Department', 'Gender', 'Bed_type'],
+            render=show_table
+        )
+        
+        # Download button - the CSV of the full cohort is only built when the download is requested
+        cohort = high_risk[display_cols]
+        st.download_button(
+            label=" Download High-Risk Patient Report",
+            data=lambda: cohort.to_csv(index=False),
+            file_name=f"high_risk_patients_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+            mime="text/csv"
+        )
+    else:
+        st.success(" No high-risk patients identified with current thresholds!")
+    
+    # Recommendations
+    st.markdown("---")
+    st.markdown("### 💡 Automated Recommendations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+            <div class='info-card'>
+                <h4> Priority Actions</h4>
+                <ul>
+                    <li>Review all ICU patients daily</li>
+                    <li>Follow up with patients having LOS > 7 days</li>
+                    <li>Monitor elderly patients with chronic conditions</li>
+                    <li>Implement discharge planning for high-risk patients</li>
+                </ul>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        busiest_dept = df.groupby('Department')['readmitted_30_days'].sum().idxmax()
+        highest_readmit = df.groupby('Department')['readmitted_30_days'].mean().max() * 100
+        
+        st.markdown(f"""
+            <div class='info-card'>
+                <h4>📈 Key Findings</h4>
+                <ul>
+                    <li><strong>{busiest_dept}</strong> has the highest readmissions</li>
+                    <li>Readmission rate: <strong>{highest_readmit:.1f}%</strong></li>
+                    <li>ICU utilization: <strong>{(len(icu_patients)/len(df)*100):.1f}%</strong></li>
+                    <li>High-risk patients: <strong>{len(high_risk)}</strong></li>
+                </ul>
+            </div>
+        """, unsafe_allow_html=True)
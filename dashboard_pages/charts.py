@@ -0,0 +1,35 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from sampling import is_sample, weighted_histogram, WEIGHT_COLUMN
+
+# Plotly helpers shared by several pages, imported with the first page that draws them.
+
+
+def histogram_trace(data, column, nbins, marker, **kwargs):
+    # exact histogram, or weighted estimates with 95% error bars when data is an approximate sample
+    if not is_sample(data):
+        return go.Histogram(x=data[column], nbinsx=nbins, marker=marker, **kwargs)
+    edges, estimate, lower, upper = weighted_histogram(data[column], data[WEIGHT_COLUMN], nbins)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=estimate, width=np.diff(edges), marker=marker,
+        error_y=dict(type='data', symmetric=False, array=upper - estimate, arrayminus=estimate - lower,
+                     color='#7f8c8d'),
+        **kwargs
+    )
+
+
+def forecast_band(fig, forecasts, name, color, fill):
+    # forecast line with its 95% band; summed departments combine their margins in quadrature
+    daily = forecasts.assign(Margin=(forecasts['Upper'] - forecasts['Forecast']) ** 2).groupby('Date')[
+        ['Forecast', 'Margin']].sum()
+    margin = np.sqrt(daily['Margin'])
+    fig.add_trace(go.Scatter(
+        x=np.r_[daily.index, daily.index[::-1]],
+        y=np.r_[daily['Forecast'] + margin, np.maximum(daily['Forecast'] - margin, 0)[::-1]],
+        fill='toself', fillcolor=fill, line=dict(width=0), hoverinfo='skip', name='95% interval'
+    ))
+    fig.add_trace(go.Scatter(
+        x=daily.index, y=daily['Forecast'], mode='lines', name=name, line=dict(color=color, width=3, dash='dash')
+    ))
+    return daily
@@ -0,0 +1,131 @@
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import streamlit as st
+
+from cohort_analysis import READMIT_WINDOW
+from .common import load_readmission_cohorts
+
+# Readmission Cohorts: derived readmission rate, time to readmission, chains and cohort retention.
+
+
+def render(ctx):
+    selected_facility, data_handle, rerun_timer = ctx.selected_facility, ctx.data_handle, ctx.rerun_timer
+    show_chart = ctx.show_chart
+    
+    st.markdown("<h1> Readmission Cohorts</h1>", unsafe_allow_html=True)
+    
+    st.info(f" Readmissions derived by linking every stay to the same patient's next admission "
+            f"(next admission within {READMIT_WINDOW} days of discharge)")
+    
+    cohorts = load_readmission_cohorts(selected_facility, data_handle.version)
+    summary = cohorts['summary']
+    rerun_timer.lap('aggregate')
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        flag_delta = (f"{summary['readmission_rate'] - summary['flag_rate']:+.1f} pts vs flag"
+                      if 'flag_rate' in summary else None)
+        st.metric("Derived Readmission Rate", f"{summary['readmission_rate']:.1f}%", delta=flag_delta,
+                  delta_color="off", help="Share of stays followed by another admission within the window")
+    
+    with col2:
+        median_days = summary['median_days_to_readmit']
+        st.metric("Median Days to Readmit", "-" if np.isnan(median_days) else f"{median_days:.0f} days")
+    
+    with col3:
+        st.metric("Chains with Readmissions", f"{summary['chains_with_readmission']:,}")
+    
+    with col4:
+        st.metric("Longest Chain", f"{summary['longest_chain']} stays")
+    
+    if 'flag_agreement' in summary:
+        st.caption(f"The generated readmitted_30_days flag ({summary['flag_rate']:.1f}%) agrees with the "
+                   f"derived readmissions on {summary['flag_agreement']:.1f}% of stays.")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Time to Readmission")
+        ttr = cohorts['time_to_readmit']
+        max_days = st.slider("Days after discharge", 30, len(ttr) - 1, 90)
+        ttr = ttr[ttr['Days'] <= max_days]
+        
+        rerun_timer.lap('aggregate')
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_trace(go.Bar(x=ttr['Days'], y=ttr['Readmissions'], name='Next admissions',
+                             marker=dict(color='#3498db')), secondary_y=False)
+        fig.add_trace(go.Scatter(x=ttr['Days'], y=ttr['Readmitted_share'] * 100, name='Readmitted by day (%)',
+                                 line=dict(color='#e74c3c', width=3)), secondary_y=True)
+        fig.add_vline(x=READMIT_WINDOW, line_dash="dash", line_color="#7f8c8d")
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Days from discharge to next admission",
+            legend=dict(orientation='h', y=1.1),
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        fig.update_yaxes(title_text="Admissions", secondary_y=False)
+        fig.update_yaxes(title_text="Readmitted (%)", secondary_y=True)
+        show_chart(fig)
+        st.caption("The cumulative share only counts discharges followed up for at least that many days.")
+    
+    with col2:
+        st.markdown("###  Readmission Chains")
+        chains = cohorts['chains']
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=chains['Chain_length'].astype(str),
+                y=chains['Chains'],
+                marker=dict(color='#9b59b6', line=dict(color='#2c3e50', width=1)),
+                text=chains['Chains'],
+                textposition='outside',
+                hovertemplate='<b>%{x} stays</b><br>Chains: %{y}<extra></extra>'
+            )
+        ])
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Stays per chain (1 = no readmission)",
+            yaxis_title="Chains",
+            yaxis_type='log',
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    st.markdown("---")
+    st.markdown("###  Monthly Cohort Retention")
+    
+    retention = cohorts['retention']
+    rerun_timer.lap('aggregate')
+    fig = go.Figure(data=go.Heatmap(
+        z=retention.to_numpy() * 100,
+        x=[f"+{m}" for m in retention.columns],
+        y=retention.index.astype(str),
+        colorscale='Blues',
+        zmin=0,
+        zmax=max(float(np.nanmax(retention.iloc[:, 1:].to_numpy(), initial=0)) * 100, 1),
+        text=np.round(retention.to_numpy() * 100, 1),
+        texttemplate='%{text}',
+        customdata=np.repeat(cohorts['cohort_sizes'].to_numpy()[:, None], retention.shape[1], axis=1),
+        hovertemplate='Cohort %{y}, month %{x}<br>%{z:.1f}% of %{customdata} patients<extra></extra>'
+    ))
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=450,
+        xaxis_title="Months since first admission",
+        yaxis_title="First admission month",
+        yaxis=dict(autorange='reversed')
+    )
+    show_chart(fig)
+    st.caption("Share of each month's new patients admitted again N months later; month +0 is always 100%.")
@@ -0,0 +1,288 @@
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from cache_warmer import CacheWarmer
+from data_handle import DataHandle
+from patient_sketch import PatientSketches
+from profiling import TimingRegistry
+from sampling import SAMPLE_SIZE, stratified_sample, is_sample, sample_note
+
+# State shared by the dashboard shell and the page modules: the cached loaders, the
+# background warm-up and the per-rerun page context. The analysis modules (model,
+# forecasting, cohorts, cube, ...) are imported inside the loaders that use them, so
+# the shell starts without them and a page only pays for what it shows.
+
+# Columns of the merged frame each page reads - only these are loaded and cached
+PAGE_COLUMNS = {
+    "Home Overview": [],
+    "Network Overview": [],
+    "Patient Analytics": ['Admission_ID', 'Patient_ID', 'Department', 'Length_of_stay', 'readmitted_30_days',
+                          'Age', 'Gender', 'Chronic_conditions', 'Admission_type'],
+    "Department Performance": ['Admission_ID', 'Patient_ID', 'Department', 'Bed_type', 'Length_of_stay',
+                               'readmitted_30_days', 'Total_charges', 'Chronic_conditions'],
+    "Financial Insights": ['Department', 'Total_charges'],
+    "Doctor Workload": [],
+    "Data Drift": [],
+    "Readmission Cohorts": [],
+    "Critical Alerts": ['Admission_ID', 'Patient_ID', 'Admission_date', 'Age', 'Gender', 'Department',
+                        'Bed_type', 'Length_of_stay', 'Chronic_conditions', 'readmitted_30_days']
+}
+
+
+@st.cache_resource
+def get_timing_registry():
+    return TimingRegistry()
+
+
+# Lazy data handle - memory-mapped Arrow columns shared with every other server process
+@st.cache_resource
+def get_data_handle(facility=None):
+    try:
+        return DataHandle(facility=facility)
+
+    except FileNotFoundError:
+        st.error(" Data files not found! Please run the data generation script first.")
+        st.stop()
+
+
+def load_page_data(handle, page):
+    return handle.merged(PAGE_COLUMNS.get(page, []), page=page)
+
+
+# Network-wide partial aggregates, computed per facility on worker threads
+@st.cache_data
+def load_network_aggregates(version=None):
+    from facility_aggregation import network_aggregates
+    return network_aggregates()
+
+
+# Mergeable unique-patient sketches, shared read-only across reruns
+@st.cache_resource
+def load_patient_sketches(facility=None, version=None):
+    df = get_data_handle(facility).merged(
+        ['Patient_ID', 'Department', 'Admission_date', 'Gender', 'Admission_type', 'Age']
+    )
+    return {
+        'daily': PatientSketches.build(
+            df.assign(Admission_day=df['Admission_date'].dt.normalize()),
+            ['Department', 'Admission_day']
+        ),
+        'demographic': PatientSketches.build(df, ['Department', 'Gender', 'Admission_type', 'Age'])
+    }
+
+
+# Doctor workload derived from the admissions each doctor handled
+@st.cache_data
+def load_doctor_workload(facility=None, version=None):
+    from doctor_workload import daily_doctor_load, doctor_workload_summary, department_daily_load
+    handle = get_data_handle(facility)
+    admissions = handle.table('admissions', ['Doctor_ID', 'Admission_date', 'Discharge_date'], page="Doctor Workload")
+    doctors = handle.table('doctors', page="Doctor Workload")
+    daily_load = daily_doctor_load(admissions, doctors)
+    return daily_load, doctor_workload_summary(daily_load, doctors), department_daily_load(daily_load, doctors)
+
+
+def model_mtime():
+    from readmission_model import bundle_path
+    path = bundle_path()
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+# Trained readmission model bundle, reloaded when the file is rewritten
+@st.cache_resource
+def load_risk_model(modified=None):
+    from readmission_model import load_bundle
+    return load_bundle()
+
+
+def risk_model():
+    modified = model_mtime()
+    return load_risk_model(modified) if modified is not None else None
+
+
+# Calibrated readmission risk for every admission of the network, from the nightly batch scores when present
+@st.cache_data
+def load_risk_scores(version=None, model_version=None, scores_modified=None):
+    from batch_scoring import current_scores
+    from readmission_model import SCORING_COLUMNS
+    return current_scores(risk_model(), get_data_handle().merged(SCORING_COLUMNS))
+
+
+# Top contributing factors of every flagged admission, computed in one batch per data and model version
+@st.cache_data
+def load_risk_explanations(version=None, model_version=None, scores_modified=None):
+    from explanations import explain, top_factors
+    from readmission_model import SCORING_COLUMNS, encode_features
+    bundle = risk_model()
+    scores = load_risk_scores(version, model_version, scores_modified)
+    flagged = (scores['Risk_probability'] >= bundle['threshold']['Threshold']).to_numpy()
+    data = get_data_handle().merged(SCORING_COLUMNS)
+    # history features need every stay of a patient, so encode the network and keep the flagged rows
+    contributions, _ = explain(bundle, encode_features(data)[flagged])
+    return pd.DataFrame({
+        'Admission_ID': data['Admission_ID'].to_numpy()[flagged],
+        'Top_factors': top_factors(contributions).to_numpy()
+    })
+
+
+# Stratified sample of a page's columns for the distributional charts in approximate mode
+@st.cache_data
+def load_page_sample(facility=None, version=None, page=None, size=SAMPLE_SIZE):
+    return stratified_sample(load_page_data(get_data_handle(facility), page), size)
+
+
+# Financial partials (month x department x bed type x payer x claim status, integer cents) behind every
+# Financial Insights figure, cached per facility and data version
+@st.cache_data
+def load_financial_partials(facility=None, version=None):
+    from financial_engine import FINANCIAL_COLUMNS, financial_partials
+    return financial_partials(get_data_handle(facility).merged(FINANCIAL_COLUMNS, page="Financial Insights"))
+
+
+# Department admission and occupancy forecasts; stored fits are only rolled forward over new days
+@st.cache_data
+def load_forecasts(facility=None, version=None):
+    from forecasting import update_forecasts, forecast_frame, history_frame
+    df = get_data_handle(facility).merged(['Department', 'Admission_date', 'Discharge_date'])
+    models, series = update_forecasts(df, facility=facility)
+    return forecast_frame(models, series), history_frame(series)
+
+
+# Admissions linked to the same patient's next stay over the whole network,
+# so a readmission at another facility still counts
+@st.cache_data
+def load_readmission_links(version=None):
+    from cohort_analysis import COHORT_COLUMNS, link_admissions
+    handle = get_data_handle()
+    extra = [c for c in ['Facility_ID', 'readmitted_30_days'] if c in handle.schema('merged')]
+    data = handle.merged(COHORT_COLUMNS + extra, page="Readmission Cohorts")
+    return link_admissions(data).assign(**{c: data[c].to_numpy() for c in ['Patient_ID', 'Admission_date'] + extra})
+
+
+# Derived readmission metrics for the admissions of one facility (or the network)
+@st.cache_data
+def load_readmission_cohorts(facility=None, version=None):
+    from cohort_analysis import chain_lengths, time_to_readmit, retention_matrix, readmission_summary
+    links = load_readmission_links(version)
+    if facility is not None and 'Facility_ID' in links.columns:
+        links = links[links['Facility_ID'] == facility]
+    retention, cohort_sizes = retention_matrix(links)
+    return {
+        'summary': readmission_summary(links, links.get('readmitted_30_days')),
+        'chains': chain_lengths(links),
+        'time_to_readmit': time_to_readmit(links),
+        'retention': retention,
+        'cohort_sizes': cohort_sizes
+    }
+
+
+# facility -> (generation, cube) of the newest cube, the base for the next generation's
+@st.cache_resource
+def _latest_cubes():
+    return {}
+
+
+# Pre-aggregated cube behind the cross-filtered Home Overview charts, shared read-only across sessions.
+# When a new generation only appended admissions, just those are added to the previous cube
+@st.cache_resource
+def load_aggregate_cube(facility=None, version=None):
+    from aggregate_cube import AggregateCube, CUBE_COLUMNS
+    handle = get_data_handle(facility)
+    generation = handle.version
+    latest = _latest_cubes()
+    previous = latest.get(facility)
+    start = handle.appended_since(previous[0]) if previous is not None else None
+    df = handle.merged(CUBE_COLUMNS, page="Home Overview")
+    if start is None or handle.version != generation:
+        cube = AggregateCube.build(df)
+    else:
+        cube = previous[1].add_rows(df.iloc[start:])
+    latest[facility] = (handle.version, cube)
+    return cube
+
+
+# Drift monitor state (written on every ingest), reloaded when the file changes
+@st.cache_data
+def load_drift(modified=None):
+    from drift_monitor import load_state
+    return load_state()
+
+
+# Background warm-up: every page's cached results are computed right after (re)loading the data
+@st.cache_resource
+def get_cache_warmer():
+    return CacheWarmer()
+
+
+# warm-up tasks each page waits for before rendering
+PAGE_WARMUP = {
+    "Home Overview": ['cube', 'forecasts'],
+    "Department Performance": ['forecasts'],
+    "Network Overview": ['network'],
+    "Financial Insights": ['financials'],
+    "Doctor Workload": ['doctor_workload'],
+    "Critical Alerts": ['risk'],
+    "Readmission Cohorts": ['cohorts']
+}
+
+
+def warmup_tasks(facility, handle, model_modified):
+    ctx = get_script_run_ctx()
+
+    def task(fn, *args):
+        def run():
+            # the session context keeps Streamlit from warning about the worker thread
+            add_script_run_ctx(threading.current_thread(), ctx)
+            fn(*args)
+        return run
+
+    def risk():
+        # the model bundle (and scikit-learn) is loaded here, off the first rerun
+        from batch_scoring import scores_mtime
+        load_risk_explanations(handle.version, risk_model()['version'], scores_mtime())
+
+    tasks = {'financials': task(load_financial_partials, facility, handle.version)}
+    tasks['network'] = task(load_network_aggregates, handle.version)
+    tasks['cube'] = task(load_aggregate_cube, facility, handle.version)
+    tasks['forecasts'] = task(load_forecasts, facility, handle.version)
+    tasks['cohorts'] = task(load_readmission_cohorts, facility, handle.version)
+    if 'Doctor_ID' in handle.schema('admissions'):
+        tasks['doctor_workload'] = task(load_doctor_workload, facility, handle.version)
+    if model_modified is not None:
+        tasks['risk'] = task(risk)
+    return tasks
+
+
+class PageContext:
+    # per-rerun state handed to a page module: the selected facility, its data and the lap timer
+    def __init__(self, menu, selected_facility, data_handle, patient_sketches, df, chart_df, rerun_timer):
+        self.menu = menu
+        self.selected_facility = selected_facility
+        self.data_handle = data_handle
+        self.patient_sketches = patient_sketches
+        self.df = df
+        self.chart_df = chart_df
+        self.rerun_timer = rerun_timer
+
+    def show_chart(self, fig, key=None):
+        self.rerun_timer.lap('figure')
+        if key is None:
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            # selections rerun the script and are read back by the page's cross filters
+            st.plotly_chart(fig, use_container_width=True, key=key, on_select="rerun", selection_mode=('points', 'box'))
+        self.rerun_timer.lap('render')
+
+    def show_table(self, data, **kwargs):
+        # Styler work happens inside st.dataframe, so it is booked as render
+        self.rerun_timer.lap('aggregate')
+        st.dataframe(data, **kwargs)
+        self.rerun_timer.lap('render')
+
+    def approximation_note(self):
+        if is_sample(self.chart_df) and len(self.chart_df) < len(self.df):
+            st.caption(sample_note(self.chart_df, len(self.df)))
@@ -0,0 +1,237 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from forecasting import HORIZON, TOTAL
+from .charts import forecast_band
+from .common import load_forecasts
+
+# Department Performance: per-department metrics and charts with the 14-day admission and
+# occupancy forecasts.
+
+
+def render(ctx):
+    selected_facility, data_handle = ctx.selected_facility, ctx.data_handle
+    patient_sketches, df, rerun_timer = ctx.patient_sketches, ctx.df, ctx.rerun_timer
+    show_chart, show_table = ctx.show_chart, ctx.show_table
+    
+    st.markdown("<h1> Department Performance Dashboard</h1>", unsafe_allow_html=True)
+    
+    # Department selector
+    selected_dept = st.selectbox(
+        "Select Department for Detailed Analysis",
+        options=['All Departments'] + list(df['Department'].unique())
+    )
+    
+    if selected_dept == 'All Departments':
+        dept_df = df.copy()
+    else:
+        dept_df = df[df['Department'] == selected_dept].copy()
+    rerun_timer.lap('filter')
+    
+    st.markdown("---")
+    
+    # Department Metrics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("Total Admissions", f"{len(dept_df):,}")
+    
+    with col2:
+        unique_patients = patient_sketches['daily'].count(
+            Department=None if selected_dept == 'All Departments' else selected_dept
+        )
+        st.metric("Unique Patients", f"{unique_patients:,}")
+    
+    with col3:
+        st.metric("Avg LOS", f"{dept_df['Length_of_stay'].mean():.1f} days")
+    
+    with col4:
+        # an empty facility shows 0% rather than failing
+        readmit_rate = (dept_df['readmitted_30_days'].sum() / max(len(dept_df), 1)) * 100
+        st.metric("Readmission Rate", f"{readmit_rate:.1f}%")
+    
+    with col5:
+        revenue = dept_df['Total_charges'].sum()
+        st.metric("Total Revenue", f"${revenue/1000:.0f}K")
+    
+    st.markdown("---")
+    
+    # Staffing forecast for the selected department
+    st.markdown(f"###  {HORIZON}-Day Forecast")
+    forecasts, forecast_history = load_forecasts(selected_facility, data_handle.version)
+    forecast_dept = TOTAL if selected_dept == 'All Departments' else selected_dept
+    
+    col1, col2 = st.columns(2)
+    for column, measure, title, unit in [(col1, 'Admissions', "Daily Admissions", "admissions"),
+                                         (col2, 'Occupancy', "Patients in House", "patients")]:
+        with column:
+            actual = forecast_history[(forecast_history['Department'] == forecast_dept) &
+                                      (forecast_history['Measure'] == measure)]
+            predicted = forecasts[(forecasts['Department'] == forecast_dept) & (forecasts['Measure'] == measure)]
+            
+            rerun_timer.lap('aggregate')
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=actual['Date'], y=actual['Actual'], mode='lines', name='Actual',
+                                     line=dict(color='#3498db', width=2)))
+            daily = forecast_band(fig, predicted, 'Forecast', '#e67e22', 'rgba(230, 126, 34, 0.15)')
+            fig.update_layout(
+                title=title,
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                hovermode='x unified',
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=20),
+                legend=dict(orientation='h', y=-0.2),
+                xaxis=dict(showgrid=False),
+                yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+            )
+            show_chart(fig)
+            if daily.empty:
+                st.caption("No admissions to forecast from")
+            elif measure == 'Admissions':
+                st.caption(f"{daily['Forecast'].sum():,.0f} {unit} expected over the next {HORIZON} days")
+            else:
+                st.caption(f"Peak {daily['Forecast'].max():,.1f} {unit} on {daily['Forecast'].idxmax():%a %d %b}")
+    
+    st.markdown("---")
+    
+    # Department Comparison
+    st.markdown("###  Department Comparison")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        dept_stats = df.groupby('Department').agg({
+            'Admission_ID': 'count',
+            'Length_of_stay': 'mean',
+            'readmitted_30_days': 'sum'
+        }).reset_index()
+        dept_stats.columns = ['Department', 'Admissions', 'Avg_LOS', 'Readmissions']
+        dept_stats = dept_stats.sort_values('Admissions', ascending=True)
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                y=dept_stats['Department'],
+                x=dept_stats['Admissions'],
+                orientation='h',
+                marker=dict(
+                    color=dept_stats['Admissions'],
+                    colorscale='Blues',
+                    showscale=True,
+                    line=dict(color='#2c3e50', width=1)
+                ),
+                text=dept_stats['Admissions'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Admissions by Department",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=500,
+            xaxis_title="Number of Admissions",
+            yaxis_title="Department",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=False)
+        )
+        show_chart(fig)
+    
+    with col2:
+        dept_los = df.groupby('Department')['Length_of_stay'].mean().sort_values(ascending=True).reset_index()
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                y=dept_los['Department'],
+                x=dept_los['Length_of_stay'],
+                orientation='h',
+                marker=dict(
+                    color=dept_los['Length_of_stay'],
+                    colorscale='Reds',
+                    showscale=True,
+                    line=dict(color='#2c3e50', width=1)
+                ),
+                text=[f"{x:.1f}" for x in dept_los['Length_of_stay']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Average Length of Stay by Department",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=500,
+            xaxis_title="Days",
+            yaxis_title="Department",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=False)
+        )
+        show_chart(fig)
+    
+    # Bed Type by Department
+    st.markdown("---")
+    st.markdown("### 🛏️ Bed Type Distribution by Department")
+    
+    bed_dept = pd.crosstab(df['Department'], df['Bed_type'], normalize='index') * 100
+    
+    rerun_timer.lap('aggregate')
+    fig = go.Figure()
+    
+    for bed_type in bed_dept.columns:
+        fig.add_trace(go.Bar(
+            name=bed_type,
+            x=bed_dept.index,
+            y=bed_dept[bed_type],
+            text=[f"{x:.1f}%" for x in bed_dept[bed_type]],
+            textposition='inside'
+        ))
+    
+    fig.update_layout(
+        barmode='stack',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=400,
+        xaxis_title="Department",
+        yaxis_title="Percentage (%)",
+        legend_title="Bed Type",
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+    )
+    show_chart(fig)
+    
+    # Department Performance Table
+    st.markdown("---")
+    st.markdown("### 📋 Detailed Department Statistics")
+    
+    dept_detailed = df.groupby('Department').agg({
+        'Admission_ID': 'count',
+        'Length_of_stay': 'mean',
+        'readmitted_30_days': lambda x: (x.sum() / len(x)) * 100,
+        'Total_charges': ['sum', 'mean'],
+        'Chronic_conditions': 'mean'
+    }).round(2)
+    dept_detailed.insert(1, 'Unique Patients', patient_sketches['daily'].count_by('Department'))
+    
+    dept_detailed.columns = ['Total Admissions', 'Unique Patients', 'Avg LOS (days)', 
+                             'Readmission Rate (%)', 'Total Revenue', 'Avg Revenue', 
+                             'Avg Chronic Conditions']
+    
+    dept_detailed = dept_detailed.sort_values('Total Admissions', ascending=False)
+    
+    show_table(
+        dept_detailed.style.background_gradient(subset=['Total Admissions'], cmap='Blues')
+        .background_gradient(subset=['Readmission Rate (%)'], cmap='Reds')
+        .background_gradient(subset=['Total Revenue'], cmap='Greens')
+        .format({
+            'Avg LOS (days)': '{:.1f}',
+            'Readmission Rate (%)': '{:.2f}%',
+            'Total Revenue': '${:,.0f}',
+            'Avg Revenue': '${:,.0f}',
+            'Avg Chronic Conditions': '{:.2f}'
+        }),
+        use_container_width=True,
+        height=400
+    )
@@ -0,0 +1,250 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from paginated_table import paginated_table
+from .common import load_doctor_workload
+
+# Doctor Workload: daily load per doctor and department derived from the admissions.
+
+
+def render(ctx):
+    menu, selected_facility, data_handle = ctx.menu, ctx.selected_facility, ctx.data_handle
+    rerun_timer, show_chart, show_table = ctx.rerun_timer, ctx.show_chart, ctx.show_table
+    
+    st.markdown("<h1> Doctor Workload Analysis</h1>", unsafe_allow_html=True)
+    
+    if 'Doctor_ID' in data_handle.schema('admissions'):
+        _, doctor_stats, dept_daily_load = load_doctor_workload(selected_facility, data_handle.version)
+    else:
+        st.warning("Admissions are not linked to doctors - showing the static doctors.csv counters. "
+                   "Re-run the data generation script to enable derived workload.")
+        doctor_stats, dept_daily_load = data_handle.table('doctors', page=menu), None
+    
+    # Doctor Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Doctors", f"{len(doctor_stats):,}")
+    
+    with col2:
+        avg_patients = doctor_stats['Patients_handled'].mean()
+        st.metric("Avg Patients/Doctor", f"{avg_patients:.0f}")
+    
+    with col3:
+        avg_consult = doctor_stats['Avg_consult_time'].mean()
+        st.metric("Avg Consult Time", f"{avg_consult:.0f} min")
+    
+    with col4:
+        max_workload = doctor_stats['Patients_handled'].max()
+        st.metric("Max Workload", f"{max_workload} patients")
+    
+    st.markdown("---")
+    
+    # Workload Distribution
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Doctor Workload Distribution")
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Histogram(
+                x=doctor_stats['Patients_handled'],
+                nbinsx=25,
+                marker=dict(
+                    color='#3498db',
+                    line=dict(color='#2c3e50', width=1)
+                )
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Patients Handled",
+            yaxis_title="Number of Doctors",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        st.markdown("###  Consultation Time Distribution")
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Histogram(
+                x=doctor_stats['Avg_consult_time'],
+                nbinsx=20,
+                marker=dict(
+                    color='#e74c3c',
+                    line=dict(color='#2c3e50', width=1)
+                )
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Average Consultation Time (minutes)",
+            yaxis_title="Number of Doctors",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Daily Workload Trend
+    if dept_daily_load is not None:
+        st.markdown("---")
+        st.markdown("###  Daily Patients Under Care by Department")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Avg Daily Patients/Doctor", f"{doctor_stats['Avg_daily_patients'].mean():.1f}")
+        with col2:
+            st.metric("Peak Concurrent Patients", f"{doctor_stats['Peak_concurrent'].max():,}")
+        with col3:
+            st.metric("Avg Daily Consult Load", f"{doctor_stats['Avg_daily_consult_min'].mean():.0f} min")
+        
+        rerun_timer.lap('aggregate')
+        fig = px.line(
+            dept_daily_load,
+            x='Date',
+            y='Concurrent_patients',
+            color='Department',
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=450,
+            hovermode='x unified',
+            xaxis_title="Date",
+            yaxis_title="Patients Under Care",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Department Workload
+    st.markdown("---")
+    st.markdown("###  Average Workload by Department")
+    
+    dept_workload = doctor_stats.groupby('Department').agg({
+        'Patients_handled': ['mean', 'sum', 'count'],
+        'Avg_consult_time': 'mean'
+    }).reset_index()
+    
+    dept_workload.columns = ['Department', 'Avg_Patients', 'Total_Patients', 'Doctor_Count', 'Avg_Consult_Time']
+    dept_workload = dept_workload.sort_values('Avg_Patients', ascending=True)
+    
+    rerun_timer.lap('aggregate')
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=dept_workload['Department'],
+        x=dept_workload['Avg_Patients'],
+        orientation='h',
+        name='Avg Patients',
+        marker=dict(color='#3498db', line=dict(color='#2c3e50', width=1)),
+        text=[f"{x:.0f}" for x in dept_workload['Avg_Patients']],
+        textposition='outside'
+    ))
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=500,
+        xaxis_title="Average Patients per Doctor",
+        yaxis_title="Department",
+        xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+        yaxis=dict(showgrid=False)
+    )
+    show_chart(fig)
+    
+    # Workload vs Consultation Time
+    st.markdown("---")
+    st.markdown("###  Workload vs Consultation Time Analysis")
+    
+    rerun_timer.lap('aggregate')
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=doctor_stats['Patients_handled'],
+            y=doctor_stats['Avg_consult_time'],
+            mode='markers',
+            marker=dict(
+                size=12,
+                color=doctor_stats['Patients_handled'],
+                colorscale='Viridis',
+                showscale=True,
+                line=dict(color='#2c3e50', width=1),
+                colorbar=dict(title="Patients<br>Handled")
+            ),
+            text=doctor_stats['Department'],
+            hovertemplate='<b>%{text}</b><br>Patients: %{x}<br>Consult Time: %{y} min<extra></extra>'
+        )
+    ])
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=500,
+        xaxis_title="Patients Handled",
+        yaxis_title="Average Consultation Time (minutes)",
+        xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+        yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+    )
+    show_chart(fig)
+    
+    # Detailed Doctor Table
+    st.markdown("---")
+    st.markdown("###  Detailed Doctor Statistics")
+    
+    dept_filter = st.multiselect(
+        "Filter by Department:",
+        options=doctor_stats['Department'].unique(),
+        default=doctor_stats['Department'].unique()
+    )
+    
+    filtered_doctors = doctor_stats[doctor_stats['Department'].isin(dept_filter)]
+    
+    paginated_table(
+        filtered_doctors,
+        key="doctor_table",
+        default_sort='Patients_handled',
+        gradients={'Patients_handled': 'Reds', 'Avg_consult_time': 'Blues'},
+        render=show_table
+    )
+    
+    # Department Summary
+    st.markdown("---")
+    st.markdown("### Department-wise Doctor Summary")
+    
+    dept_summary = doctor_stats.groupby('Department').agg({
+        'Doctor_ID': 'count',
+        'Patients_handled': ['sum', 'mean', 'min', 'max'],
+        'Avg_consult_time': 'mean'
+    }).round(1)
+    
+    dept_summary.columns = ['Total Doctors', 'Total Patients', 'Avg Patients', 
+                            'Min Workload', 'Max Workload', 'Avg Consult Time']
+    dept_summary = dept_summary.sort_values('Total Patients', ascending=False)
+    
+    show_table(
+        dept_summary.style
+        .background_gradient(subset=['Total Patients'], cmap='Greens')
+        .background_gradient(subset=['Avg Patients'], cmap='Oranges')
+        .format({
+            'Total Patients': '{:.0f}',
+            'Avg Patients': '{:.1f}',
+            'Min Workload': '{:.0f}',
+            'Max Workload': '{:.0f}',
+            'Avg Consult Time': '{:.1f} min'
+        }),
+        use_container_width=True,
+        height=400
+    )
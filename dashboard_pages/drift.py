@@ -0,0 +1,118 @@
+import os
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from drift_monitor import state_path as drift_state_path, drift_report, drift_history, bin_labels, PSI_MODERATE, PSI_SIGNIFICANT
+from .common import load_drift
+
+# Data Drift: distributions of newly ingested admissions against the training reference.
+
+
+def render(ctx):
+    rerun_timer, show_chart, show_table = ctx.rerun_timer, ctx.show_chart, ctx.show_table
+    
+    st.markdown("<h1> Data Drift Monitor</h1>", unsafe_allow_html=True)
+    
+    st.info(" Feature distributions of newly ingested admissions compared with the model's training data")
+    
+    path = drift_state_path()
+    drift_state = load_drift(os.path.getmtime(path) if os.path.exists(path) else None)
+    
+    if drift_state['reference'] is None:
+        st.warning("No reference distribution yet - it is set by readmission_predicton.py or the first data ingest.")
+    else:
+        # a re-binned batch replaced the running totals, so count from the latest one
+        monitored_rows = 0
+        for batch in drift_state['batches']:
+            monitored_rows = batch['rows'] if batch.get('rebinned') else monitored_rows + batch['rows']
+        current_report = drift_report(drift_state)
+        drifting = int((current_report['PSI'] >= PSI_MODERATE).sum()) if len(current_report) else 0
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Reference Rows", f"{drift_state['reference_rows']:,}")
+        
+        with col2:
+            st.metric("Batches Monitored", f"{len(drift_state['batches']):,}")
+        
+        with col3:
+            st.metric("Rows Monitored", f"{monitored_rows:,}")
+        
+        with col4:
+            st.metric("Drifting Features", f"{drifting}", delta="PSI ≥ 0.1", delta_color="off")
+        
+        st.caption(f"Reference set {drift_state['reference_set_at']}")
+        
+        if not drift_state['batches']:
+            st.success(" No new admissions since the reference was set.")
+        else:
+            st.markdown("---")
+            st.markdown("###  Drift by Feature")
+            
+            scope = st.radio("Compare", ["All rows since reference", "Latest batch"], horizontal=True)
+            report = drift_report(drift_state, 'cumulative' if scope == "All rows since reference" else 'batch')
+            rerun_timer.lap('aggregate')
+            show_table(
+                report.style.background_gradient(subset=['PSI'], cmap='Reds', vmin=0, vmax=PSI_SIGNIFICANT * 2)
+                .format({'PSI': '{:.3f}', 'KS': '{:.3f}'}, na_rep='-'),
+                use_container_width=True,
+                hide_index=True
+            )
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                history = drift_history(drift_state)
+                rerun_timer.lap('aggregate')
+                fig = px.line(
+                    history,
+                    x='Batch',
+                    y='PSI',
+                    color='Feature',
+                    markers=True,
+                    color_discrete_sequence=px.colors.qualitative.Set3
+                )
+                fig.add_hline(y=PSI_MODERATE, line_dash="dash", line_color="#f39c12")
+                fig.add_hline(y=PSI_SIGNIFICANT, line_dash="dash", line_color="#e74c3c")
+                fig.update_layout(
+                    title="PSI per Ingest Batch",
+                    plot_bgcolor='white',
+                    paper_bgcolor='white',
+                    height=450,
+                    xaxis=dict(showgrid=False),
+                    yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+                )
+                show_chart(fig)
+            
+            with col2:
+                feature = st.selectbox("Feature", list(drift_state['reference']))
+                reference_counts = np.asarray(drift_state['reference'][feature], dtype=float)
+                current_counts = np.asarray(drift_state['cumulative'][feature], dtype=float)
+                labels = bin_labels(feature)
+                # drop bins that are empty on both sides to keep the chart readable
+                shown = (reference_counts + current_counts) > 0
+                
+                rerun_timer.lap('aggregate')
+                fig = go.Figure(data=[
+                    go.Bar(name='Reference', x=np.array(labels)[shown],
+                           y=(reference_counts / reference_counts.sum() * 100)[shown],
+                           marker=dict(color='#3498db')),
+                    go.Bar(name='Since reference', x=np.array(labels)[shown],
+                           y=(current_counts / current_counts.sum() * 100)[shown],
+                           marker=dict(color='#e74c3c'))
+                ])
+                fig.update_layout(
+                    title=f"{feature} Distribution",
+                    barmode='group',
+                    plot_bgcolor='white',
+                    paper_bgcolor='white',
+                    height=400,
+                    yaxis_title="Share of Admissions (%)",
+                    xaxis=dict(showgrid=False, type='category'),
+                    yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+                )
+                show_chart(fig)
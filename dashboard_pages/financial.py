@@ -0,0 +1,298 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import streamlit as st
+
+from financial_engine import PERIODS, rollup, totals, format_cents
+from paginated_table import paginated_table
+from .charts import histogram_trace
+from .common import load_financial_partials
+
+# Financial Insights: revenue, payer and claim figures rolled up from the financial partials.
+
+
+def render(ctx):
+    selected_facility, data_handle, chart_df = ctx.selected_facility, ctx.data_handle, ctx.chart_df
+    rerun_timer, show_chart, show_table = ctx.rerun_timer, ctx.show_chart, ctx.show_table
+    approximation_note = ctx.approximation_note
+    
+    st.markdown("<h1> Financial Analytics Dashboard</h1>", unsafe_allow_html=True)
+    
+    # Financial Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    partials = load_financial_partials(selected_facility, data_handle.version)
+    financials = totals(partials)
+    rerun_timer.lap('aggregate')
+    
+    with col1:
+        total_revenue = financials['Revenue']
+        st.metric("Total Revenue", f"${total_revenue:,.0f}", 
+                 delta=f"+${np.random.randint(10000,50000):,}",
+                 help=f"Exact total: {format_cents(financials['Revenue_cents'])}")
+    
+    with col2:
+        avg_revenue = financials['Avg_revenue']
+        st.metric("Avg Revenue/Admission", f"${avg_revenue:,.0f}")
+    
+    with col3:
+        insured = int(financials['Insured'])
+        insurance_rate = financials['Insurance_rate']
+        st.metric("Insurance Coverage", f"{insurance_rate:.1f}%", 
+                 delta=f"{insured:,} patients")
+    
+    with col4:
+        approved = int(financials['Approved'])
+        approval_rate = financials['Approval_rate']
+        st.metric("Claim Approval Rate", f"{approval_rate:.1f}%",
+                 delta=f"{approved:,} approved")
+    
+    st.markdown("---")
+    
+    # Revenue Analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Revenue by Department")
+        dept_revenue = (rollup(partials, ['Department'])['Revenue'].rename('Total_charges')
+                        .reset_index().sort_values('Total_charges', ascending=True))
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                y=dept_revenue['Department'],
+                x=dept_revenue['Total_charges'],
+                orientation='h',
+                marker=dict(
+                    color=dept_revenue['Total_charges'],
+                    colorscale='Greens',
+                    showscale=True,
+                    line=dict(color='#2c3e50', width=1)
+                ),
+                text=[f"${x/1000:.0f}K" for x in dept_revenue['Total_charges']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=450,
+            xaxis_title="Revenue ($)",
+            yaxis_title="Department",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=False)
+        )
+        show_chart(fig)
+    
+    with col2:
+        st.markdown("###  Revenue Distribution")
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            histogram_trace(
+                chart_df, 'Total_charges', 40,
+                marker=dict(
+                    color='#27ae60',
+                    line=dict(color='#2c3e50', width=1)
+                )
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=450,
+            xaxis_title="Revenue ($)",
+            yaxis_title="Frequency",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+        approximation_note()
+    
+    # Insurance and Claims Analysis
+    st.markdown("---")
+    st.markdown("### Insurance & Claims Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        insurance_data = rollup(partials, ['Insurance_covered'])['Admissions'].sort_values(ascending=False).reset_index()
+        insurance_data.columns = ['Status', 'Count']
+        
+        colors = {'Yes': '#27ae60', 'No': '#e74c3c'}
+        color_list = [colors.get(s, '#95a5a6') for s in insurance_data['Status']]
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Pie(
+                labels=insurance_data['Status'],
+                values=insurance_data['Count'],
+                hole=0.5,
+                marker=dict(colors=color_list, line=dict(color='white', width=2)),
+                textinfo='percent+label',
+                textfont_size=16
+            )
+        ])
+        
+        fig.update_layout(
+            title="Insurance Coverage Status",
+            height=400,
+            paper_bgcolor='white',
+            showlegend=False,
+            annotations=[dict(text=f'Total<br>{insurance_data["Count"].sum()}', x=0.5, y=0.5, 
+                            font_size=20, showarrow=False, font_color='#2c3e50')]
+        )
+        show_chart(fig)
+    
+    with col2:
+        claim_data = rollup(partials, ['Claim_status'])['Admissions'].sort_values(ascending=False).reset_index()
+        claim_data.columns = ['Status', 'Count']
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=claim_data['Status'],
+                y=claim_data['Count'],
+                marker=dict(
+                    color=[{'Approved': '#27ae60', 'Rejected': '#3498db'}.get(s, '#95a5a6')
+                           for s in claim_data['Status']],
+                    line=dict(color='#2c3e50', width=2)
+                ),
+                text=claim_data['Count'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Claim Status Distribution",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Number of Claims",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Revenue by Bed Type
+    st.markdown("---")
+    st.markdown("###  Revenue Analysis by Bed Type")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        bed_rollup = rollup(partials, ['Bed_type'])
+        bed_revenue = pd.DataFrame({'sum': bed_rollup['Revenue'], 'mean': bed_rollup['Avg_revenue']}).reset_index()
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=bed_revenue['Bed_type'],
+                y=bed_revenue['sum'],
+                marker=dict(color=['#3498db', '#e74c3c'], line=dict(color='#2c3e50', width=2)),
+                text=[f"${x/1000:.0f}K" for x in bed_revenue['sum']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Total Revenue by Bed Type",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Total Revenue ($)",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=bed_revenue['Bed_type'],
+                y=bed_revenue['mean'],
+                marker=dict(color=['#27ae60', '#f39c12'], line=dict(color='#2c3e50', width=2)),
+                text=[f"${x:,.0f}" for x in bed_revenue['mean']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Average Revenue per Admission by Bed Type",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Average Revenue ($)",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Revenue trend with drill-down, rolled up from the same partials
+    st.markdown("---")
+    st.markdown("###  Revenue Trend")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        period_label = st.radio("Period", list(PERIODS), horizontal=True)
+    with col2:
+        trend_dept = st.selectbox("Department", ['All Departments'] + sorted(partials['Department'].unique()))
+    with col3:
+        payer = st.selectbox("Payer", ['All Payers', 'Insured', 'Uninsured'])
+    
+    trend = rollup(
+        partials, period=PERIODS[period_label],
+        Department=None if trend_dept == 'All Departments' else trend_dept,
+        Insurance_covered={'All Payers': None, 'Insured': 'Yes', 'Uninsured': 'No'}[payer]
+    ).reset_index()
+    trend['Period'] = trend['Period'].astype(str)
+    
+    rerun_timer.lap('aggregate')
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Bar(x=trend['Period'], y=trend['Revenue'], name='Revenue',
+                         marker=dict(color='#27ae60', line=dict(color='#2c3e50', width=1))), secondary_y=False)
+    fig.add_trace(go.Scatter(x=trend['Period'], y=trend['Approval_rate'], name='Claim approval rate (%)',
+                             mode='lines+markers', line=dict(color='#e67e22', width=3)), secondary_y=True)
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=400,
+        legend=dict(orientation='h', y=1.1),
+        xaxis=dict(showgrid=False, type='category'),
+        yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+    )
+    fig.update_yaxes(title_text="Revenue ($)", secondary_y=False)
+    fig.update_yaxes(title_text="Approval rate (%)", secondary_y=True)
+    show_chart(fig)
+    
+    # Financial Summary Table
+    st.markdown("---")
+    st.markdown("### 📋 Financial Summary by Department")
+    
+    dept_rollup = rollup(partials, ['Department'])
+    financial_summary = pd.DataFrame({
+        'Total Revenue': dept_rollup['Revenue'],
+        'Avg Revenue': dept_rollup['Avg_revenue'],
+        'Admissions': dept_rollup['Admissions'],
+        'Insured Patients': dept_rollup['Insured'],
+        'Approved Claims': dept_rollup['Approved']
+    }).round(0).sort_values('Total Revenue', ascending=False)
+    
+    paginated_table(
+        financial_summary,
+        key="financial_summary",
+        default_sort='Total Revenue',
+        gradients={'Total Revenue': 'Greens', 'Avg Revenue': 'Blues'},
+        formats={
+            'Total Revenue': '${:,.0f}',
+            'Avg Revenue': '${:,.0f}',
+            'Admissions': '{:.0f}',
+            'Insured Patients': '{:.0f}',
+            'Approved Claims': '{:.0f}'
+        },
+        search_cols=['Department'],
+        render=show_table
+    )
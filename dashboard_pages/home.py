@@ -0,0 +1,314 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from aggregate_cube import AGE_BAND_WIDTH, cube_kpis
+from forecasting import HORIZON, TOTAL
+from .charts import forecast_band
+from .common import load_forecasts, load_aggregate_cube
+
+# Home Overview: KPI tiles and cross-filtered charts served from the aggregate cube, with the
+# admissions forecast on the daily chart.
+
+# Cross-filtering: a selection in one chart filters every other chart of the page.
+# Selections live in the charts' widget state; the generation suffix lets "Clear" reset them all.
+# Only points of each chart's first trace (the actual admissions) count, so a box drawn over
+# the daily chart's forecast band does not select forecast days.
+CROSS_FILTER_CHARTS = {
+    'Admission_day': 'xf_daily',
+    'Department': 'xf_department',
+    'Bed_type': 'xf_bed',
+    'Age_band': 'xf_age'
+}
+
+
+def cross_filter_key(dim):
+    return f"{CROSS_FILTER_CHARTS[dim]}_{st.session_state.get('xf_generation', 0)}"
+
+
+def cross_filters():
+    # dimension -> selected values (a (first, last) range for days), from the last chart events
+    filters = {}
+    for dim in CROSS_FILTER_CHARTS:
+        state = st.session_state.get(cross_filter_key(dim))
+        points = state['selection']['points'] if state else []
+        values = [p['x'] for p in points if 'x' in p and p.get('curve_number', 0) == 0]
+        if not values:
+            continue
+        if dim == 'Admission_day':
+            days = pd.to_datetime(values, unit='ms') if isinstance(values[0], (int, float)) else pd.to_datetime(values)
+            filters[dim] = (days.min().normalize(), days.max().normalize())
+        elif dim == 'Age_band':
+            filters[dim] = tuple(sorted({int(v // AGE_BAND_WIDTH * AGE_BAND_WIDTH) for v in values}))
+        else:
+            filters[dim] = tuple(sorted(set(values)))
+    return filters
+
+
+def describe_filters(filters):
+    parts = []
+    for dim, value in filters.items():
+        if dim == 'Admission_day':
+            parts.append(f"Admission date {value[0]:%Y-%m-%d} to {value[1]:%Y-%m-%d}")
+        elif dim == 'Age_band':
+            parts.append("Age " + ", ".join(f"{v}-{v + AGE_BAND_WIDTH - 1}" for v in value))
+        else:
+            parts.append(f"{dim.replace('_', ' ')}: {', '.join(value)}")
+    return " · ".join(parts)
+
+
+def render(ctx):
+    selected_facility, data_handle = ctx.selected_facility, ctx.data_handle
+    patient_sketches, rerun_timer, show_chart = ctx.patient_sketches, ctx.rerun_timer, ctx.show_chart
+    
+    # Title with icon
+    st.markdown("""
+        <h1> Hospital Analytics Dashboard</h1>
+        <p style='text-align: center; font-size: 18px; color: #7f8c8d;'>
+            Welcome to your comprehensive healthcare data analytics platform
+        </p>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Cross-filter state - every chart below is served from the cached aggregate cube
+    cube = load_aggregate_cube(selected_facility, data_handle.version)
+    filters = cross_filters()
+    if filters:
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            st.info(f"Filtered by {describe_filters(filters)}")
+        with col2:
+            if st.button("Clear selections"):
+                st.session_state['xf_generation'] = st.session_state.get('xf_generation', 0) + 1
+                st.rerun()
+    else:
+        st.caption("Click a department or bed type bar, select age bars or drag over a date range "
+                   "to filter every chart on this page.")
+    
+    # KPI Cards - Top Row
+    st.markdown("###  Key Performance Indicators")
+    kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
+    overview = cube_kpis(cube, filters)
+    rerun_timer.lap('aggregate')
+    
+    with kpi1:
+        # sketches are partitioned by department and day, so bed and age selections do not apply here
+        day_range = filters.get('Admission_day')
+        total_patients = patient_sketches['daily'].count(
+            Department=list(filters['Department']) if 'Department' in filters else None,
+            Admission_day=slice(*day_range) if day_range else None
+        )
+        # label the tile when it cannot follow the selection, instead of disagreeing silently
+        partial = bool(set(filters) & {'Bed_type', 'Age_band'})
+        st.metric("Total Patients" + (" (department/date filters only)" if partial else ""),
+                 f"{total_patients:,}",
+                 delta=f"+{np.random.randint(10,30)}",
+                 help=f"Unique patients in system (±{patient_sketches['daily'].error:.1%}); "
+                      "bed type and age selections do not apply to this count")
+    
+    with kpi2:
+        total_admissions = overview['total_admissions']
+        st.metric(" Total Admissions", f"{total_admissions:,}",
+                 delta=f"+{np.random.randint(5,15)}%", help="All hospital admissions")
+    
+    with kpi3:
+        avg_los = overview['avg_los']
+        st.metric(" Avg Stay", f"{avg_los:.1f} days",
+                 delta=f"-{np.random.uniform(0.1, 0.5):.1f}", delta_color="inverse",
+                 help="Average length of stay")
+    
+    with kpi4:
+        readmission_rate = overview['readmission_rate']
+        st.metric(" Readmission Rate", f"{readmission_rate:.1f}%",
+                 delta=f"-{np.random.uniform(0.5, 2):.1f}%", delta_color="inverse",
+                 help="30-day readmission rate")
+    
+    with kpi5:
+        total_revenue = overview['total_revenue']
+        st.metric(" Total Revenue", f"${total_revenue/1000:.0f}K",
+                 delta=f"+${np.random.randint(50,100)}K",
+                 help=f"Total hospital revenue of {overview['billed_admissions']:,} billed admissions "
+                      f"(${overview['avg_revenue']:,.0f} each)")
+    
+    st.markdown("---")
+    
+    # Main Charts Row 1
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Daily Admission Trends")
+        daily_data = cube.marginal('Admission_day', filters)['Admissions']
+        daily_data = daily_data[daily_data > 0]
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=daily_data.index,
+            y=daily_data.to_numpy(),
+            mode='lines+markers',
+            name='Daily Admissions',
+            line=dict(color='#3498db', width=3),
+            marker=dict(size=8, color='#2980b9'),
+            fill='tozeroy',
+            fillcolor='rgba(52, 152, 219, 0.2)'
+        ))
+        
+        # forecasts exist per department, so they follow the department selection only
+        forecasts, _ = load_forecasts(selected_facility, data_handle.version)
+        if not set(filters) & {'Bed_type', 'Age_band'}:
+            selected = forecasts[(forecasts['Measure'] == 'Admissions') & (
+                forecasts['Department'].isin(filters['Department']) if 'Department' in filters
+                else forecasts['Department'] == TOTAL)]
+            expected = forecast_band(fig, selected, f'{HORIZON}-day forecast', '#e67e22', 'rgba(230, 126, 34, 0.15)')
+        else:
+            expected = None
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            hovermode='x unified',
+            dragmode='select',
+            selectdirection='h',
+            height=350,
+            margin=dict(l=20, r=20, t=40, b=20),
+            xaxis=dict(showgrid=True, gridcolor="#216B84"),
+            yaxis=dict(showgrid=True, gridcolor="#29bfe4")
+        )
+        show_chart(fig, key=cross_filter_key('Admission_day'))
+        if expected is not None:
+            st.caption(f"Next {HORIZON} days: about {expected['Forecast'].sum():,.0f} admissions expected "
+                       f"(Holt-Winters, weekly seasonality).")
+        else:
+            st.caption("Forecasts are per department - clear the bed type and age selections to show them.")
+    
+    with col2:
+        st.markdown("### Department Distribution")
+        dept_data = cube.marginal('Department', filters)['Admissions']
+        dept_data = dept_data[dept_data > 0].sort_values(ascending=False)
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=dept_data.index,
+                y=dept_data.to_numpy(),
+                marker=dict(color=px.colors.qualitative.Set3[:len(dept_data)],
+                            line=dict(color='#2c3e50', width=1)),
+                hovertemplate='<b>%{x}</b><br>Patients: %{y}<extra></extra>'
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=350,
+            margin=dict(l=20, r=20, t=40, b=20),
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig, key=cross_filter_key('Department'))
+    
+    # Main Charts Row 2
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Age Distribution")
+        age_data = cube.marginal('Age_band', filters)['Admissions']
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=age_data.index + AGE_BAND_WIDTH / 2,
+            y=age_data.to_numpy(),
+            width=AGE_BAND_WIDTH,
+            marker=dict(
+                color="#a634db",
+                line=dict(color='#2c3e50', width=1)
+            ),
+            name='Age Distribution'
+        ))
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=350,
+            margin=dict(l=20, r=20, t=40, b=20),
+            xaxis_title="Age (years)",
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+            bargap=0.1
+        )
+        show_chart(fig, key=cross_filter_key('Age_band'))
+    
+    with col2:
+        st.markdown("### Bed Type Utilization")
+        bed_data = cube.marginal('Bed_type', filters)['Admissions']
+        
+        colors = ['#e74c3c', '#3498db']
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=bed_data.index,
+                y=bed_data.to_numpy(),
+                marker=dict(
+                    color=colors,
+                    line=dict(color='#2c3e50', width=2)
+                ),
+                text=bed_data.to_numpy().astype(int),
+                textposition='outside',
+                hovertemplate='<b>%{x}</b><br>Patients: %{y}<extra></extra>'
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=350,
+            margin=dict(l=20, r=20, t=40, b=20),
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig, key=cross_filter_key('Bed_type'))
+    
+    # Insights Section
+    st.markdown("---")
+    st.markdown("### Key Insights")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        busiest_dept = overview['busiest_department']
+        busiest_count = overview['busiest_department_admissions']
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>🏆 Busiest Department</h4>
+                <p style='font-size: 24px; font-weight: bold; margin: 10px 0;'>{busiest_dept}</p>
+                <p style='margin: 0;'>{busiest_count} admissions</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        avg_age = overview['avg_age']
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'> Average Patient Age</h4>
+                <p style='font-size: 24px; font-weight: bold; margin: 10px 0;'>{avg_age:.0f} years</p>
+                <p style='margin: 0;'>Patient demographic insight</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        icu_percent = overview['icu_percent']
+        st.markdown(f"""
+            <div class='info-card' style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white;'>
+                <h4 style='color: white; margin-top: 0;'>🏥 ICU Utilization</h4>
+                <p style='font-size: 24px; font-weight: bold; margin: 10px 0;'>{icu_percent:.1f}%</p>
+                <p style='margin: 0;'>Critical care capacity</p>
+            </div>
+        """, unsafe_allow_html=True)
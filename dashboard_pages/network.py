@@ -0,0 +1,169 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from facility_aggregation import network_kpis, department_view, financial_view, readmission_view, facility_comparison
+from .common import load_network_aggregates
+
+# Network Overview: network KPIs, department / financial / readmission views and the facility
+# comparison, from the per-facility partial aggregates.
+
+
+def render(ctx):
+    data_handle, rerun_timer, show_chart = ctx.data_handle, ctx.rerun_timer, ctx.show_chart
+    show_table = ctx.show_table
+    
+    st.markdown("<h1> Network Overview</h1>", unsafe_allow_html=True)
+    
+    agg = load_network_aggregates(data_handle.version)
+    network_facilities = sorted(agg['sums']['Facility_ID'].unique())
+    scope = st.selectbox(
+        "Scope",
+        options=['All Facilities'] + network_facilities
+    )
+    scope_facility = None if scope == 'All Facilities' else scope
+    
+    st.markdown("---")
+    
+    # Network Metrics
+    network = network_kpis(agg, scope_facility)
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("Unique Patients", f"{network['total_patients']:,}")
+    
+    with col2:
+        st.metric("Total Admissions", f"{network['total_admissions']:,}")
+    
+    with col3:
+        st.metric("Avg LOS", f"{network['avg_los']:.1f} days")
+    
+    with col4:
+        st.metric("Readmission Rate", f"{network['readmission_rate']:.1f}%")
+    
+    with col5:
+        st.metric("Total Revenue", f"${network['total_revenue']/1000:.0f}K")
+    
+    st.markdown("---")
+    
+    # Facility Comparison
+    st.markdown("###  Facility Comparison")
+    
+    fac_stats = facility_comparison(agg)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=fac_stats['Facility_ID'],
+                y=fac_stats['Admissions'],
+                marker=dict(color='#3498db', line=dict(color='#2c3e50', width=1)),
+                text=fac_stats['Admissions'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Admissions by Facility",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Number of Admissions",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=fac_stats['Facility_ID'],
+                y=fac_stats['Total Revenue'],
+                marker=dict(color='#27ae60', line=dict(color='#2c3e50', width=1)),
+                text=[f"${x/1000:.0f}K" for x in fac_stats['Total Revenue']],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Revenue by Facility",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Total Revenue ($)",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Readmission by Department
+    st.markdown("---")
+    st.markdown(f"###  Readmission Rate by Department - {scope}")
+    
+    dept_readmit = readmission_view(agg, scope_facility)
+    
+    rerun_timer.lap('aggregate')
+    fig = go.Figure(data=[
+        go.Bar(
+            y=dept_readmit['Department'],
+            x=dept_readmit['rate'],
+            orientation='h',
+            marker=dict(
+                color=dept_readmit['rate'],
+                colorscale='Reds',
+                showscale=True,
+                colorbar=dict(title="Rate %"),
+                line=dict(color='#2c3e50', width=1)
+            ),
+            text=[f"{x:.1f}%" for x in dept_readmit['rate']],
+            textposition='outside'
+        )
+    ])
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=450,
+        xaxis_title="Readmission Rate (%)",
+        yaxis_title="Department",
+        xaxis=dict(showgrid=True, gridcolor='#ecf0f1'),
+        yaxis=dict(showgrid=False)
+    )
+    show_chart(fig)
+    
+    # Department and Financial Tables
+    st.markdown("---")
+    st.markdown(f"### 📋 Department Statistics - {scope}")
+    
+    show_table(
+        department_view(agg, scope_facility).style
+        .background_gradient(subset=['Total Admissions'], cmap='Blues')
+        .background_gradient(subset=['Readmission Rate (%)'], cmap='Reds')
+        .format({
+            'Avg LOS (days)': '{:.1f}',
+            'Readmission Rate (%)': '{:.2f}%',
+            'Total Revenue': '${:,.0f}',
+            'Avg Revenue': '${:,.0f}',
+            'Avg Chronic Conditions': '{:.2f}'
+        }),
+        use_container_width=True,
+        height=400
+    )
+    
+    st.markdown(f"### 📋 Financial Summary - {scope}")
+    
+    show_table(
+        financial_view(agg, scope_facility).style
+        .background_gradient(subset=['Total Revenue'], cmap='Greens')
+        .format({
+            'Total Revenue': '${:,.0f}',
+            'Avg Revenue': '${:,.0f}',
+            'Admissions': '{:.0f}',
+            'Insured Patients': '{:.0f}',
+            'Approved Claims': '{:.0f}'
+        }),
+        use_container_width=True,
+        height=400
+    )
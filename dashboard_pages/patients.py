@@ -0,0 +1,277 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+# Patient Analytics: demographics, stay lengths and readmissions of the filtered patients.
+
+
+def render(ctx):
+    patient_sketches, df, chart_df, rerun_timer = ctx.patient_sketches, ctx.df, ctx.chart_df, ctx.rerun_timer
+    show_chart, approximation_note = ctx.show_chart, ctx.approximation_note
+    
+    st.markdown("<h1>👥 Patient Analytics Dashboard</h1>", unsafe_allow_html=True)
+    
+    # Filters
+    st.markdown("###  Filter Options")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        gender_filter = st.multiselect(
+            "Gender",
+            options=df['Gender'].unique(),
+            default=df['Gender'].unique()
+        )
+    
+    with col2:
+        age_range = st.slider(
+            "Age Range",
+            int(df['Age'].min()),
+            int(df['Age'].max()),
+            (int(df['Age'].min()), int(df['Age'].max()))
+        )
+    
+    with col3:
+        dept_filter = st.multiselect(
+            "Department",
+            options=df['Department'].unique(),
+            default=df['Department'].unique()
+        )
+    
+    with col4:
+        admission_type = st.multiselect(
+            "Admission Type",
+            options=df['Admission_type'].unique(),
+            default=df['Admission_type'].unique()
+        )
+    
+    # Filter data
+    filtered_df = df[
+        (df['Gender'].isin(gender_filter)) &
+        (df['Age'].between(age_range[0], age_range[1])) &
+        (df['Department'].isin(dept_filter)) &
+        (df['Admission_type'].isin(admission_type))
+    ]
+    filtered_chart_df = chart_df[
+        (chart_df['Gender'].isin(gender_filter)) &
+        (chart_df['Age'].between(age_range[0], age_range[1])) &
+        (chart_df['Department'].isin(dept_filter)) &
+        (chart_df['Admission_type'].isin(admission_type))
+    ] if chart_df is not df else filtered_df
+    rerun_timer.lap('filter')
+    
+    st.markdown("---")
+    
+    # Filtered Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        filtered_patients = patient_sketches['demographic'].count(
+            Gender=gender_filter,
+            Age=slice(age_range[0], age_range[1]),
+            Department=dept_filter,
+            Admission_type=admission_type
+        )
+        st.metric("Filtered Patients", f"{filtered_patients:,}")
+    
+    with col2:
+        st.metric("Filtered Admissions", f"{len(filtered_df):,}")
+    
+    with col3:
+        st.metric("Avg Age", f"{filtered_df['Age'].mean():.1f} yrs")
+    
+    with col4:
+        st.metric("Avg LOS", f"{filtered_df['Length_of_stay'].mean():.1f} days")
+    
+    st.markdown("---")
+    
+    # Charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("###  Gender Distribution")
+        gender_data = filtered_df['Gender'].value_counts().reset_index()
+        gender_data.columns = ['Gender', 'Count']
+        
+        colors = {'Male': '#3498db', 'Female': '#e74c3c', 'Other': '#95a5a6'}
+        color_list = [colors.get(g, '#95a5a6') for g in gender_data['Gender']]
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=gender_data['Gender'],
+                y=gender_data['Count'],
+                marker=dict(color=color_list, line=dict(color='#2c3e50', width=2)),
+                text=gender_data['Count'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=350,
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        st.markdown("###  Admission Type Breakdown")
+        admission_data = filtered_df['Admission_type'].value_counts().reset_index()
+        admission_data.columns = ['Type', 'Count']
+        
+        rerun_timer.lap('aggregate')
+        fig = px.pie(
+            admission_data,
+            values='Count',
+            names='Type',
+            hole=0.5,
+            color_discrete_sequence=['#e74c3c', '#3498db']
+        )
+        
+        fig.update_traces(
+            textposition='inside',
+            textinfo='percent+label',
+            textfont_size=14
+        )
+        
+        fig.update_layout(
+            height=350,
+            paper_bgcolor='white',
+            showlegend=False,
+            annotations=[dict(text=f'Total<br>{len(filtered_df)}', x=0.5, y=0.5, 
+                            font_size=20, showarrow=False)]
+        )
+        show_chart(fig)
+    
+    # Age Group Analysis
+    st.markdown("---")
+    st.markdown("###  Age Group Analysis")
+    
+    filtered_df['Age_Group'] = pd.cut(
+        filtered_df['Age'],
+        bins=[0, 18, 35, 50, 65, 100],
+        labels=['0-18', '19-35', '36-50', '51-65', '65+']
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        age_group_data = filtered_df['Age_Group'].value_counts().sort_index().reset_index()
+        age_group_data.columns = ['Age Group', 'Count']
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=age_group_data['Age Group'],
+                y=age_group_data['Count'],
+                marker=dict(
+                    color=age_group_data['Count'],
+                    colorscale='Viridis',
+                    showscale=True,
+                    line=dict(color='#2c3e50', width=2)
+                ),
+                text=age_group_data['Count'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Patients by Age Group",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Age Group",
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        # Chronic conditions by age group
+        chronic_age = filtered_df.groupby('Age_Group')['Chronic_conditions'].mean().reset_index()
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Scatter(
+                x=chronic_age['Age_Group'],
+                y=chronic_age['Chronic_conditions'],
+                mode='lines+markers',
+                line=dict(color='#e74c3c', width=3),
+                marker=dict(size=12, color='#c0392b'),
+                fill='tozeroy',
+                fillcolor='rgba(231, 76, 60, 0.2)'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Average Chronic Conditions by Age Group",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            xaxis_title="Age Group",
+            yaxis_title="Avg Chronic Conditions",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    # Readmission Analysis
+    st.markdown("---")
+    st.markdown("### Readmission Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        readmit_data = filtered_df['readmitted_30_days'].value_counts().reset_index()
+        readmit_data.columns = ['Status', 'Count']
+        readmit_data['Status'] = readmit_data['Status'].map({0: 'Not Readmitted', 1: 'Readmitted'})
+        
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Bar(
+                x=readmit_data['Status'],
+                y=readmit_data['Count'],
+                marker=dict(color=['#27ae60', '#e74c3c'], line=dict(color='#2c3e50', width=2)),
+                text=readmit_data['Count'],
+                textposition='outside'
+            )
+        ])
+        
+        fig.update_layout(
+            title="30-Day Readmission Status",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Number of Patients",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+    
+    with col2:
+        # Length of stay distribution
+        rerun_timer.lap('aggregate')
+        fig = go.Figure(data=[
+            go.Box(
+                y=filtered_chart_df['Length_of_stay'],
+                marker=dict(color='#3498db'),
+                boxmean='sd',
+                name='Length of Stay'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Length of Stay Distribution",
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            height=400,
+            yaxis_title="Days",
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='#ecf0f1')
+        )
+        show_chart(fig)
+        approximation_note()
@@ -0,0 +1,240 @@
+import json
+import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from data_loader import DATA_DIR, SHARDED_TABLES, list_facilities, table_paths, load_tables, merge_tables
+from drift_monitor import update_drift
+
+# Shared, read-only data plane. The validated CSV tables (and the merged admissions
+# frame) are ingested once into uncompressed Arrow IPC files under data/columnar/.
+# Every server process memory-maps them, so columns are zero-copy views on the OS
+# page cache and N app replicas on one host share a single copy of the data.
+#
+# Layout: data/columnar/CURRENT names the live generation directory
+#         data/columnar/<generation>/patients.arrow
+#         data/columnar/<generation>/<facility|all>/{admissions,billing,doctors,merged}.arrow
+# A new generation is written next to the old one and CURRENT is swapped atomically,
+# readers keep their mapping of the old files until they refresh. The manifest records,
+# per shard, whether the new merged table only appended rows to the previous generation's,
+# so derived state (aggregate cube, drift histograms) can take just the new rows.
+
+COLUMNAR_DIR = "columnar"
+TABLES = ['patients', 'admissions', 'billing', 'doctors']
+SHARD_TABLES = SHARDED_TABLES + ['merged']
+ALL_SHARD = "all"
+# older generations kept on disk for processes that still map them
+KEEP_GENERATIONS = 2
+
+
+def columnar_root(data_dir=None):
+    return os.path.join(data_dir or DATA_DIR, COLUMNAR_DIR)
+
+
+def current_generation(data_dir=None):
+    try:
+        with open(os.path.join(columnar_root(data_dir), "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def columnar_path(table, generation, data_dir=None, facility=None):
+    root = os.path.join(columnar_root(data_dir), generation)
+    if table not in SHARD_TABLES:
+        return os.path.join(root, f"{table}.arrow")
+    return os.path.join(root, facility or ALL_SHARD, f"{table}.arrow")
+
+
+def _write_arrow(df, path):
+    # one record batch per file so numeric columns map to a single contiguous buffer
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    feather.write_feather(df, path, compression='uncompressed', chunksize=max(len(df), 1))
+
+
+def _write_atomic(path, text):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _source_mtime(data_dir=None):
+    return max(os.path.getmtime(p) for t in TABLES for p in table_paths(t, data_dir))
+
+
+def _manifest(data_dir, generation):
+    with open(os.path.join(columnar_root(data_dir), generation, "manifest.json")) as f:
+        return json.load(f)
+
+
+def _read_mapped(path):
+    return pa.ipc.open_file(pa.memory_map(path)).read_all()
+
+
+def _appended_from(previous, generation, data_dir=None, facility=None):
+    # row count of the previous generation's merged table when the new one starts with exactly
+    # those rows (only admissions were appended), else None
+    if previous is None:
+        return None
+    path = columnar_path('merged', previous, data_dir, facility)
+    if not os.path.exists(path):
+        return None
+    old = _read_mapped(path)
+    new = _read_mapped(columnar_path('merged', generation, data_dir, facility))
+    if new.num_rows < old.num_rows or new.schema != old.schema:
+        return None
+    return old.num_rows if new.slice(0, old.num_rows).equals(old) else None
+
+
+def ingest_columnar(data_dir=None):
+    # CSV -> validation -> Arrow for the whole network and every facility shard
+    root = columnar_root(data_dir)
+    generation = f"g{time.time_ns()}_{os.getpid()}"
+    facilities = list_facilities(data_dir)
+    source_mtime = _source_mtime(data_dir)
+    previous = current_generation(data_dir)
+    appended = {}
+
+    for facility in [None] + facilities:
+        patients, admissions, billing, doctors = load_tables(data_dir, facility)
+        if facility is None:
+            _write_arrow(patients, columnar_path('patients', generation, data_dir))
+        _write_arrow(admissions, columnar_path('admissions', generation, data_dir, facility))
+        _write_arrow(billing, columnar_path('billing', generation, data_dir, facility))
+        _write_arrow(doctors, columnar_path('doctors', generation, data_dir, facility))
+        merged = merge_tables(admissions, patients, billing)
+        _write_arrow(merged, columnar_path('merged', generation, data_dir, facility))
+        appended[facility or ALL_SHARD] = _appended_from(previous, generation, data_dir, facility)
+        if facility is None:
+            # admissions new since the last ingest become one drift batch
+            update_drift(merged, data_dir, generation, previous, appended[ALL_SHARD])
+
+    manifest = {'generation': generation, 'facilities': facilities, 'source_mtime': source_mtime,
+                'previous': previous, 'appended': appended}
+    _write_atomic(os.path.join(root, generation, "manifest.json"), json.dumps(manifest))
+    _write_atomic(os.path.join(root, "CURRENT"), generation)
+    _remove_old_generations(root, generation)
+    return generation
+
+
+def _remove_old_generations(root, keep):
+    generations = sorted(
+        (name for name in os.listdir(root) if name != keep and os.path.isdir(os.path.join(root, name))),
+        key=lambda name: os.path.getmtime(os.path.join(root, name)), reverse=True
+    )
+    for name in generations[KEEP_GENERATIONS - 1:]:
+        # files still mapped elsewhere cannot be removed on Windows, try again next ingest
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def is_stale(data_dir=None, generation=None):
+    generation = generation or current_generation(data_dir)
+    if generation is None:
+        return True
+    try:
+        manifest = _manifest(data_dir, generation)
+    except FileNotFoundError:
+        return True
+    return (manifest['facilities'] != list_facilities(data_dir)
+            or _source_mtime(data_dir) > manifest['source_mtime'])
+
+
+def ensure_columnar(data_dir=None):
+    # returns the live generation, ingesting first when the CSV files changed
+    generation = current_generation(data_dir)
+    if is_stale(data_dir, generation):
+        generation = ingest_columnar(data_dir)
+    return generation
+
+
+def _to_pandas(column):
+    # numeric/datetime columns without nulls become read-only numpy views of the mapping,
+    # strings stay Arrow-backed; anything else is converted with a copy
+    if column.num_chunks == 1 and column.null_count == 0:
+        try:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            pass
+    return column.to_pandas().array
+
+
+class DataHandle:
+    def __init__(self, data_dir=None, facility=None):
+        self.data_dir = data_dir
+        self.facility = facility
+        self._lock = threading.RLock()
+        # page -> columns it requested, to see what each page really needs
+        self.usage = defaultdict(set)
+        self.generation = None
+        self.refresh()
+
+    def refresh(self):
+        # remap when another process (or the CSV files) produced a new generation
+        generation = ensure_columnar(self.data_dir)
+        with self._lock:
+            if generation == self.generation:
+                return False
+            self.generation = generation
+            self._tables = {}
+            self._columns = {}
+            return True
+
+    @property
+    def version(self):
+        return self.generation
+
+    def _mapped(self, table):
+        if table not in self._tables:
+            path = columnar_path(table, self.generation, self.data_dir, self.facility)
+            self._tables[table] = _read_mapped(path)
+        return self._tables[table]
+
+    def appended_since(self, generation):
+        # first row of the merged table that is new since generation, when every generation
+        # in between only appended admissions; None when rows were changed or removed
+        current, start = self.generation, None
+        while current != generation:
+            if current is None:
+                return None
+            try:
+                manifest = _manifest(self.data_dir, current)
+            except FileNotFoundError:
+                return None
+            offset = manifest.get('appended', {}).get(self.facility or ALL_SHARD)
+            if offset is None:
+                return None
+            start = offset if start is None else min(start, offset)
+            current = manifest['previous']
+        if start is None:
+            with self._lock:
+                return self._mapped('merged').num_rows
+        return start
+
+    def schema(self, table):
+        with self._lock:
+            return self._mapped(table).schema.names
+
+    def table(self, table, columns=None, page=None):
+        with self._lock:
+            mapped = self._mapped(table)
+            columns = list(columns) if columns is not None else mapped.schema.names
+            unknown = [c for c in columns if c not in mapped.schema.names]
+            if unknown:
+                raise KeyError(f"Unknown columns: {unknown}")
+            for col in columns:
+                if (table, col) not in self._columns:
+                    self._columns[(table, col)] = _to_pandas(mapped.column(col))
+            if page:
+                self.usage[page].update(f"{table}.{c}" for c in columns)
+            return pd.DataFrame({c: self._columns[(table, c)] for c in columns}, copy=False)
+
+    def merged(self, columns, page=None):
+        # projection of the admissions x patients x billing frame built by data_loader.merge_tables
+        return self.table('merged', columns, page)
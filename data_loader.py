@@ -0,0 +1,108 @@
+import os
+import numpy as np
+import pandas as pd
+from data_validation import validate_tables, write_quarantine
+
+# folder written by hospital_data.py, override with HOSPITAL_DATA_DIR
+DATA_DIR = os.environ.get("HOSPITAL_DATA_DIR", "data")
+# admissions, billing and doctors are sharded under data/facilities/<Facility_ID>/
+FACILITIES_DIR = "facilities"
+SHARDED_TABLES = ['admissions', 'billing', 'doctors']
+
+
+def list_facilities(data_dir=None):
+    facilities_dir = os.path.join(data_dir or DATA_DIR, FACILITIES_DIR)
+    if not os.path.isdir(facilities_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(facilities_dir)
+        if os.path.isdir(os.path.join(facilities_dir, name))
+    )
+
+
+def table_paths(table, data_dir=None, facility=None):
+    # shard files for one table; falls back to the single-hospital flat layout
+    data_dir = data_dir or DATA_DIR
+    if table not in SHARDED_TABLES:
+        return [os.path.join(data_dir, f"{table}.csv")]
+    facilities = [facility] if facility is not None else list_facilities(data_dir)
+    if not facilities:
+        return [os.path.join(data_dir, f"{table}.csv")]
+    return [os.path.join(data_dir, FACILITIES_DIR, f, f"{table}.csv") for f in facilities]
+
+
+def read_table(table, data_dir=None, facility=None):
+    frames = [pd.read_csv(path) for path in table_paths(table, data_dir, facility)]
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def quarantine_dir(data_dir=None, facility=None):
+    return os.path.join(data_dir or DATA_DIR, "quarantine", facility or "all")
+
+
+def load_tables(data_dir=None, facility=None, validate=True):
+    patients = read_table('patients', data_dir)
+    admissions = read_table('admissions', data_dir, facility)
+    billing = read_table('billing', data_dir, facility)
+    doctors = read_table('doctors', data_dir, facility)
+
+    admissions['Admission_date'] = pd.to_datetime(admissions['Admission_date'])
+    admissions['Discharge_date'] = pd.to_datetime(admissions['Discharge_date'])
+    admissions['Length_of_stay'] = (admissions['Discharge_date'] - admissions['Admission_date']).dt.days
+
+    if validate:
+        # invalid rows never reach the analytics, they are written to data/quarantine/
+        (patients, admissions, billing, doctors), quarantine, summary = validate_tables(
+            patients, admissions, billing, doctors
+        )
+        write_quarantine(quarantine, summary, quarantine_dir(data_dir, facility))
+    return patients, admissions, billing, doctors
+
+
+def join_positions(fact_keys, dim_keys):
+    # row position in the dimension for every fact key, -1 where there is no match.
+    # Dense integer ids use a direct lookup array, sparse ids fall back to a hash index.
+    fact_keys = np.asarray(fact_keys)
+    dim_keys = np.asarray(dim_keys)
+    if len(dim_keys) == 0:
+        return np.full(len(fact_keys), -1, dtype=np.int64)
+    if (np.issubdtype(dim_keys.dtype, np.integer) and np.issubdtype(fact_keys.dtype, np.integer)
+            and dim_keys.min() >= 0 and dim_keys.max() <= 4 * len(dim_keys) + 1024):
+        lookup = np.full(int(dim_keys.max()) + 1, -1, dtype=np.int64)
+        lookup[dim_keys] = np.arange(len(dim_keys))
+        in_range = (fact_keys >= 0) & (fact_keys < len(lookup))
+        return np.where(in_range, lookup[np.clip(fact_keys, 0, len(lookup) - 1)], -1)
+    return pd.Index(dim_keys).get_indexer(fact_keys)
+
+
+def take_columns(dim, positions, columns):
+    # gather dimension columns by position, missing rows become NA like a left merge
+    has_missing = (positions < 0).any()
+    return {col: dim[col].array.take(positions, allow_fill=has_missing) for col in columns}
+
+
+def merge_tables(admissions, patients, billing, patient_columns=None, billing_columns=None):
+    # left join of admissions with the patient and billing dimensions through positional
+    # indexes; only the requested dimension columns are materialized (default: all)
+    patient_columns = [c for c in (patient_columns if patient_columns is not None else patients.columns)
+                       if c != 'Patient_ID']
+    # billing carries the same Facility_ID as its admission
+    billing_columns = [c for c in (billing_columns if billing_columns is not None else billing.columns)
+                       if c not in ('Admission_ID', 'Facility_ID')]
+
+    columns = {col: admissions[col].array for col in admissions.columns}
+    columns.update(take_columns(
+        patients, join_positions(admissions['Patient_ID'].to_numpy(), patients['Patient_ID'].to_numpy()),
+        patient_columns
+    ))
+    columns.update(take_columns(
+        billing, join_positions(admissions['Admission_ID'].to_numpy(), billing['Admission_ID'].to_numpy()),
+        billing_columns
+    ))
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_data(data_dir=None, facility=None):
+    patients, admissions, billing, doctors = load_tables(data_dir, facility)
+    df = merge_tables(admissions, patients, billing)
+    return df, patients, admissions, billing, doctors
@@ -0,0 +1,145 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Data-quality stage run on every load: each rule is one vectorized column
+# expression, rows failing any rule are quarantined with the rule names.
+
+DEPARTMENTS = ['Cardiology', 'Neurology', 'General Medicine', 'Orthopedics', 'Emergency',
+               'Gynecology', 'Dermatology', 'Psychiatry', 'Radiology']
+BED_TYPES = ['General', 'ICU']
+ADMISSION_TYPES = ['Emergency', 'OPD']
+GENDERS = ['Male', 'Female', 'Other']
+INSURANCE_VALUES = ['Yes', 'No']
+CLAIM_STATUSES = ['Approved', 'Rejected']
+
+MAX_AGE = 120
+MAX_CHRONIC_CONDITIONS = 10
+MAX_LENGTH_OF_STAY = 365
+
+
+def _nulls(df, cols):
+    return {f"null_{col}": df[col].isna() for col in cols if col in df.columns}
+
+
+def _range(df, col, low, high):
+    # nulls are reported by the null rule only
+    values = df[col]
+    return {f"range_{col}": values.notna() & ~values.between(low, high)}
+
+
+def _enum(df, col, allowed):
+    values = df[col]
+    return {f"enum_{col}": values.notna() & ~values.isin(allowed)}
+
+
+def _foreign_key(df, col, keys, target):
+    # Series.isin against an Index is a hash-table lookup
+    values = df[col]
+    return {f"fk_{col}_{target}": values.notna() & ~values.isin(pd.Index(keys).unique())}
+
+
+def patient_rules(patients):
+    rules = _nulls(patients, ['Patient_ID', 'Age', 'Gender', 'Chronic_conditions', 'Admission_type'])
+    rules['duplicate_Patient_ID'] = patients['Patient_ID'].duplicated(keep='first')
+    rules.update(_range(patients, 'Age', 0, MAX_AGE))
+    rules.update(_range(patients, 'Chronic_conditions', 0, MAX_CHRONIC_CONDITIONS))
+    rules.update(_enum(patients, 'Gender', GENDERS))
+    rules.update(_enum(patients, 'Admission_type', ADMISSION_TYPES))
+    return rules
+
+
+def admission_rules(admissions, patient_ids, doctor_ids=None):
+    rules = _nulls(admissions, ['Admission_ID', 'Patient_ID', 'Admission_date', 'Discharge_date',
+                                'Department', 'Bed_type', 'readmitted_30_days'])
+    rules['duplicate_Admission_ID'] = admissions['Admission_ID'].duplicated(keep='first')
+    rules.update(_range(admissions, 'Length_of_stay', 1, MAX_LENGTH_OF_STAY))
+    rules.update(_enum(admissions, 'Department', DEPARTMENTS))
+    rules.update(_enum(admissions, 'Bed_type', BED_TYPES))
+    rules.update(_enum(admissions, 'readmitted_30_days', [0, 1]))
+    rules.update(_foreign_key(admissions, 'Patient_ID', patient_ids, 'patients'))
+    if doctor_ids is not None and 'Doctor_ID' in admissions.columns:
+        rules.update(_foreign_key(admissions, 'Doctor_ID', doctor_ids, 'doctors'))
+    return rules
+
+
+def billing_rules(billing, admission_ids):
+    rules = _nulls(billing, ['Admission_ID', 'Total_charges', 'Insurance_covered', 'Claim_status'])
+    rules['duplicate_Admission_ID'] = billing['Admission_ID'].duplicated(keep='first')
+    rules.update(_range(billing, 'Total_charges', 0, np.inf))
+    rules.update(_enum(billing, 'Insurance_covered', INSURANCE_VALUES))
+    rules.update(_enum(billing, 'Claim_status', CLAIM_STATUSES))
+    rules.update(_foreign_key(billing, 'Admission_ID', admission_ids, 'admissions'))
+    return rules
+
+
+def doctor_rules(doctors):
+    rules = _nulls(doctors, ['Doctor_ID', 'Department', 'Avg_consult_time'])
+    rules['duplicate_Doctor_ID'] = doctors['Doctor_ID'].duplicated(keep='first')
+    rules.update(_enum(doctors, 'Department', DEPARTMENTS))
+    rules.update(_range(doctors, 'Avg_consult_time', 1, 24 * 60))
+    return rules
+
+
+def apply_rules(df, rules, table):
+    # returns (clean rows, quarantined rows with a Violations column, per-rule counts)
+    names = list(rules)
+    if not names or df.empty:
+        empty = df.iloc[0:0].assign(Violations=pd.Series(dtype=str))
+        return df, empty, pd.DataFrame({'Table': table, 'Rule': names, 'Failed_rows': 0})
+    masks = np.column_stack([np.asarray(rules[name], dtype=bool) for name in names])
+    bad = masks.any(axis=1)
+
+    quarantine = df[bad].copy()
+    failed = masks[bad]
+    violations = pd.Series('', index=quarantine.index)
+    for j, name in enumerate(names):
+        violations = violations + np.where(failed[:, j], name + ';', '')
+    quarantine['Violations'] = violations.str.rstrip(';')
+
+    summary = pd.DataFrame({'Table': table, 'Rule': names, 'Failed_rows': masks.sum(axis=0)})
+    return df[~bad], quarantine, summary
+
+
+def validate_tables(patients, admissions, billing, doctors):
+    # cascade: admissions are checked against valid patients, billing against valid admissions
+    patients, bad_patients, s1 = apply_rules(patients, patient_rules(patients), 'patients')
+    doctors, bad_doctors, s2 = apply_rules(doctors, doctor_rules(doctors), 'doctors')
+    admissions, bad_admissions, s3 = apply_rules(
+        admissions, admission_rules(admissions, patients['Patient_ID'], doctors['Doctor_ID']), 'admissions'
+    )
+    billing, bad_billing, s4 = apply_rules(
+        billing, billing_rules(billing, admissions['Admission_ID']), 'billing'
+    )
+    quarantine = {
+        'patients': bad_patients,
+        'admissions': bad_admissions,
+        'billing': bad_billing,
+        'doctors': bad_doctors
+    }
+    summary = pd.concat([s1, s2, s3, s4], ignore_index=True)
+    return (patients, admissions, billing, doctors), quarantine, summary
+
+
+def write_quarantine(quarantine, summary, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for table, rows in quarantine.items():
+        path = os.path.join(out_dir, f"{table}.csv")
+        if len(rows):
+            rows.to_csv(path, index=False)
+        elif os.path.exists(path):
+            os.remove(path)
+    summary.to_csv(os.path.join(out_dir, "summary.csv"), index=False)
+
+
+if __name__ == "__main__":
+    import time
+    from data_loader import load_tables, quarantine_dir
+
+    start = time.perf_counter()
+    tables = load_tables(validate=False)
+    _, quarantine, summary = validate_tables(*tables)
+    write_quarantine(quarantine, summary, quarantine_dir())
+    print(summary[summary['Failed_rows'] > 0].to_string(index=False) if summary['Failed_rows'].any()
+          else "All rules passed.")
+    print(f"Validated {sum(len(t) for t in tables):,} rows in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,77 @@
+import pandas as pd
+import numpy as np
+
+
+def daily_doctor_load(admissions, doctors):
+    # per doctor and day: new admissions, discharges, patients under care and consult minutes
+    adm = admissions.dropna(subset=['Doctor_ID'])
+    doctor_ids = adm['Doctor_ID'].astype('int64').to_numpy()
+    start = pd.to_datetime(adm['Admission_date']).dt.normalize().to_numpy()
+    end = pd.to_datetime(adm['Discharge_date']).dt.normalize().to_numpy()
+
+    # one +1 event per admission day and one -1 event per discharge day
+    events = pd.DataFrame({
+        'Doctor_ID': np.concatenate([doctor_ids, doctor_ids]),
+        'Date': np.concatenate([start, end]),
+        'Admitted': np.concatenate([np.ones(len(adm), dtype='int64'), np.zeros(len(adm), dtype='int64')]),
+        'Discharged': np.concatenate([np.zeros(len(adm), dtype='int64'), np.ones(len(adm), dtype='int64')])
+    })
+    if events.empty:
+        return pd.DataFrame(columns=['Doctor_ID', 'Date', 'New_admissions', 'Discharges',
+                                     'Concurrent_patients', 'Consult_minutes'])
+
+    daily = events.groupby(['Date', 'Doctor_ID'], sort=True)[['Admitted', 'Discharged']].sum()
+
+    # dense day x doctor grid so the running census can be taken with a single cumsum per column
+    all_days = pd.date_range(daily.index.get_level_values('Date').min(),
+                             daily.index.get_level_values('Date').max(), freq='D')
+    admitted = daily['Admitted'].unstack('Doctor_ID', fill_value=0).reindex(all_days, fill_value=0)
+    discharged = daily['Discharged'].unstack('Doctor_ID', fill_value=0).reindex(all_days, fill_value=0)
+    census_end = (admitted - discharged).cumsum()
+    # patients seen during the day = still in bed at day end + discharged that day
+    concurrent = census_end + discharged
+
+    load = pd.DataFrame({
+        'New_admissions': admitted.stack(),
+        'Discharges': discharged.stack(),
+        'Concurrent_patients': concurrent.stack()
+    })
+    load.index.names = ['Date', 'Doctor_ID']
+    load = load[(load['Concurrent_patients'] > 0) | (load['New_admissions'] > 0)].reset_index()
+
+    # one consult per patient under care per day
+    consult_time = doctors.set_index('Doctor_ID')['Avg_consult_time']
+    load['Consult_minutes'] = load['Concurrent_patients'] * load['Doctor_ID'].map(consult_time).fillna(0).to_numpy()
+    return load[['Doctor_ID', 'Date', 'New_admissions', 'Discharges',
+                 'Concurrent_patients', 'Consult_minutes']]
+
+
+def doctor_workload_summary(daily_load, doctors):
+    # one row per doctor with the workload derived from the admissions they handled
+    summary = daily_load.groupby('Doctor_ID').agg(
+        Patients_handled=('New_admissions', 'sum'),
+        Active_days=('Date', 'count'),
+        Avg_daily_patients=('Concurrent_patients', 'mean'),
+        Peak_concurrent=('Concurrent_patients', 'max'),
+        Avg_daily_consult_min=('Consult_minutes', 'mean')
+    )
+    result = doctors.drop(columns=['Patients_handled'], errors='ignore').merge(
+        summary, left_on='Doctor_ID', right_index=True, how='left'
+    )
+    fill = ['Patients_handled', 'Active_days', 'Avg_daily_patients', 'Peak_concurrent', 'Avg_daily_consult_min']
+    result[fill] = result[fill].fillna(0)
+    result[['Patients_handled', 'Active_days', 'Peak_concurrent']] = (
+        result[['Patients_handled', 'Active_days', 'Peak_concurrent']].astype('int64')
+    )
+    return result
+
+
+def department_daily_load(daily_load, doctors):
+    # department level daily totals, used for the workload trend chart
+    dept = daily_load['Doctor_ID'].map(doctors.set_index('Doctor_ID')['Department'])
+    return (
+        daily_load.assign(Department=dept.to_numpy())
+        .groupby(['Department', 'Date'], sort=True)[['New_admissions', 'Concurrent_patients', 'Consult_minutes']]
+        .sum()
+        .reset_index()
+    )
@@ -0,0 +1,216 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_DIR
+from data_validation import DEPARTMENTS, BED_TYPES, INSURANCE_VALUES, MAX_AGE, MAX_CHRONIC_CONDITIONS
+
+# Feature drift against the training reference. Every feature has fixed bins, so a
+# histogram is a small count vector: batches are binned once on ingest and added to
+# the running totals, and PSI / KS are computed from the counts alone - history is
+# never rescanned. Batches follow the columnar data generations: when a generation only
+# appended admissions to the one binned last, just the new rows are binned; when earlier
+# rows were changed (a regenerated or corrected drop, even one reusing the same ids) the
+# whole table is re-binned and replaces the running totals.
+
+NUMERIC_BINS = {
+    'Age': np.arange(0, MAX_AGE + 5, 5),
+    'Length_of_stay': np.r_[np.arange(0, 31), 45, 60, 90, 180, 366],
+    'Chronic_conditions': np.arange(0, MAX_CHRONIC_CONDITIONS + 2)
+}
+CATEGORY_BINS = {
+    'Department': DEPARTMENTS,
+    'Bed_type': BED_TYPES,
+    'Insurance_covered': INSURANCE_VALUES
+}
+DRIFT_FEATURES = list(NUMERIC_BINS) + list(CATEGORY_BINS)
+STATE_FILE = os.path.join("monitoring", "drift_state.json")
+# usual PSI reading: < 0.1 stable, 0.1 - 0.25 moderate shift, > 0.25 significant shift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+MAX_BATCHES = 500
+
+
+def state_path(data_dir=None):
+    return os.path.join(data_dir or DATA_DIR, STATE_FILE)
+
+
+def bin_labels(feature):
+    if feature in CATEGORY_BINS:
+        return CATEGORY_BINS[feature] + ['Other']
+    edges = NUMERIC_BINS[feature]
+    # last bin is open-ended, values below the first edge land in the first bin
+    return [f"{edges[i]}-{edges[i + 1]}" for i in range(len(edges) - 1)] + [f"{edges[-1]}+"]
+
+
+def histogram(values, feature):
+    # counts per fixed bin, nulls are not counted
+    values = pd.Series(values)
+    values = values[values.notna()]
+    if feature in CATEGORY_BINS:
+        codes = pd.Categorical(values, categories=CATEGORY_BINS[feature]).codes
+        # unknown categories (-1) go to the trailing Other bin
+        codes = np.where(codes < 0, len(CATEGORY_BINS[feature]), codes)
+        return np.bincount(codes, minlength=len(CATEGORY_BINS[feature]) + 1)
+    edges = NUMERIC_BINS[feature]
+    index = np.clip(np.searchsorted(edges, values.to_numpy(dtype=float), side='right') - 1, 0, len(edges) - 1)
+    return np.bincount(index, minlength=len(edges))
+
+
+def histograms(df):
+    return {f: histogram(df[f], f) for f in DRIFT_FEATURES if f in df.columns}
+
+
+def psi(reference, current, eps=1e-4):
+    ref = np.asarray(reference, dtype=float)
+    cur = np.asarray(current, dtype=float)
+    if ref.sum() == 0 or cur.sum() == 0:
+        return np.nan
+    ref = np.maximum(ref / ref.sum(), eps)
+    cur = np.maximum(cur / cur.sum(), eps)
+    return float(np.sum((cur - ref) * np.log(cur / ref)))
+
+
+def ks(reference, current):
+    # KS distance between the binned distributions (numeric features only)
+    ref = np.asarray(reference, dtype=float)
+    cur = np.asarray(current, dtype=float)
+    if ref.sum() == 0 or cur.sum() == 0:
+        return np.nan
+    return float(np.abs(np.cumsum(ref) / ref.sum() - np.cumsum(cur) / cur.sum()).max())
+
+
+def drift_stats(reference, current):
+    return {
+        'psi': {f: psi(reference[f], current[f]) for f in current if f in reference},
+        'ks': {f: ks(reference[f], current[f]) for f in current if f in reference and f in NUMERIC_BINS}
+    }
+
+
+def _as_lists(hists):
+    return {f: [int(c) for c in counts] for f, counts in hists.items()}
+
+
+def empty_state():
+    return {'reference': None, 'reference_rows': 0, 'reference_set_at': None,
+            'cumulative': None, 'watermark': None, 'generation': None, 'rows': 0, 'batches': []}
+
+
+def load_state(data_dir=None):
+    path = state_path(data_dir)
+    if not os.path.exists(path):
+        return empty_state()
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, data_dir=None):
+    path = state_path(data_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def set_reference(df, data_dir=None):
+    # training distribution the batches are compared with; resets the running totals
+    state = load_state(data_dir)
+    state.update({
+        'reference': _as_lists(histograms(df)),
+        'reference_rows': int(len(df)),
+        'reference_set_at': datetime.now().isoformat(timespec='seconds'),
+        'cumulative': None,
+        'batches': []
+    })
+    save_state(state, data_dir)
+    return state
+
+
+def _new_rows(state, df, previous, appended_from, id_column):
+    # (rows to bin, whether they replace the running totals)
+    if state.get('generation') is None:
+        # nothing binned yet, or a state from before generations were tracked
+        if state['watermark'] is None:
+            return df, False
+        return df[df[id_column] > state['watermark']], False
+    if state['generation'] == previous and appended_from is not None and appended_from == state.get('rows'):
+        return df.iloc[appended_from:], False
+    return df, True
+
+
+def update_drift(df, data_dir=None, generation=None, previous=None, appended_from=None, id_column='Admission_ID'):
+    # bin the admissions new since the last binned generation as one batch (see above);
+    # previous / appended_from come from the ingest, the first batch seeds the reference
+    state = load_state(data_dir)
+    if generation is not None and generation == state.get('generation'):
+        return state
+    rows, rebinned = _new_rows(state, df, previous, appended_from, id_column)
+    state.update({'generation': generation, 'rows': int(len(df))})
+    if len(df):
+        state['watermark'] = int(df[id_column].max())
+    if rows.empty:
+        save_state(state, data_dir)
+        return state
+    batch = histograms(rows)
+
+    if state['reference'] is None:
+        state.update({'reference': _as_lists(batch), 'reference_rows': int(len(rows)),
+                      'reference_set_at': datetime.now().isoformat(timespec='seconds')})
+        save_state(state, data_dir)
+        return state
+
+    if rebinned:
+        cumulative = _as_lists(batch)
+    else:
+        cumulative = state['cumulative'] or {f: [0] * len(c) for f, c in batch.items()}
+        cumulative = {f: (np.asarray(cumulative[f]) + batch[f]).tolist() for f in batch}
+    state['cumulative'] = cumulative
+    state['batches'].append({
+        'batch': len(state['batches']) + 1,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'rows': int(len(rows)),
+        'rebinned': rebinned,
+        'stats': {
+            'batch': drift_stats(state['reference'], batch),
+            'cumulative': drift_stats(state['reference'], cumulative)
+        }
+    })
+    state['batches'] = state['batches'][-MAX_BATCHES:]
+    save_state(state, data_dir)
+    return state
+
+
+def drift_report(state, scope='cumulative'):
+    # one row per feature for the latest batch
+    if not state['batches']:
+        return pd.DataFrame(columns=['Feature', 'PSI', 'KS', 'Status'])
+    stats = state['batches'][-1]['stats'][scope]
+    report = pd.DataFrame({
+        'Feature': list(stats['psi']),
+        'PSI': list(stats['psi'].values()),
+        'KS': [stats['ks'].get(f, np.nan) for f in stats['psi']]
+    })
+    report['Status'] = np.select(
+        [report['PSI'] >= PSI_SIGNIFICANT, report['PSI'] >= PSI_MODERATE],
+        ['Significant shift', 'Moderate shift'], 'Stable'
+    )
+    return report
+
+
+def drift_history(state, scope='batch'):
+    # long table Timestamp / Feature / PSI over all recorded batches
+    rows = [{'Batch': b['batch'], 'Timestamp': b['timestamp'], 'Rows': b['rows'], 'Feature': f, 'PSI': v}
+            for b in state['batches'] for f, v in b['stats'][scope]['psi'].items()]
+    return pd.DataFrame(rows, columns=['Batch', 'Timestamp', 'Rows', 'Feature', 'PSI'])
+
+
+if __name__ == "__main__":
+    state = load_state()
+    if not state['batches']:
+        print("No drift batches recorded yet.")
+    else:
+        print(drift_report(state).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
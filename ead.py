@@ -1,59 +1,309 @@
-import pandas as pd
+import argparse
+import base64
+import io
+import multiprocessing
+import os
+import time
+from datetime import datetime
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-sns.set(style="whitegrid")
-# Load the datasets
-patients=pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/patients.csv")
-admissions=pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/admissions.csv")
-doctors=pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/doctors.csv")
-billing=pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/billing.csv")
-
-print(patients.head())
-print(admissions.head())
-
-print(patients.info())
-print(patients.describe())
-print(patients.isnull().sum())
-
-admissions['Admission_date'] = pd.to_datetime(admissions['Admission_date'])
-admissions['Discharge_date'] = pd.to_datetime(admissions['Discharge_date'])
-
-admissions['Length_of_stay'] = (
-    admissions['Discharge_date'] - admissions['Admission_date']
-).dt.days
-admissions = admissions[admissions['Length_of_stay'] > 0]#filtering out erroneous data where discharge date is before admission date
-print(admissions['Length_of_stay'].describe())
-
-# Merge datasets for comprehensive analysis
-df= (admissions.merge(patients, on='Patient_ID',how="left")
-    .merge(billing, on='Admission_ID',how="left"))
-print(df.head())
-print(df.info())
-
-#EDA
-plt.figure(figsize=(8,4))
-sns.histplot(df['Age'], bins=30, kde=True)
-plt.title("Patient Age Distribution")
-plt.show()
-
-plt.figure(figsize=(8,4))
-sns.countplot(data=df, x='Department')
-plt.xticks(rotation=45)
-plt.title("Admissions by Department")
-plt.show()
-
-df['Bed_type'].value_counts(normalize=True) * 100
-
-plt.figure(figsize=(6,4))
-sns.boxplot(x='readmitted_30_days', y='Length_of_stay', data=df)
-plt.title("Length of Stay vs Readmission")
-plt.show()
-
-plt.figure(figsize=(8,4))
-sns.histplot(df['Total_charges'], bins=30, kde=True)
-plt.title("Hospital Charges Distribution")
-plt.show()
-
-df['Claim_status'].value_counts(normalize=True) * 100
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+
+from data_loader import DATA_DIR, load_tables, merge_tables
+
+# Headless EDA report: every column is profiled once with vectorized numpy/pandas
+# operations (KDEs use a reservoir sample instead of the full column), the figures
+# are rendered on the Agg backend in worker processes from those small summaries,
+# and everything is written into one self-contained HTML file.
+
+SAMPLE_SIZE = 10_000
+BINS = 30
+TOP_VALUES = 15
+CHUNK_ROWS = 1_000_000
+# seconds for a full run; columns and figures not finished in time are listed as skipped
+TIME_BUDGET = 120
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+class Reservoir:
+    # uniform sample of a stream fed chunk by chunk (algorithm R, vectorized per chunk)
+    def __init__(self, size=SAMPLE_SIZE, seed=42):
+        self.size = size
+        self.sample = np.empty(0)
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        fill = min(self.size - len(self.sample), len(values))
+        if fill > 0:
+            self.sample = np.r_[self.sample, values[:fill]]
+        rest = values[max(fill, 0):]
+        if len(rest):
+            # item i of the stream (1-based) replaces a random slot with probability size / i;
+            # with repeated slots the later item wins, as in the sequential algorithm
+            position = self.seen + max(fill, 0) + np.arange(1, len(rest) + 1)
+            slot = (self._rng.random(len(rest)) * position).astype(np.int64)
+            accepted = slot < self.size
+            self.sample[slot[accepted]] = rest[accepted]
+        self.seen += len(values)
+        return self
+
+
+def profile_numeric(series, bins=BINS, sample_size=SAMPLE_SIZE):
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    profile = {'kind': 'numeric', 'count': int(len(valid)), 'nulls': int(len(values) - len(valid)),
+               'distinct': int(series.nunique())}
+    if len(valid) == 0:
+        return profile
+    reservoir = Reservoir(sample_size)
+    for start in range(0, len(valid), CHUNK_ROWS):
+        reservoir.add(valid[start:start + CHUNK_ROWS])
+    low, high = valid.min(), valid.max()
+    # integer-valued columns with a small range get one bin per value
+    if np.all(valid == np.round(valid)) and high - low < 60:
+        edges = np.arange(low, high + 2) - 0.5
+    else:
+        edges = np.linspace(low, high if high > low else low + 1, bins + 1)
+    counts, edges = np.histogram(valid, bins=edges)
+    profile.update({
+        'mean': float(valid.mean()), 'std': float(valid.std(ddof=1)) if len(valid) > 1 else 0.0,
+        'min': float(low), 'max': float(high),
+        'quantiles': dict(zip(QUANTILES, np.quantile(valid, QUANTILES).tolist())),
+        'hist_counts': counts, 'hist_edges': edges, 'sample': reservoir.sample
+    })
+    return profile
+
+
+def profile_categorical(series, top=TOP_VALUES):
+    counts = series.value_counts(dropna=True)
+    return {'kind': 'categorical', 'count': int(counts.sum()), 'nulls': int(series.isna().sum()),
+            'distinct': int(len(counts)), 'top': counts.head(top)}
+
+
+def profile_datetime(series):
+    values = pd.to_datetime(series)
+    valid = values.dropna()
+    monthly = valid.dt.to_period('M').value_counts().sort_index()
+    return {'kind': 'datetime', 'count': int(len(valid)), 'nulls': int(values.isna().sum()),
+            'distinct': int(valid.nunique()), 'min': valid.min(), 'max': valid.max(), 'monthly': monthly}
+
+
+def profile_column(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return profile_datetime(series)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return profile_numeric(series)
+    return profile_categorical(series)
+
+
+def profile_tables(tables, deadline):
+    # {table: {column: profile}}, columns reached after the deadline are skipped
+    profiles, skipped = {}, []
+    for name, table in tables.items():
+        profiles[name] = {}
+        for col in table.columns:
+            if time.perf_counter() > deadline:
+                skipped.append(f"{name}.{col}")
+                continue
+            profiles[name][col] = profile_column(table[col])
+    return profiles, skipped
+
+
+def _kde(sample, grid):
+    # gaussian KDE of the reservoir sample with Scott's bandwidth
+    std = sample.std()
+    if len(sample) < 2 or std == 0:
+        return np.zeros_like(grid)
+    bandwidth = std * len(sample) ** (-1 / 5)
+    z = (grid[:, None] - sample[None, :]) / bandwidth
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(sample) * bandwidth * np.sqrt(2 * np.pi))
+
+
+def figure_specs(profiles):
+    # small, picklable payloads - the figures are drawn from summaries, not from the data
+    specs = []
+    merged = profiles.get('merged', {})
+    for col, p in merged.items():
+        if col.endswith('_ID') and p['kind'] != 'categorical':
+            continue
+        if p['kind'] == 'numeric' and p['count']:
+            specs.append({'kind': 'hist', 'title': f"{col} Distribution", 'xlabel': col,
+                          'counts': p['hist_counts'], 'edges': p['hist_edges'], 'sample': p['sample']})
+        elif p['kind'] == 'categorical' and p['count']:
+            specs.append({'kind': 'bar', 'title': f"{col} Counts", 'xlabel': col,
+                          'labels': [str(v) for v in p['top'].index], 'values': p['top'].to_numpy()})
+        elif p['kind'] == 'datetime' and p['count']:
+            specs.append({'kind': 'bar', 'title': f"{col} per Month", 'xlabel': col,
+                          'labels': [str(v) for v in p['monthly'].index], 'values': p['monthly'].to_numpy()})
+    return specs
+
+
+def box_spec(df, value, group, title):
+    # five-number summaries per group for Axes.bxp
+    stats = []
+    for key, values in df.groupby(group)[value]:
+        q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        stats.append({'label': str(key), 'med': med, 'q1': q1, 'q3': q3, 'mean': values.mean(),
+                      'whislo': inside.min(), 'whishi': inside.max(), 'fliers': []})
+    return {'kind': 'box', 'title': title, 'xlabel': group, 'ylabel': value, 'stats': stats}
+
+
+def render_figure(spec):
+    # runs in a worker process; returns the title and a base64 PNG
+    fig = Figure(figsize=(7, 4), dpi=100)
+    ax = fig.add_subplot()
+    if spec['kind'] == 'hist':
+        edges, counts = spec['edges'], spec['counts']
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='#3498db', edgecolor='white')
+        if len(spec['sample']):
+            grid = np.linspace(edges[0], edges[-1], 200)
+            # scale the density to the histogram's counts
+            ax.plot(grid, _kde(spec['sample'], grid) * counts.sum() * np.diff(edges).mean(), color='#e74c3c')
+        ax.set_ylabel("Count")
+    elif spec['kind'] == 'bar':
+        ax.bar(range(len(spec['values'])), spec['values'], color='#3498db')
+        ax.set_xticks(range(len(spec['labels'])), spec['labels'], rotation=45, ha='right')
+        ax.set_ylabel("Count")
+    elif spec['kind'] == 'box':
+        ax.bxp(spec['stats'], showmeans=True, showfliers=False)
+        ax.set_ylabel(spec['ylabel'])
+    ax.set_title(spec['title'])
+    ax.set_xlabel(spec['xlabel'])
+    ax.grid(axis='y', color='#ecf0f1')
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return spec['title'], base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def render_figures(specs, workers, deadline):
+    # [(title, png)] in spec order, plus the titles that did not finish before the deadline;
+    # renders still running at the deadline are stopped by terminating the worker processes
+    pool = multiprocessing.Pool(processes=workers)
+    try:
+        results = [pool.apply_async(render_figure, (spec,)) for spec in specs]
+        for result in results:
+            result.wait(max(deadline - time.perf_counter(), 0))
+        images = [r.get() for r in results if r.ready()]
+        skipped = [spec['title'] for spec, r in zip(specs, results) if not r.ready()]
+    finally:
+        pool.terminate()
+        pool.join()
+    return images, skipped
+
+
+def _fmt(value):
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, (int, np.integer)):
+        return f"{value:,}"
+    return str(value)
+
+
+def profile_frames(profiles):
+    # summary tables per table: numeric columns and other columns
+    frames = {}
+    for table, columns in profiles.items():
+        numeric = [{
+            'Column': col, 'Count': p['count'], 'Nulls': p['nulls'], 'Distinct': p['distinct'],
+            'Mean': p.get('mean'), 'Std': p.get('std'), 'Min': p.get('min'),
+            **{f"P{int(q * 100)}": v for q, v in p.get('quantiles', {}).items()},
+            'Max': p.get('max')
+        } for col, p in columns.items() if p['kind'] == 'numeric']
+        other = [{
+            'Column': col, 'Count': p['count'], 'Nulls': p['nulls'], 'Distinct': p['distinct'],
+            'Top / Range': (", ".join(f"{k} ({v:,})" for k, v in p['top'].head(5).items())
+                            if p['kind'] == 'categorical' else f"{p['min']} - {p['max']}")
+        } for col, p in columns.items() if p['kind'] != 'numeric']
+        frames[table] = (pd.DataFrame(numeric), pd.DataFrame(other))
+    return frames
+
+
+def write_html(path, overview, profiles, images, meta, skipped):
+    parts = [
+        "<html><head><meta charset='utf-8'><title>Hospital EDA Report</title>",
+        "<style>body{font-family:sans-serif;margin:30px;color:#2c3e50}"
+        "h2{border-bottom:3px solid #3498db;padding-bottom:6px}"
+        "table{border-collapse:collapse;margin-bottom:20px}"
+        "td,th{border:1px solid #ecf0f1;padding:4px 10px;text-align:right}"
+        "th{background:#3498db;color:white}"
+        ".figures{display:flex;flex-wrap:wrap;gap:10px}"
+        ".figures img{border:1px solid #ecf0f1;max-width:100%}</style></head><body>",
+        f"<h1>Hospital EDA Report</h1><p>Data: {meta['data_dir']} | Facility: {meta['facility']} | "
+        f"Generated: {meta['generated_at']} | Runtime: {meta['runtime']:.1f}s of {meta['time_budget']}s budget</p>",
+        "<h2>Dataset Overview</h2>",
+        overview.to_html(index=False, float_format=lambda x: f"{x:,.2f}")
+    ]
+    for table, (numeric, other) in profile_frames(profiles).items():
+        parts.append(f"<h2>{table.title()} Columns</h2>")
+        if len(numeric):
+            parts.append(numeric.to_html(index=False, na_rep="", float_format=lambda x: f"{x:,.2f}"))
+        if len(other):
+            parts.append(other.to_html(index=False, na_rep=""))
+    parts.append("<h2>Figures</h2><div class='figures'>")
+    parts.extend(f"<img alt='{title}' src='data:image/png;base64,{png}'>" for title, png in images)
+    parts.append("</div>")
+    if skipped:
+        parts.append("<h2>Skipped (time budget)</h2><p>" + ", ".join(skipped) + "</p>")
+    parts.append("</body></html>")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(parts))
+
+
+def build_report(out, data_dir=None, facility=None, workers=4, time_budget=TIME_BUDGET):
+    start = time.perf_counter()
+    deadline = start + time_budget
+    patients, admissions, billing, doctors = load_tables(data_dir, facility)
+    df = merge_tables(admissions, patients, billing)
+    tables = {'patients': patients, 'admissions': admissions, 'billing': billing,
+              'doctors': doctors, 'merged': df}
+
+    overview = pd.DataFrame([{
+        'Table': name, 'Rows': len(t), 'Columns': t.shape[1],
+        'Null cells': int(t.isna().to_numpy().sum()),
+        'Memory (MB)': t.memory_usage(deep=True).sum() / 1e6
+    } for name, t in tables.items()])
+
+    profiles, skipped = profile_tables(tables, deadline)
+    specs = figure_specs(profiles)
+    if time.perf_counter() < deadline:
+        specs.append(box_spec(df, 'Length_of_stay', 'readmitted_30_days', "Length of Stay vs Readmission"))
+    images, skipped_figures = render_figures(specs, workers, deadline)
+
+    meta = {
+        'data_dir': data_dir or DATA_DIR,
+        'facility': facility or "ALL",
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'runtime': time.perf_counter() - start,
+        'time_budget': time_budget
+    }
+    write_html(out, overview, profiles, images, meta, skipped + skipped_figures)
+    return out, skipped + skipped_figures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile a data drop and write a self-contained HTML EDA report.")
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--facility", default=None, help="profile a single facility shard")
+    parser.add_argument("--out", default=os.path.join("reports", "eda_report.html"))
+    parser.add_argument("--workers", type=int, default=4, help="processes rendering figures")
+    parser.add_argument("--time-budget", type=float, default=TIME_BUDGET, help="seconds for the whole run")
+    args = parser.parse_args(argv)
+
+    path, skipped = build_report(args.out, args.data_dir, args.facility, args.workers, args.time_budget)
+    print("Written:", path)
+    if skipped:
+        print(f"Skipped {len(skipped)} items to stay within the time budget:", ", ".join(skipped))
+
+
+if __name__ == "__main__":
+    main()
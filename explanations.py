@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Per-admission explanations of the readmission model, computed in batch.
+# Random forest: tree-path contributions - every split on a sample's path moves the
+# predicted probability by value(child) - value(parent), booked to the split feature.
+# Logistic regression: coefficient x (feature - training mean) in log-odds.
+# Both satisfy prediction = bias + sum(contributions) row by row.
+
+
+def _tree_contribution_matrix(tree, n_features):
+    # (n_nodes x n_features) sparse matrix: entering a node adds its delta to the parent's split feature
+    structure = tree.tree_
+    value = structure.value[:, 0, :]
+    positive = value[:, 1] / value.sum(axis=1)
+    parent = np.full(structure.node_count, -1)
+    children = np.r_[structure.children_left, structure.children_right]
+    parents = np.r_[np.arange(structure.node_count), np.arange(structure.node_count)]
+    is_child = children >= 0
+    parent[children[is_child]] = parents[is_child]
+
+    nodes = np.flatnonzero(parent >= 0)
+    delta = positive[nodes] - positive[parent[nodes]]
+    matrix = sparse.csr_matrix(
+        (delta, (nodes, structure.feature[parent[nodes]])), shape=(structure.node_count, n_features)
+    )
+    return matrix, positive[0]
+
+
+def forest_contributions(forest, X):
+    # (contributions n x features, bias) for the positive-class probability
+    X = np.asarray(X, dtype=np.float32)
+    n_features = X.shape[1]
+    blocks, biases = zip(*(_tree_contribution_matrix(tree, n_features) for tree in forest.estimators_))
+    # decision_path returns the node indicator of all trees side by side, so one sparse
+    # product walks every path of every tree
+    indicator, _ = forest.decision_path(X)
+    contributions = indicator @ sparse.vstack(blocks, format='csr')
+    n_trees = len(forest.estimators_)
+    return np.asarray(contributions.todense()) / n_trees, float(np.mean(biases))
+
+
+def linear_contributions(model, X, feature_means=None):
+    X = np.asarray(X, dtype=float)
+    means = np.zeros(X.shape[1]) if feature_means is None else np.asarray(feature_means, dtype=float)
+    coef = model.coef_[0]
+    return (X - means) * coef, float(model.intercept_[0] + means @ coef)
+
+
+def explain(bundle, X):
+    # contributions as a frame with the model's feature columns
+    X = X.reindex(columns=bundle['columns'], fill_value=0)
+    if bundle['model_name'] == 'rf':
+        values, bias = forest_contributions(bundle['model'], X.to_numpy())
+    else:
+        values, bias = linear_contributions(bundle['model'], X.to_numpy(), bundle.get('feature_means'))
+    return pd.DataFrame(values, columns=bundle['columns'], index=X.index), bias
+
+
+def top_factors(contributions, k=3):
+    # "Feature (+0.042); ..." for the k features that raise each row's risk the most
+    values = contributions.to_numpy()
+    names = np.asarray(contributions.columns)
+    k = min(k, values.shape[1])
+    if len(values) == 0 or k == 0:
+        return pd.Series([], dtype=str, index=contributions.index)
+    top = np.argpartition(-values, k - 1, axis=1)[:, :k]
+    top_values = np.take_along_axis(values, top, axis=1)
+    order = np.argsort(-top_values, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    top_values = np.take_along_axis(top_values, order, axis=1)
+
+    factors = pd.Series('', index=contributions.index)
+    for j in range(k):
+        # only factors that push the risk up are listed
+        label = np.where(top_values[:, j] > 0,
+                         pd.Series(names[top[:, j]]) + ' (' + pd.Series(top_values[:, j]).map('{:+.3f}'.format) + ')',
+                         '')
+        factors = factors + np.where((factors != '') & (label != ''), '; ', '') + label
+    return factors
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+import pandas as pd
+
+from data_loader import list_facilities
+from data_handle import DataHandle, ensure_columnar
+from patient_sketch import PatientSketches
+
+# Map-reduce over facility shards: every worker loads one facility and returns
+# additive partial aggregates (sums and patient sketches), the reduce step only
+# sums partials and merges sketches, so the network never has to be loaded
+# into one DataFrame. The callers are dashboard, warm-up and API server threads, so the
+# facilities are mapped on a thread pool in the calling process.
+
+PARTIAL_KEYS = ['Facility_ID', 'Department', 'Bed_type']
+SUM_COLUMNS = ['Admissions', 'LOS_sum', 'Readmissions', 'Revenue', 'Insured',
+               'Approved', 'Chronic_sum', 'Age_sum']
+NETWORK = "ALL"
+
+
+# merged columns read per shard by map_facility
+PARTIAL_COLUMNS = ['Admission_ID', 'Patient_ID', 'Facility_ID', 'Department', 'Bed_type', 'Length_of_stay',
+                   'readmitted_30_days', 'Total_charges', 'Insurance_covered', 'Claim_status',
+                   'Chronic_conditions', 'Age']
+
+
+def compute_partials(df, facility=None):
+    if 'Facility_ID' not in df.columns:
+        df = df.assign(Facility_ID=facility or NETWORK)
+    sums = (
+        df.assign(
+            Insured=(df['Insurance_covered'] == 'Yes').astype('int64'),
+            Approved=(df['Claim_status'] == 'Approved').astype('int64')
+        )
+        .groupby(PARTIAL_KEYS, sort=False)
+        .agg(
+            Admissions=('Admission_ID', 'size'),
+            LOS_sum=('Length_of_stay', 'sum'),
+            Readmissions=('readmitted_30_days', 'sum'),
+            Revenue=('Total_charges', 'sum'),
+            Insured=('Insured', 'sum'),
+            Approved=('Approved', 'sum'),
+            Chronic_sum=('Chronic_conditions', 'sum'),
+            Age_sum=('Age', 'sum')
+        )
+        .reset_index()
+    )
+    # distinct patients are not additive, keep a mergeable sketch per facility/department
+    patients = PatientSketches.build(df, ['Facility_ID', 'Department'])
+    return {'sums': sums, 'patients': patients}
+
+
+def map_facility(facility, data_dir=None):
+    # runs in a worker thread, only this facility's shard is read
+    handle = DataHandle(data_dir, facility)
+    # the flat single-hospital layout has no Facility_ID, compute_partials fills it in
+    columns = [c for c in PARTIAL_COLUMNS if c != 'Facility_ID' or c in handle.schema('admissions')]
+    df = handle.merged(columns)
+    return compute_partials(df, facility)
+
+
+def merge_partials(partials):
+    sums = (
+        pd.concat([p['sums'] for p in partials], ignore_index=True)
+        .groupby(PARTIAL_KEYS, sort=True)[SUM_COLUMNS]
+        .sum()
+        .reset_index()
+    )
+    patients = partials[0]['patients']
+    for p in partials[1:]:
+        patients = patients.merge(p['patients'])
+    return {'sums': sums, 'patients': patients}
+
+
+def network_aggregates(data_dir=None, facilities=None, workers=None):
+    facilities = facilities or list_facilities(data_dir) or [None]
+    # ingest once up front, the workers then only map the shared Arrow files
+    ensure_columnar(data_dir)
+    if len(facilities) == 1:
+        return merge_partials([map_facility(facilities[0], data_dir)])
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(map_facility, facilities, repeat(data_dir)))
+    return merge_partials(partials)
+
+
+def _scoped(agg, facility=None):
+    sums = agg['sums']
+    if facility is not None:
+        sums = sums[sums['Facility_ID'] == facility]
+    return sums
+
+
+def unique_patients(agg, facility=None, departments=None):
+    return agg['patients'].count(Facility_ID=facility, Department=departments)
+
+
+def network_kpis(agg, facility=None):
+    totals = _scoped(agg, facility)[SUM_COLUMNS].sum()
+    admissions = totals['Admissions']
+    return {
+        'total_patients': unique_patients(agg, facility),
+        'total_admissions': int(admissions),
+        'avg_los': float(totals['LOS_sum'] / admissions),
+        'readmission_rate': float(totals['Readmissions'] / admissions * 100),
+        'total_revenue': float(totals['Revenue']),
+        'insurance_rate': float(totals['Insured'] / admissions * 100),
+        'approval_rate': float(totals['Approved'] / admissions * 100)
+    }
+
+
+def department_view(agg, facility=None):
+    # same columns as the Detailed Department Statistics table
+    dept = _scoped(agg, facility).groupby('Department')[SUM_COLUMNS].sum()
+    view = pd.DataFrame({
+        'Total Admissions': dept['Admissions'],
+        'Unique Patients': [unique_patients(agg, facility, [d]) for d in dept.index],
+        'Avg LOS (days)': dept['LOS_sum'] / dept['Admissions'],
+        'Readmission Rate (%)': dept['Readmissions'] / dept['Admissions'] * 100,
+        'Total Revenue': dept['Revenue'],
+        'Avg Revenue': dept['Revenue'] / dept['Admissions'],
+        'Avg Chronic Conditions': dept['Chronic_sum'] / dept['Admissions']
+    }, index=dept.index).round(2)
+    return view.sort_values('Total Admissions', ascending=False)
+
+
+def financial_view(agg, facility=None):
+    # same columns as the Financial Summary by Department table
+    dept = _scoped(agg, facility).groupby('Department')[SUM_COLUMNS].sum()
+    view = pd.DataFrame({
+        'Total Revenue': dept['Revenue'],
+        'Avg Revenue': dept['Revenue'] / dept['Admissions'],
+        'Admissions': dept['Admissions'],
+        'Insured Patients': dept['Insured'],
+        'Approved Claims': dept['Approved']
+    }, index=dept.index).round(0)
+    return view.sort_values('Total Revenue', ascending=False)
+
+
+def readmission_view(agg, facility=None):
+    # same shape as the Readmission Rate by Department chart data
+    dept = _scoped(agg, facility).groupby('Department')[['Readmissions', 'Admissions']].sum().reset_index()
+    dept.columns = ['Department', 'sum', 'count']
+    dept['rate'] = (dept['sum'] / dept['count']) * 100
+    return dept.sort_values('rate', ascending=True)
+
+
+def facility_comparison(agg):
+    fac = agg['sums'].groupby('Facility_ID')[SUM_COLUMNS].sum()
+    return pd.DataFrame({
+        'Admissions': fac['Admissions'],
+        'Unique Patients': [unique_patients(agg, f) for f in fac.index],
+        'Avg LOS (days)': fac['LOS_sum'] / fac['Admissions'],
+        'Readmission Rate (%)': fac['Readmissions'] / fac['Admissions'] * 100,
+        'Total Revenue': fac['Revenue']
+    }, index=fac.index).round(2).reset_index()
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from data_validation import DEPARTMENTS, BED_TYPES, INSURANCE_VALUES, CLAIM_STATUSES
+
+# Financial partials: one vectorized group-by over (Month, Department, Bed_type, payer,
+# claim status) with charges in integer cents, so every total is exact. Insured and
+# approved counts fall out of the payer / claim keys, and all KPIs, monthly or quarterly
+# rollups and department or payer drill-downs are sums over the small partials table.
+# Admissions without a billing row keep their own "Unbilled" payer and claim key (and a
+# missing department or bed type is "Unknown"), so they still count as admissions and in
+# the rate denominators; average revenue is taken over the billed admissions.
+
+FINANCIAL_COLUMNS = ['Admission_date', 'Department', 'Bed_type', 'Insurance_covered', 'Claim_status',
+                     'Total_charges']
+PARTIAL_KEYS = ['Month', 'Department', 'Bed_type', 'Insurance_covered', 'Claim_status']
+SUM_COLUMNS = ['Admissions', 'Billed', 'Revenue_cents', 'Insured', 'Approved']
+PERIODS = {'Monthly': 'M', 'Quarterly': 'Q'}
+KEY_CATEGORIES = {
+    'Department': DEPARTMENTS,
+    'Bed_type': BED_TYPES,
+    'Insurance_covered': INSURANCE_VALUES,
+    'Claim_status': CLAIM_STATUSES
+}
+UNBILLED = 'Unbilled'
+UNKNOWN = 'Unknown'
+# key for a missing (or unexpected) value
+MISSING_KEYS = {'Department': UNKNOWN, 'Bed_type': UNKNOWN, 'Insurance_covered': UNBILLED, 'Claim_status': UNBILLED}
+
+
+def to_cents(charges):
+    # missing charges are 0 cents
+    return np.round(np.nan_to_num(np.asarray(charges, dtype=float)) * 100).astype(np.int64)
+
+
+def financial_partials(df):
+    # Month is left out when the frame has no admission dates
+    keys = {col: pd.Categorical(df[col], categories=cats + [MISSING_KEYS[col]]).fillna(MISSING_KEYS[col])
+            for col, cats in KEY_CATEGORIES.items()}
+    if 'Admission_date' in df.columns:
+        keys = {'Month': df['Admission_date'].dt.to_period('M'), **keys}
+    billed = df['Total_charges'].notna().to_numpy()
+    cents = to_cents(df['Total_charges'])
+    # min / max only over billed admissions, NaN for cells without any
+    frame = pd.DataFrame({**keys, 'Billed': billed, 'Cents': cents,
+                          'Billed_cents': np.where(billed, cents, np.nan)})
+    # dropna=False keeps admissions without an admission date (Month NaT)
+    grouped = frame.groupby(list(keys), observed=True, sort=True, dropna=False)
+    partials = grouped.agg(Admissions=('Cents', 'size'), Billed=('Billed', 'sum'), Revenue_cents=('Cents', 'sum'),
+                           Min_cents=('Billed_cents', 'min'), Max_cents=('Billed_cents', 'max')).reset_index()
+    partials['Billed'] = partials['Billed'].astype(np.int64)
+    partials[['Min_cents', 'Max_cents']] = partials[['Min_cents', 'Max_cents']].astype('Int64')
+    # plain string keys: the partials are small and later group-bys sort them alphabetically
+    partials[list(KEY_CATEGORIES)] = partials[list(KEY_CATEGORIES)].astype(str)
+    partials['Insured'] = np.where(partials['Insurance_covered'] == 'Yes', partials['Admissions'], 0)
+    partials['Approved'] = np.where(partials['Claim_status'] == 'Approved', partials['Admissions'], 0)
+    return partials
+
+
+def select(partials, **filters):
+    # drill-down: scalar -> equality, list -> membership, None -> no filter
+    mask = np.ones(len(partials), dtype=bool)
+    for col, value in filters.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        mask &= partials[col].isin(list(values)).to_numpy()
+    return partials[mask]
+
+
+def rollup(partials, by=(), period=None, **filters):
+    # sums per group (+ period 'M' or 'Q') with the derived rates; cents stay integer
+    rows = select(partials, **filters)
+    by = list(by)
+    if period is not None:
+        rows = rows.assign(Period=rows['Month'].dt.asfreq(period))
+        by = ['Period'] + by
+    if by:
+        grouped = rows.groupby(by, observed=True, sort=True)
+        totals = grouped[SUM_COLUMNS].sum().join(grouped[['Min_cents']].min()).join(grouped[['Max_cents']].max())
+    else:
+        totals = rows[SUM_COLUMNS].sum().to_frame().T
+        totals['Min_cents'] = rows['Min_cents'].min() if len(rows) else 0
+        totals['Max_cents'] = rows['Max_cents'].max() if len(rows) else 0
+    admissions = totals['Admissions'].where(totals['Admissions'] > 0)
+    billed = totals['Billed'].where(totals['Billed'] > 0)
+    return totals.assign(
+        Revenue=totals['Revenue_cents'] / 100,
+        Avg_revenue=totals['Revenue_cents'] / billed / 100,
+        Insurance_rate=totals['Insured'] / admissions * 100,
+        Approval_rate=totals['Approved'] / admissions * 100
+    )
+
+
+def totals(partials, **filters):
+    # one row rollup as a dict
+    return rollup(partials, **filters).iloc[0].to_dict()
+
+
+def format_cents(cents):
+    # exact dollar string from integer cents
+    sign = "-" if cents < 0 else ""
+    dollars, rest = divmod(abs(int(cents)), 100)
+    return f"{sign}${dollars:,}.{rest:02d}"
@@ -0,0 +1,258 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_DIR
+
+# Daily admission and occupancy (patients in house) forecasts per department with
+# additive Holt-Winters: damped trend and a weekly season, in error-correction form.
+# Smoothing parameters are picked by a grid search that runs every grid point at once
+# as a vector, departments are fitted in parallel, and the fitted state is kept
+# in data/forecasts/<facility|all>.json. When new days arrive the stored state is only
+# rolled forward over them; a full refit happens when the history changed or after
+# REFIT_AFTER new days. The dashboard fits on a thread pool (its script and warm-up threads
+# cannot start worker processes safely: forking copies their locks, spawning re-imports the
+# Streamlit script), the command line uses worker processes.
+
+SEASON = 7
+HORIZON = 14
+DAMPING = 0.95
+MEASURES = ['Admissions', 'Occupancy']
+# series of the whole facility next to the departments
+TOTAL = "All Departments"
+FORECAST_DIR = "forecasts"
+REFIT_AFTER = 28
+Z_95 = 1.96
+FORECAST_COLUMNS = ['Department', 'Measure', 'Date', 'Forecast', 'Lower', 'Upper']
+HISTORY_COLUMNS = ['Department', 'Measure', 'Date', 'Actual']
+ALPHAS = [0.05, 0.1, 0.2, 0.3, 0.5, 0.7]
+BETAS = [0.0, 0.01, 0.05, 0.1]
+GAMMAS = [0.05, 0.1, 0.2, 0.4]
+
+
+def forecast_path(data_dir=None, facility=None):
+    return os.path.join(data_dir or DATA_DIR, FORECAST_DIR, f"{facility or 'all'}.json")
+
+
+def daily_series(df):
+    # (department, measure) -> daily pd.Series from the first to the last admission day;
+    # empty for a frame without dated admissions (e.g. an empty facility shard)
+    admit = df['Admission_date'].to_numpy().astype('datetime64[D]')
+    dated = ~np.isnat(admit)
+    if not dated.any():
+        return {}
+    df, admit = df[dated], admit[dated]
+    discharge = df['Discharge_date'].to_numpy().astype('datetime64[D]')
+    first, last = admit.min(), admit.max()
+    days = int((last - first).astype(int)) + 1
+    departments, dept = np.unique(df['Department'].to_numpy().astype(str), return_inverse=True)
+    start = (admit - first).astype(np.int64)
+    stop = np.minimum((discharge - first).astype(np.int64), days)
+
+    size = len(departments) * (days + 1)
+    admissions = np.bincount(dept * (days + 1) + start, minlength=size).reshape(len(departments), days + 1)
+    # in house from the admission day up to the day before discharge: +1 / -1 and a running sum
+    delta = (np.bincount(dept * (days + 1) + start, minlength=size)
+             - np.bincount(dept * (days + 1) + np.maximum(stop, start), minlength=size))
+    occupancy = np.cumsum(delta.reshape(len(departments), days + 1), axis=1)
+
+    index = pd.date_range(pd.Timestamp(first), periods=days, freq='D')
+    series = {}
+    for measure, values in [('Admissions', admissions[:, :days]), ('Occupancy', occupancy[:, :days])]:
+        for i, name in enumerate(departments):
+            series[(name, measure)] = pd.Series(values[i].astype(float), index=index)
+        series[(TOTAL, measure)] = pd.Series(values.sum(axis=0).astype(float), index=index)
+    return series
+
+
+def _initial_state(y):
+    # level and trend from the first two seasons, season as deviations of the first one
+    first, second = y[:SEASON], y[SEASON:2 * SEASON]
+    level = first.mean()
+    trend = (second.mean() - first.mean()) / SEASON
+    return level, trend, first - level
+
+
+def _run(y, alpha, beta, gamma, level, trend, season, t0=0):
+    # one pass of the recursion for arrays of parameters; returns the final state and the SSE
+    sse = np.zeros_like(alpha)
+    season = np.array(season, dtype=float)
+    for t, value in enumerate(y):
+        k = (t0 + t) % SEASON
+        error = value - (level + DAMPING * trend + season[..., k])
+        level = level + DAMPING * trend + alpha * error
+        trend = DAMPING * trend + beta * error
+        season[..., k] = season[..., k] + gamma * error
+        sse = sse + error * error
+    return level, trend, season, sse
+
+
+def fit_series(y):
+    # grid search over (alpha, beta, gamma) with every combination as one vector lane
+    y = np.asarray(y, dtype=float)
+    if len(y) < 2 * SEASON:
+        level = y.mean() if len(y) else 0.0
+        return {'alpha': 0.3, 'beta': 0.0, 'gamma': 0.0, 'level': float(level), 'trend': 0.0,
+                'season': [0.0] * SEASON, 'sigma': float(y.std()) if len(y) else 0.0, 'n': int(len(y))}
+    grid = np.array(list(itertools.product(ALPHAS, BETAS, GAMMAS)))
+    level, trend, season = _initial_state(y)
+    lanes = len(grid)
+    _, _, _, sse = _run(y, grid[:, 0], grid[:, 1], grid[:, 2],
+                        np.full(lanes, level), np.full(lanes, trend), np.tile(season, (lanes, 1)))
+    alpha, beta, gamma = grid[int(np.argmin(sse))]
+    level, trend, season, sse = _run(y, alpha, beta, gamma, level, trend, season)
+    return {'alpha': float(alpha), 'beta': float(beta), 'gamma': float(gamma), 'level': float(level),
+            'trend': float(trend), 'season': [float(s) for s in season],
+            'sigma': float(np.sqrt(sse / len(y))), 'n': int(len(y))}
+
+
+def update_model(model, y_new):
+    # roll a fitted model forward over new observations without searching the parameters again
+    y_new = np.asarray(y_new, dtype=float)
+    level, trend, season, sse = _run(y_new, model['alpha'], model['beta'], model['gamma'],
+                                     model['level'], model['trend'], model['season'], t0=model['n'])
+    n = model['n'] + len(y_new)
+    # running one-step error: the old mean square weighted by its length
+    sigma = np.sqrt((model['sigma'] ** 2 * model['n'] + sse) / n)
+    return {**model, 'level': float(level), 'trend': float(trend), 'season': [float(s) for s in season],
+            'sigma': float(sigma), 'n': int(n)}
+
+
+def forecast(model, horizon=HORIZON):
+    # (mean, lower, upper) for the next horizon days, 95% interval of the additive model
+    h = np.arange(1, horizon + 1)
+    damped = np.cumsum(DAMPING ** h)
+    season = np.asarray(model['season'])[(model['n'] + h - 1) % SEASON]
+    mean = model['level'] + damped * model['trend'] + season
+    # forecast variance: sigma^2 * (1 + sum over earlier steps of c_j^2)
+    c = model['alpha'] + model['beta'] * damped + model['gamma'] * (h % SEASON == 0)
+    variance = model['sigma'] ** 2 * (1 + np.r_[0, np.cumsum(c[:-1] ** 2)])
+    margin = Z_95 * np.sqrt(variance)
+    return np.maximum(mean, 0), np.maximum(mean - margin, 0), mean + margin
+
+
+def _checksum(values):
+    return hashlib.sha1(np.ascontiguousarray(values, dtype=float).tobytes()).hexdigest()
+
+
+def _fit_task(key, values, model):
+    # worker: refit from scratch, or roll the stored model over the days it has not seen
+    if model is None:
+        model = fit_series(values)
+        model['fitted_days'] = int(len(values))
+    else:
+        model = update_model(model, values[model['n']:])
+    model['checksum'] = _checksum(values)
+    return key, model
+
+
+def _plan(series, stored):
+    # (key, values, model to update or None) for every series that needs work
+    tasks, kept = [], {}
+    for key, s in series.items():
+        name = "|".join(key)
+        values = s.to_numpy()
+        if not series[(key[0], 'Admissions')].any():
+            # a department without admissions has nothing to fit or forecast
+            continue
+        model = stored.get(name)
+        if (model is not None and model.get('start') == str(s.index[0].date())
+                and model['n'] <= len(values) and model['checksum'] == _checksum(values[:model['n']])):
+            if model['n'] == len(values):
+                kept[name] = model
+                continue
+            if len(values) - model['fitted_days'] < REFIT_AFTER:
+                tasks.append((name, values, model))
+                continue
+        tasks.append((name, values, None))
+    return tasks, kept
+
+
+def update_forecasts(df, data_dir=None, facility=None, workers=None, processes=False):
+    # fitted models for every department and measure, refitting only what changed
+    path = forecast_path(data_dir, facility)
+    stored = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            stored = json.load(f)
+    series = daily_series(df)
+    tasks, models = _plan(series, stored)
+    if tasks:
+        if workers == 1 or len(tasks) <= 2:
+            results = [_fit_task(*task) for task in tasks]
+        else:
+            pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool_cls(max_workers=workers) as pool:
+                results = list(pool.map(_fit_task, *zip(*tasks)))
+        for name, model in results:
+            model['start'] = str(series[tuple(name.split("|"))].index[0].date())
+            models[name] = model
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(models, f)
+        os.replace(tmp, path)
+    return models, series
+
+
+def _empty_frame(columns):
+    # the long layout without rows, with the dtypes the charts expect
+    frame = pd.DataFrame({c: pd.Series(dtype=float) for c in columns})
+    return frame.astype({'Department': object, 'Measure': object, 'Date': 'datetime64[ns]'})
+
+
+def forecast_frame(models, series, horizon=HORIZON):
+    # long table: Department, Measure, Date, Forecast, Lower, Upper
+    if not models:
+        return _empty_frame(FORECAST_COLUMNS)
+    frames = []
+    for name, model in models.items():
+        department, measure = name.split("|")
+        history = series[(department, measure)]
+        mean, lower, upper = forecast(model, horizon)
+        frames.append(pd.DataFrame({
+            'Department': department,
+            'Measure': measure,
+            'Date': pd.date_range(history.index[-1] + pd.Timedelta(days=1), periods=horizon, freq='D'),
+            'Forecast': mean,
+            'Lower': lower,
+            'Upper': upper
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def history_frame(series, days=90):
+    # last days of every series in the same long layout, for plotting next to the forecast
+    if not series:
+        return _empty_frame(HISTORY_COLUMNS)
+    return pd.concat([
+        pd.DataFrame({'Department': department, 'Measure': measure, 'Date': s.index[-days:],
+                      'Actual': s.to_numpy()[-days:]})
+        for (department, measure), s in series.items()
+    ], ignore_index=True)
+
+
+def main(argv=None):
+    from data_handle import DataHandle
+
+    parser = argparse.ArgumentParser(description="Fit the department forecasts and print the next days.")
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--facility", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    args = parser.parse_args(argv)
+
+    df = DataHandle(args.data_dir, args.facility).merged(['Department', 'Admission_date', 'Discharge_date'])
+    models, series = update_forecasts(df, args.data_dir, args.facility, args.workers, processes=True)
+    table = forecast_frame(models, series, args.horizon)
+    print(table.pivot_table(index='Date', columns=['Measure', 'Department'], values='Forecast').round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,13 @@ np.random.seed(42) #for reproducibility
 NUM_PATIENTS=500
 NUM_ADMISSIONS=1000
 NUM_DOCTORS=65
+NUM_FACILITIES=3
 departments=['Cardiology','Neurology','General Medicine','Orthopedics','Emergency','Gynecology','Dermatology','Psychiatry','Radiology']
 bed_types=['General','ICU']
 admission_types=['Emergency','OPD']
 genders=['Male','Female','Other']
-claim_statuses=['Approved','Elected']
+facility_ids=[f"F{i:02d}" for i in range(1,NUM_FACILITIES +1)]
+claim_statuses=['Approved','Rejected']
 patients = pd.DataFrame({
     'Patient_ID':range(1,NUM_PATIENTS +1),
     'Age':np.random.randint(0,90,NUM_PATIENTS),
@@ -38,7 +40,6 @@ admissions = pd.DataFrame({
     'Bed_type':np.random.choice(bed_types,NUM_ADMISSIONS,p=[0.3 ,0.7]),#70% General, 30% ICU
     'readmitted_30_days': np.random.choice([0, 1], NUM_ADMISSIONS, p=[0.75, 0.25]) # 25% readmitted within 30 days
 })
-admissions.to_csv("data/admissions.csv", index=False)
 
 doctors = pd.DataFrame({
     'Doctor_ID':range(1,NUM_DOCTORS +1),
@@ -46,7 +47,6 @@ doctors = pd.DataFrame({
     'Patients_handled':np.random.randint(50,300,NUM_DOCTORS),
     'Avg_consult_time':np.random.randint(5,30,NUM_DOCTORS) #in minutes
 })
-doctors.to_csv("data/doctors.csv", index=False)
 
 billing = pd.DataFrame({
     'Admission_ID':admissions['Admission_ID'],
@@ -54,5 +54,36 @@ billing = pd.DataFrame({
     'Insurance_covered':np.random.choice(['Yes','No'],NUM_ADMISSIONS,p=[0.6,0.4]),
     'Claim_status':np.random.choice(claim_statuses,NUM_ADMISSIONS,p=[0.8,0.2])
 })
-billing.to_csv("data/billing.csv", index=False)
+
+# link every admission to a doctor of the same department (drawn last so the other tables keep their values)
+doctors_by_dept = doctors.sort_values('Department', kind='stable')
+dept_counts = doctors_by_dept['Department'].value_counts().reindex(sorted(departments), fill_value=0)
+dept_offsets = dept_counts.cumsum() - dept_counts
+adm_counts = admissions['Department'].map(dept_counts).to_numpy()
+adm_offsets = admissions['Department'].map(dept_offsets).to_numpy()
+picks = np.random.random(NUM_ADMISSIONS)
+no_doctor = adm_counts == 0 #departments without a doctor fall back to any doctor
+doctor_pos = np.where(
+    no_doctor,
+    (picks * NUM_DOCTORS).astype(int),
+    adm_offsets + (picks * np.maximum(adm_counts, 1)).astype(int)
+)
+admissions['Doctor_ID'] = np.where(
+    no_doctor,
+    doctors['Doctor_ID'].to_numpy()[doctor_pos],
+    doctors_by_dept['Doctor_ID'].to_numpy()[doctor_pos]
+)
+
+# every doctor works at one facility, admissions and billing belong to the facility of the treating doctor
+doctors['Facility_ID'] = np.random.choice(facility_ids,NUM_DOCTORS)
+admissions['Facility_ID'] = admissions['Doctor_ID'].map(doctors.set_index('Doctor_ID')['Facility_ID'])
+billing['Facility_ID'] = admissions['Facility_ID'].to_numpy()
+
+# patients are shared across the network, everything else is sharded per facility
+for facility_id in facility_ids:
+    facility_dir = os.path.join("data", "facilities", facility_id)
+    os.makedirs(facility_dir, exist_ok=True)
+    admissions[admissions['Facility_ID'] == facility_id].to_csv(os.path.join(facility_dir, "admissions.csv"), index=False)
+    billing[billing['Facility_ID'] == facility_id].to_csv(os.path.join(facility_dir, "billing.csv"), index=False)
+    doctors[doctors['Facility_ID'] == facility_id].to_csv(os.path.join(facility_dir, "doctors.csv"), index=False)
 print("Hospital data generated and saved to CSV files.")
\ No newline at end of file
@@ -1,44 +1,128 @@
 import pandas as pd
 import numpy as np
+from data_loader import load_data
+from financial_engine import financial_partials, rollup, totals
 
-patients = pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/patients.csv")
-admissions = pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/admissions.csv")
-billing = pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/billing.csv")
-doctors = pd.read_csv("C:/Users/asus/OneDrive/Desktop/.vscode/.project/data/doctors.csv")
-
-admissions['Admission_date'] = pd.to_datetime(admissions['Admission_date'])
-admissions['Discharge_date'] = pd.to_datetime(admissions['Discharge_date'])
-
-admissions['Length_of_stay'] = (
-    admissions['Discharge_date'] - admissions['Admission_date']
-).dt.days
-
-df = (
-    admissions
-    .merge(patients, on="Patient_ID", how="left")
-    .merge(billing, on="Admission_ID", how="left")
-)
-daily_admissions = (
-    df.groupby(df['Admission_date'].dt.date)
-    .size()
-    .reset_index(name="Daily_Admissions")
-)
-daily_discharges=(
-    df.groupby(df['Discharge_date'].dt.date).size().reset_index(name="Daily_Discharges")
-)
-bed_utilization=(df['Bed_type'].value_counts(normalize=True).reset_index())
-bed_utilization.columns=['Bed_type',"Utilization_Percentage"]
-bed_utilization['Utilization_Percentage']*=100
-
-avg_los= df['Length_of_stay'].mean()#average length of stay
-
-los_by_dept = (df.groupby('Department')['Length_of_stay'].mean().reset_index())
-avg_patients_per_doctor = doctors['Patients_handled'].mean()
-doctor_workload=(doctors.groupby('Department')['Patients_handled'].mean().reset_index())
-
-revenue_by_dept = (
-    df.groupby('Department')['Total_charges']
-    .sum()
-    .reset_index()
-)
-insurance_rejection_rate=(df['Claim_status'].value_counts(normalize=True)*100)
+# KPI functions shared by the dashboard, the report CLI and this script.
+# The financial functions take the financial partials of df when the caller already has them,
+# so a report computes the group-by once for all of its financial sections.
+
+
+def overview_kpis(df):
+    # same figures as the Home Overview KPI cards and insight cards
+    dept_counts = df['Department'].value_counts()
+    return {
+        'total_patients': int(df['Patient_ID'].nunique()),
+        'total_admissions': int(len(df)),
+        'avg_los': float(df['Length_of_stay'].mean()),
+        'readmission_rate': float(df['readmitted_30_days'].sum() / len(df) * 100),
+        'total_revenue': float(df['Total_charges'].sum()),
+        'avg_age': float(df['Age'].mean()),
+        'icu_percent': float((df['Bed_type'] == 'ICU').sum() / len(df) * 100),
+        'busiest_department': dept_counts.index[0],
+        'busiest_department_admissions': int(dept_counts.values[0])
+    }
+
+
+def daily_admissions(df):
+    return (
+        df.groupby(df['Admission_date'].dt.date)
+        .size()
+        .reset_index(name="Daily_Admissions")
+        .rename(columns={'Admission_date': 'Date'})
+    )
+
+
+def daily_discharges(df):
+    return (
+        df.groupby(df['Discharge_date'].dt.date)
+        .size()
+        .reset_index(name="Daily_Discharges")
+        .rename(columns={'Discharge_date': 'Date'})
+    )
+
+
+def department_distribution(df):
+    dept_data = df['Department'].value_counts().reset_index()
+    dept_data.columns = ['Department', 'Count']
+    return dept_data
+
+
+def bed_utilization(df):
+    bed_util = df['Bed_type'].value_counts(normalize=True).reset_index()
+    bed_util.columns = ['Bed_type', "Utilization_Percentage"]
+    bed_util['Utilization_Percentage'] *= 100
+    return bed_util
+
+
+def los_by_dept(df):
+    return df.groupby('Department')['Length_of_stay'].mean().reset_index()
+
+
+def _partials(df, partials):
+    return financial_partials(df) if partials is None else partials
+
+
+def financial_kpis(df, partials=None):
+    # same figures as the Financial Insights metric cards, summed in integer cents
+    total = totals(_partials(df, partials))
+    return {
+        'total_revenue': float(total['Revenue']),
+        'avg_revenue': float(total['Avg_revenue']),
+        'insured': int(total['Insured']),
+        'insurance_rate': float(total['Insurance_rate']),
+        'approved': int(total['Approved']),
+        'approval_rate': float(total['Approval_rate'])
+    }
+
+
+def revenue_by_dept(df, partials=None):
+    dept = rollup(_partials(df, partials), ['Department'])
+    return dept['Revenue'].rename('Total_charges').reset_index()
+
+
+def claim_status_share(df, partials=None):
+    claims = rollup(_partials(df, partials), ['Claim_status'])['Admissions']
+    claims = (claims / claims.sum() * 100).sort_values(ascending=False).reset_index()
+    claims.columns = ['Claim_status', 'Percentage']
+    return claims
+
+
+def bed_revenue(df, partials=None):
+    beds = rollup(_partials(df, partials), ['Bed_type'])
+    return pd.DataFrame({'sum': beds['Revenue'], 'mean': beds['Avg_revenue'],
+                         'count': beds['Admissions']}).reset_index()
+
+
+def financial_summary(df, partials=None):
+    dept = rollup(_partials(df, partials), ['Department'])
+    summary = pd.DataFrame({
+        'Total Revenue': dept['Revenue'],
+        'Avg Revenue': dept['Avg_revenue'],
+        'Admissions': dept['Admissions'],
+        'Insured Patients': dept['Insured'],
+        'Approved Claims': dept['Approved']
+    }).round(0)
+    return summary.sort_values('Total Revenue', ascending=False)
+
+
+def doctor_workload(doctors):
+    return doctors.groupby('Department')['Patients_handled'].mean().reset_index()
+
+
+if __name__ == "__main__":
+    df, patients, admissions, billing, doctors = load_data()
+
+    overview = overview_kpis(df)
+    avg_los = overview['avg_los']#average length of stay
+    avg_patients_per_doctor = doctors['Patients_handled'].mean()
+    partials = financial_partials(df)
+    insurance_rejection_rate = claim_status_share(df, partials)
+
+    print(pd.Series(overview))
+    print(pd.Series(financial_kpis(df, partials)))
+    print(los_by_dept(df))
+    print(bed_utilization(df))
+    print(revenue_by_dept(df, partials))
+    print(insurance_rejection_rate)
+    print("Avg patients per doctor:", avg_patients_per_doctor)
@@ -0,0 +1,339 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from data_loader import list_facilities
+from data_handle import DataHandle
+from facility_aggregation import network_aggregates, network_kpis, department_view, facility_comparison
+from kpi_report import SECTIONS, FINANCIAL_SECTIONS, section_frame
+from financial_engine import FINANCIAL_COLUMNS, financial_partials
+from readmission_model import SCORING_COLUMNS, bundle_path, load_bundle
+from batch_scoring import current_scores, scores_mtime
+
+# Read-only JSON API over the dashboard's KPIs and readmission risk scores.
+# Every response body is built once per (endpoint, parameters it reads, data generation,
+# model version, batch scores), from aggregates that are themselves computed once per version,
+# and served from memory to all clients with an ETag (If-None-Match -> 304).
+# Concurrent requests for a missing entry wait for the one computing it. At most
+# MAX_CACHED_RESPONSES bodies are kept, the least recently used are dropped first.
+
+# seconds between checks for a new data generation or model bundle
+REFRESH_INTERVAL = int(os.environ.get("HOSPITAL_API_REFRESH", "30"))
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10000
+MAX_CACHED_RESPONSES = int(os.environ.get("HOSPITAL_API_CACHE_SIZE", "512"))
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _records(frame):
+    return json.loads(frame.to_json(orient='records', date_format='iso'))
+
+
+def _facility(params, facilities):
+    facility = params.get('facility')
+    if facility is not None and facility not in facilities:
+        raise ApiError(404, f"Unknown facility: {facility}")
+    return facility
+
+
+def _limit(params):
+    try:
+        limit = int(params.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError(400, "limit must be an integer")
+    if not 0 < limit <= MAX_LIMIT:
+        raise ApiError(400, f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+class KpiService:
+    def __init__(self, data_dir=None, refresh_interval=REFRESH_INTERVAL, max_responses=MAX_CACHED_RESPONSES):
+        self.data_dir = data_dir
+        self.refresh_interval = refresh_interval
+        self.max_responses = max_responses
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        # key -> lock of the thread computing it, only for keys that are cached or being computed
+        self._key_locks = {}
+        self._handles = {}
+        # key -> (version, value) in least recently used order; responses and the shared
+        # aggregates they are built from
+        self._cache = OrderedDict()
+        self._bundle = None
+        self._bundle_mtime = None
+        self._checked = 0
+        self.facilities = list_facilities(data_dir)
+        self.version = None
+        self.version = self._refresh()
+
+    def handle(self, facility=None):
+        with self._lock:
+            if facility not in self._handles:
+                self._handles[facility] = DataHandle(self.data_dir, facility)
+            return self._handles[facility]
+
+    def _refresh(self):
+        # (data generation, model version, batch scores mtime); files are checked at most once per refresh interval
+        network = self.handle()
+        network.refresh()
+        with self._lock:
+            for facility, handle in self._handles.items():
+                if facility is not None:
+                    handle.refresh()
+            path = bundle_path()
+            mtime = os.path.getmtime(path) if os.path.exists(path) else None
+            if mtime != self._bundle_mtime:
+                self._bundle = load_bundle() if mtime is not None else None
+                self._bundle_mtime = mtime
+            self._checked = time.monotonic()
+            version = (network.version, self._bundle['version'] if self._bundle else None,
+                       scores_mtime(self.data_dir))
+            if version != self.version:
+                self.facilities = list_facilities(self.data_dir)
+                # entries of older versions are never served again
+                self._cache = OrderedDict((k, v) for k, v in self._cache.items() if v[0] == version)
+                self._key_locks = {k: lock for k, lock in self._key_locks.items()
+                                   if k in self._cache or lock.locked()}
+            return version
+
+    def current_version(self):
+        if time.monotonic() - self._checked >= self.refresh_interval:
+            with self._refresh_lock:
+                if time.monotonic() - self._checked >= self.refresh_interval:
+                    self.version = self._refresh()
+        return self.version
+
+    def _lookup(self, key, version):
+        # caller holds self._lock
+        entry = self._cache.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, key, entry):
+        # caller holds self._lock; only responses are evicted, the shared aggregates stay
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        responses = [k for k in self._cache if k[0] == 'response']
+        for old in responses[:max(len(responses) - self.max_responses, 0)]:
+            del self._cache[old]
+            self._key_locks.pop(old, None)
+
+    def cached(self, key, compute):
+        version = self.current_version()
+        with self._lock:
+            entry = self._lookup(key, version)
+            if entry is not None:
+                return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # single flight: one thread computes, the others wait and reuse the result
+        with key_lock:
+            with self._lock:
+                entry = self._lookup(key, version)
+            if entry is not None:
+                return entry[1]
+            try:
+                value = compute()
+            except Exception:
+                with self._lock:
+                    if key not in self._cache:
+                        self._key_locks.pop(key, None)
+                raise
+            with self._lock:
+                self._store(key, (version, value))
+            return value
+
+    def bundle(self):
+        if self._bundle is None:
+            raise ApiError(503, "No trained model found - run readmission_predicton.py")
+        return self._bundle
+
+    # shared aggregates
+    def aggregates(self):
+        return self.cached(('aggregates',), lambda: network_aggregates(self.data_dir))
+
+    def risk_scores(self):
+        def compute():
+            # the flat single-hospital layout has no Facility_ID column
+            facility = ['Facility_ID'] if 'Facility_ID' in self.handle().schema('merged') else []
+            data = self.handle().merged(SCORING_COLUMNS + facility)
+            scores = current_scores(self.bundle(), data, self.data_dir)
+            return scores.assign(**{c: data[c].to_numpy() for c in facility + ['Department', 'Admission_date']})
+        return self.cached(('risk_scores',), compute)
+
+    def financial_partials(self, facility=None):
+        # shared by every financial section of the facility
+        handle = self.handle(facility)
+        return self.cached(('financial_partials', facility),
+                           lambda: financial_partials(handle.merged(FINANCIAL_COLUMNS)))
+
+    # endpoints, each returns a JSON-serialisable payload
+    def kpis(self, facility):
+        return {'facility': facility, 'kpis': network_kpis(self.aggregates(), facility),
+                'sections': list(SECTIONS)}
+
+    def section(self, name, facility):
+        df = self.handle(facility).merged(self.handle(facility).schema('merged'))
+        partials = self.financial_partials(facility) if name in FINANCIAL_SECTIONS else None
+        return {'facility': facility, 'section': name, 'title': SECTIONS[name][0],
+                'rows': _records(section_frame(name, df, partials))}
+
+    def departments(self, facility):
+        return {'facility': facility, 'rows': _records(department_view(self.aggregates(), facility).reset_index())}
+
+    def facility_comparison(self):
+        return {'rows': _records(facility_comparison(self.aggregates()))}
+
+    def _scoped_scores(self, facility):
+        scores = self.risk_scores()
+        if facility is not None:
+            scores = scores[scores['Facility_ID'] == facility]
+        return scores
+
+    def risk_summary(self, facility):
+        bundle = self.bundle()
+        scores = self._scoped_scores(facility)
+        operating_point = bundle['threshold']
+        flagged = scores['Risk_probability'] >= operating_point['Threshold']
+        days = max(scores['Admission_date'].dt.normalize().nunique(), 1)
+        return {
+            'facility': facility,
+            'model': bundle['model_name'],
+            'model_version': bundle['version'],
+            'threshold': float(operating_point['Threshold']),
+            'admissions': int(len(scores)),
+            'high_risk': int(flagged.sum()),
+            'high_risk_per_day': float(flagged.sum() / days),
+            'mean_risk': float(scores['Risk_probability'].mean()),
+            'high_risk_by_department': {k: int(v) for k, v in
+                                        scores.loc[flagged, 'Department'].value_counts().items()}
+        }
+
+    def risk_scores_view(self, facility, limit):
+        bundle = self.bundle()
+        scores = self._scoped_scores(facility)
+        top = scores.nlargest(limit, 'Risk_probability')
+        top = top.assign(High_risk=top['Risk_probability'] >= bundle['threshold']['Threshold'])
+        return {'facility': facility, 'model_version': bundle['version'], 'rows': _records(top)}
+
+    def health(self):
+        generation, model_version, _ = self.current_version()
+        return {'status': 'ok', 'generation': generation, 'model_version': model_version,
+                'facilities': self.facilities}
+
+    def route(self, path, params):
+        # (payload function, cache key or None); parameters are validated here and only the ones
+        # the endpoint reads go into the key, so unknown or invalid parameters never add entries
+        parts = [p for p in path.split('/') if p]
+        if parts == ['health']:
+            return self.health, None
+        if parts == ['facilities']:
+            return self.facility_comparison, ('facilities',)
+        if parts == ['kpis']:
+            facility = _facility(params, self.facilities)
+            return lambda: self.kpis(facility), ('kpis', facility)
+        if len(parts) == 2 and parts[0] == 'kpis':
+            if parts[1] not in SECTIONS:
+                raise ApiError(404, f"Unknown KPI section: {parts[1]}")
+            facility = _facility(params, self.facilities)
+            return lambda: self.section(parts[1], facility), ('kpis', parts[1], facility)
+        if parts == ['departments']:
+            facility = _facility(params, self.facilities)
+            return lambda: self.departments(facility), ('departments', facility)
+        if parts == ['risk', 'summary']:
+            facility = _facility(params, self.facilities)
+            return lambda: self.risk_summary(facility), ('risk_summary', facility)
+        if parts == ['risk', 'scores']:
+            facility, limit = _facility(params, self.facilities), _limit(params)
+            return lambda: self.risk_scores_view(facility, limit), ('risk_scores', facility, limit)
+        raise ApiError(404, f"Unknown endpoint: {path}")
+
+    def response(self, path, params):
+        # (body, etag); bodies and etags of cacheable endpoints are computed once per version
+        payload, key = self.route(path, params)
+
+        def encode():
+            body = json.dumps(payload(), default=str).encode('utf-8')
+            return body, '"' + hashlib.sha1(body).hexdigest() + '"'
+
+        if key is None:
+            return encode()
+        return self.cached(('response',) + key, encode)
+
+
+class KpiRequestHandler(BaseHTTPRequestHandler):
+    service = None
+    quiet = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            body, etag = self.service.response(url.path, params)
+        except ApiError as e:
+            return self._send(e.status, json.dumps({'error': str(e)}).encode('utf-8'))
+        except Exception:
+            # logged even with --quiet; the client only gets a generic error body
+            sys.stderr.write(f"Error serving {self.path}\n{traceback.format_exc()}")
+            return self._send(500, json.dumps({'error': 'Internal server error'}).encode('utf-8'))
+
+        if etag in [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]:
+            return self._send(304, None, etag)
+        self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f"max-age={self.service.refresh_interval}")
+        if body is not None:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body is not None:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard KPIs and risk scores as a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--refresh-interval", type=int, default=REFRESH_INTERVAL,
+                        help="seconds between checks for new data or a new model")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    args = parser.parse_args(argv)
+
+    KpiRequestHandler.service = KpiService(args.data_dir, args.refresh_interval)
+    KpiRequestHandler.quiet = args.quiet
+    server = ThreadingHTTPServer((args.host, args.port), KpiRequestHandler)
+    server.daemon_threads = True
+    print(f"KPI API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+import hospital_operation_kpi as kpi
+from data_loader import load_data, list_facilities, DATA_DIR
+from financial_engine import financial_partials
+
+# report sections: name -> (title, function of the merged frame)
+SECTIONS = {
+    'overview': ("Key Performance Indicators", kpi.overview_kpis),
+    'daily_admissions': ("Daily Admission Trends", kpi.daily_admissions),
+    'department_distribution': ("Department Distribution", kpi.department_distribution),
+    'bed_utilization': ("Bed Type Utilization", kpi.bed_utilization),
+    'los_by_department': ("Average Length of Stay by Department", kpi.los_by_dept),
+    'financial': ("Financial Metrics", kpi.financial_kpis),
+    'revenue_by_department': ("Revenue by Department", kpi.revenue_by_dept),
+    'claim_status': ("Claim Status Distribution", kpi.claim_status_share),
+    'bed_revenue': ("Revenue Analysis by Bed Type", kpi.bed_revenue),
+    'financial_summary': ("Financial Summary by Department", kpi.financial_summary),
+}
+# sections that also take the financial partials, computed once per report
+FINANCIAL_SECTIONS = ['financial', 'revenue_by_department', 'claim_status', 'bed_revenue', 'financial_summary']
+
+
+def _as_frame(result):
+    # scalar KPI dicts become a two column Metric/Value table
+    if isinstance(result, dict):
+        return pd.DataFrame({'Metric': list(result.keys()), 'Value': list(result.values())})
+    if isinstance(result.index, pd.RangeIndex):
+        return result
+    return result.reset_index()
+
+
+def section_frame(name, df, partials=None):
+    fn = SECTIONS[name][1]
+    if name in FINANCIAL_SECTIONS:
+        return _as_frame(fn(df, partials))
+    return _as_frame(fn(df))
+
+
+def _compute_section(name, df, partials=None):
+    return name, section_frame(name, df, partials)
+
+
+def compute_sections(df, sections=None, workers=4, use_processes=False):
+    sections = list(sections or SECTIONS)
+    partials = financial_partials(df) if set(sections) & set(FINANCIAL_SECTIONS) else None
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_cls(max_workers=workers) as pool:
+        futures = [pool.submit(_compute_section, name, df, partials) for name in sections]
+        results = dict(f.result() for f in futures)
+    # keep the declared section order regardless of completion order
+    return {name: results[name] for name in sections}
+
+
+def write_json(results, path, meta):
+    payload = {
+        'meta': meta,
+        'sections': {
+            name: json.loads(frame.to_json(orient='records', date_format='iso'))
+            for name, frame in results.items()
+        }
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+
+
+def write_csv(results, out_dir, prefix):
+    for name, frame in results.items():
+        frame.to_csv(os.path.join(out_dir, f"{prefix}_{name}.csv"), index=False)
+
+
+def write_html(results, path, meta):
+    parts = [
+        "<html><head><meta charset='utf-8'><title>Hospital KPI Report</title>",
+        "<style>body{font-family:sans-serif;margin:30px;color:#2c3e50}"
+        "h2{border-bottom:3px solid #3498db;padding-bottom:6px}"
+        "table{border-collapse:collapse;margin-bottom:20px}"
+        "td,th{border:1px solid #ecf0f1;padding:4px 10px;text-align:right}"
+        "th{background:#3498db;color:white}</style></head><body>",
+        f"<h1>Hospital KPI Report</h1><p>Data: {meta['data_dir']} | Facility: {meta['facility']} | Generated: {meta['generated_at']}</p>"
+    ]
+    for name, frame in results.items():
+        parts.append(f"<h2>{SECTIONS[name][0]}</h2>")
+        parts.append(frame.to_html(index=False, float_format=lambda x: f"{x:,.2f}"))
+    parts.append("</body></html>")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(parts))
+
+
+def write_report(results, out_dir, formats, meta, prefix="kpi_report"):
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    if 'json' in formats:
+        path = os.path.join(out_dir, f"{prefix}.json")
+        write_json(results, path, meta)
+        written.append(path)
+    if 'csv' in formats:
+        write_csv(results, out_dir, prefix)
+        written.append(os.path.join(out_dir, f"{prefix}_*.csv"))
+    if 'html' in formats:
+        path = os.path.join(out_dir, f"{prefix}.html")
+        write_html(results, path, meta)
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the dashboard KPIs and write a static report.")
+    parser.add_argument("--data-dir", default=None, help="folder with the generated CSV files")
+    parser.add_argument("--out", default="reports", help="output folder")
+    parser.add_argument("--format", nargs="+", choices=['html', 'json', 'csv'],
+                        default=['html', 'json', 'csv'])
+    parser.add_argument("--sections", nargs="+", choices=list(SECTIONS), default=None)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--processes", action="store_true", help="use a process pool instead of threads")
+    parser.add_argument("--prefix", default="kpi_report", help="file name prefix for the report files")
+    parser.add_argument("--facility", nargs="+", default=None, help="write one report per given facility")
+    parser.add_argument("--all-facilities", action="store_true", help="write one report per facility shard")
+    args = parser.parse_args(argv)
+
+    # None = one network-wide report
+    facilities = [None]
+    if args.all_facilities:
+        facilities = list_facilities(args.data_dir)
+    elif args.facility:
+        facilities = args.facility
+
+    for facility in facilities:
+        df = load_data(args.data_dir, facility)[0]
+        results = compute_sections(df, args.sections, args.workers, args.processes)
+        meta = {
+            'data_dir': args.data_dir or DATA_DIR,
+            'facility': facility or "ALL",
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'rows': int(len(df))
+        }
+        prefix = args.prefix if facility is None else f"{args.prefix}_{facility}"
+        for path in write_report(results, args.out, args.format, meta, prefix):
+            print("Written:", path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Server-side paginated table: filter, sort and slice happen on the full frame,
+# only the visible page is styled and sent to the browser.
+
+
+def filter_rows(df, search=None, search_cols=None):
+    # case-insensitive substring match over the given columns
+    if not search or not search_cols:
+        return df
+    needle = search.lower()
+    match = np.zeros(len(df), dtype=bool)
+    for col in search_cols:
+        match |= df[col].astype(str).str.lower().str.contains(needle, regex=False).to_numpy()
+    return df[match]
+
+
+def page_rows(df, sort_by=None, ascending=True, page=1, page_size=50):
+    start = (page - 1) * page_size
+    if sort_by is None:
+        return df.iloc[start:start + page_size]
+    needed = start + page_size
+    if needed < len(df) // 4 and pd.api.types.is_numeric_dtype(df[sort_by]):
+        # early pages only need a partial selection instead of a full sort
+        rows = df.nsmallest(needed, sort_by, keep='first') if ascending else df.nlargest(needed, sort_by, keep='first')
+    else:
+        rows = df.sort_values(sort_by, ascending=ascending, kind='stable')
+    return rows.iloc[start:needed]
+
+
+def style_page(page_df, full_df, gradients=None, formats=None):
+    # gradients are computed on the visible rows with the full column range so colours match across pages
+    styler = page_df.style
+    for col, cmap in (gradients or {}).items():
+        if col in page_df.columns and len(full_df):
+            styler = styler.background_gradient(
+                subset=[col], cmap=cmap,
+                vmin=full_df[col].min(), vmax=full_df[col].max()
+            )
+    if formats:
+        styler = styler.format({k: v for k, v in formats.items() if k in page_df.columns})
+    return styler
+
+
+def paginated_table(df, key, default_sort=None, ascending=False, gradients=None, formats=None,
+                    search_cols=None, page_sizes=(25, 50, 100, 250), height=400, render=None):
+    render = render or st.dataframe
+    if not isinstance(df.index, pd.RangeIndex):
+        df = df.reset_index()
+
+    columns = list(df.columns)
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+    with col1:
+        search = st.text_input("Search", key=f"{key}_search") if search_cols else None
+    with col2:
+        sort_by = st.selectbox(
+            "Sort by", columns,
+            index=columns.index(default_sort) if default_sort in columns else 0,
+            key=f"{key}_sort"
+        )
+    with col3:
+        order = st.selectbox("Order", ["Descending", "Ascending"],
+                             index=0 if not ascending else 1, key=f"{key}_order")
+    with col4:
+        page_size = st.selectbox("Rows per page", list(page_sizes), index=1 if len(page_sizes) > 1 else 0,
+                                 key=f"{key}_size")
+
+    filtered = filter_rows(df, search, search_cols)
+    total = len(filtered)
+    pages = max(1, int(np.ceil(total / page_size)))
+    # the page lives only in session state (no widget default); a narrower search can leave
+    # the remembered page out of range, so it is clamped before the widget is created
+    page_key = f"{key}_page"
+    st.session_state.setdefault(page_key, 1)
+    if st.session_state[page_key] > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    rows = page_rows(filtered, sort_by, order == "Ascending", int(page), page_size)
+    render(style_page(rows, df, gradients, formats), use_container_width=True, height=height, hide_index=True)
+    first = (int(page) - 1) * page_size + 1
+    st.caption(f"Showing rows {first:,}-{first + len(rows) - 1:,} of {total:,} (page {int(page):,} of {pages:,})"
+               if total else "No matching rows")
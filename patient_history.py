@@ -0,0 +1,139 @@
+import os
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from data_loader import DATA_DIR
+from data_handle import DataHandle
+
+# Patient-history features for the readmission model. Admissions are sorted once by
+# (Patient_ID, Admission_date) and every feature is a searchsorted / cumsum / running
+# max over that order, so the whole table costs O(n log n) instead of a per-patient loop.
+# Features always come from the whole network timeline (a patient's stays at every
+# facility), so a facility's admissions get the same features as in the network.
+
+HISTORY_FEATURES = ['Prior_admissions_90d', 'Prior_admissions_365d', 'Prior_LOS_total',
+                    'Days_since_last_discharge']
+HISTORY_COLUMNS = ['Admission_ID', 'Patient_ID', 'Admission_date', 'Discharge_date']
+HISTORY_FILE = os.path.join("features", "patient_history.arrow")
+
+
+def history_path(data_dir=None):
+    return os.path.join(data_dir or DATA_DIR, HISTORY_FILE)
+
+
+def _days(values):
+    return pd.to_datetime(values).to_numpy().astype('datetime64[D]').astype('int64')
+
+
+def history_features(admissions):
+    # one row per admission (same order as the input) with features known at admission time
+    adm = admissions[HISTORY_COLUMNS]
+    n = len(adm)
+    if n == 0:
+        return pd.DataFrame({'Admission_ID': adm['Admission_ID'].to_numpy(),
+                             **{f: np.array([], dtype=float) for f in HISTORY_FEATURES}})
+
+    patient = pd.factorize(adm['Patient_ID'])[0].astype('int64')
+    admit = _days(adm['Admission_date'])
+    discharge = _days(adm['Discharge_date'])
+    order = np.lexsort((adm['Admission_ID'].to_numpy(), admit, patient))
+    patient, admit, discharge = patient[order], admit[order], discharge[order]
+    los = discharge - admit
+
+    # patient blocks in day space: stride wider than the data span plus the longest window,
+    # so a look-back never reaches into the previous patient's block
+    first_day = min(admit.min(), discharge.min())
+    stride = max(admit.max(), discharge.max()) - first_day + 366 + 1
+    key = patient * stride + (admit - first_day)
+
+    # prior admissions in [admit - window, admit)
+    before = np.searchsorted(key, key, side='left')
+    prior_90 = before - np.searchsorted(key, key - 90, side='left')
+    prior_365 = before - np.searchsorted(key, key - 365, side='left')
+
+    # start of each patient's block and running sums inside it
+    block_start = np.flatnonzero(np.r_[True, patient[1:] != patient[:-1]])
+    block_id = np.repeat(np.arange(len(block_start)), np.diff(np.r_[block_start, n]))
+    first_row = block_start[block_id]
+    los_cumsum = np.cumsum(los)
+    prior_los = los_cumsum - los - (los_cumsum[first_row] - los[first_row])
+
+    # latest earlier discharge: running max of the block-offset discharge key, shifted by one row
+    discharge_key = patient * stride + (discharge - first_day)
+    last_discharge = np.r_[-1, np.maximum.accumulate(discharge_key)[:-1]]
+    has_prior = np.arange(n) != first_row
+    since = np.where(has_prior, key - last_discharge, np.nan)
+    # a stay that overlaps the previous one counts as no gap
+    since = np.clip(since, 0, None)
+
+    features = pd.DataFrame({
+        'Prior_admissions_90d': prior_90,
+        'Prior_admissions_365d': prior_365,
+        'Prior_LOS_total': prior_los,
+        'Days_since_last_discharge': since
+    })
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = np.arange(n)
+    features = features.iloc[inverse].reset_index(drop=True)
+    features.insert(0, 'Admission_ID', adm['Admission_ID'].to_numpy())
+    return features
+
+
+def update_history_features(features, admissions, patient_ids):
+    # recompute only the patients whose admissions changed and splice them into features
+    affected = admissions['Patient_ID'].isin(pd.Index(patient_ids).unique())
+    fresh = history_features(admissions[affected])
+    stale_ids = pd.Index(admissions.loc[affected, 'Admission_ID'])
+    kept = features[~features['Admission_ID'].isin(stale_ids)]
+    # rows of admissions that no longer exist are dropped as well
+    kept = kept[kept['Admission_ID'].isin(pd.Index(admissions['Admission_ID']))]
+    return pd.concat([kept, fresh], ignore_index=True)
+
+
+def _changed_patients(cached, admissions):
+    # patients with new, removed or re-dated admissions since the cached run
+    current = admissions[HISTORY_COLUMNS].assign(
+        Admission_date=_days(admissions['Admission_date']),
+        Discharge_date=_days(admissions['Discharge_date'])
+    )
+    known = cached[HISTORY_COLUMNS]
+    diff = current.merge(known, how='outer', indicator=True)
+    return diff.loc[diff['_merge'] != 'both', 'Patient_ID'].unique()
+
+
+def load_history_features(admissions, data_dir=None):
+    # cached network feature table in data/features/, updated incrementally per affected patient;
+    # admissions may be any subset of the network (one facility, flagged rows, ...)
+    network = DataHandle(data_dir).merged(HISTORY_COLUMNS)
+    if not admissions['Admission_ID'].isin(pd.Index(network['Admission_ID'])).all():
+        # admissions that are not in the stored data: computed from themselves, the cache is left alone
+        return _aligned(history_features(admissions), admissions)
+
+    path = history_path(data_dir)
+    cached = feather.read_feather(path) if os.path.exists(path) else None
+    if cached is None:
+        stored = history_features(network)
+    else:
+        changed = _changed_patients(cached, network)
+        if len(changed) == 0:
+            return _aligned(cached, admissions)
+        stored = update_history_features(cached[['Admission_ID'] + HISTORY_FEATURES], network, changed)
+
+    # keep the keys next to the features so the next run can diff against them
+    keys = network[HISTORY_COLUMNS].assign(
+        Admission_date=_days(network['Admission_date']),
+        Discharge_date=_days(network['Discharge_date'])
+    )
+    stored = keys.merge(stored, on='Admission_ID', how='left')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(stored, tmp, compression='uncompressed')
+    os.replace(tmp, path)
+    return _aligned(stored, admissions)
+
+
+def _aligned(stored, admissions):
+    # features in the row order of admissions
+    positions = pd.Index(stored['Admission_ID']).get_indexer(admissions['Admission_ID'])
+    return stored.iloc[positions][HISTORY_FEATURES].reset_index(drop=True)
@@ -0,0 +1,156 @@
+import os
+import numpy as np
+import pandas as pd
+
+# HyperLogLog sketches of Patient_ID per partition (e.g. department x admission day).
+# Partitions merge by taking the register-wise max, so any filter combination over
+# the partition keys is answered without touching the admissions rows again.
+
+# relative standard error of the unique patient estimate, override with HOSPITAL_SKETCH_ERROR
+DEFAULT_ERROR = float(os.environ.get("HOSPITAL_SKETCH_ERROR", "0.02"))
+# HOSPITAL_EXACT_COUNTS=1 keeps the exact patient id arrays instead of registers
+EXACT_COUNTS = os.environ.get("HOSPITAL_EXACT_COUNTS", "0") == "1"
+
+MIN_PRECISION = 4
+MAX_PRECISION = 16
+
+
+def precision_for_error(error):
+    # standard error of HLL is about 1.04 / sqrt(m) with m = 2**p registers
+    m = (1.04 / error) ** 2
+    return int(np.clip(np.ceil(np.log2(m)), MIN_PRECISION, MAX_PRECISION))
+
+
+def _hash64(values):
+    # splitmix64 finalizer, vectorized over uint64 (wraparound is intended)
+    x = np.asarray(values).astype(np.uint64)
+    with np.errstate(over='ignore'):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _bit_length(w):
+    # exact bit length of uint64 values by binary search over shifts
+    w = w.copy()
+    n = np.zeros(w.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = w >= (np.uint64(1) << np.uint64(shift))
+        n[big] += shift
+        w[big] >>= np.uint64(shift)
+    return n + (w > 0)
+
+
+def _register_updates(patient_ids, p):
+    h = _hash64(patient_ids)
+    index = (h >> np.uint64(64 - p)).astype(np.int64)
+    rest = h & np.uint64((1 << (64 - p)) - 1)
+    # rank = position of the leftmost 1-bit in the remaining 64 - p bits
+    rank = (64 - p) - _bit_length(rest) + 1
+    return index, rank.astype(np.uint8)
+
+
+def estimate(registers):
+    # HyperLogLog estimate with linear counting for the small range
+    registers = np.asarray(registers)
+    m = registers.shape[-1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.power(2.0, -registers.astype(np.float64)).sum(axis=-1)
+    zeros = (registers == 0).sum(axis=-1)
+    with np.errstate(divide='ignore'):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+
+class PatientSketches:
+    def __init__(self, keys, p, registers=None, exact_ids=None):
+        self.keys = keys.reset_index(drop=True)
+        self.p = p
+        self.registers = registers
+        self.exact_ids = exact_ids
+
+    @property
+    def exact(self):
+        return self.exact_ids is not None
+
+    @property
+    def error(self):
+        return 0.0 if self.exact else 1.04 / np.sqrt(2 ** self.p)
+
+    @classmethod
+    def build(cls, df, by, error=None, exact=None, id_col='Patient_ID'):
+        by = list(by)
+        error = DEFAULT_ERROR if error is None else error
+        exact = EXACT_COUNTS if exact is None else exact
+        p = precision_for_error(error)
+
+        grouped = df.groupby(by, sort=True, observed=True, dropna=False)
+        codes = grouped.ngroup().to_numpy()
+        keys = grouped.size().reset_index()[by]
+
+        if exact:
+            ids = pd.Series(df[id_col].to_numpy()).groupby(codes).unique()
+            return cls(keys, p, exact_ids=[np.asarray(v) for v in ids.reindex(range(len(keys)))])
+
+        index, rank = _register_updates(df[id_col].to_numpy(), p)
+        m = 1 << p
+        flat = codes.astype(np.int64) * m + index
+        # max rank per (partition, register) in one grouped pass
+        best = pd.Series(rank).groupby(flat).max()
+        registers = np.zeros((len(keys), m), dtype=np.uint8)
+        registers.ravel()[best.index.to_numpy()] = best.to_numpy()
+        return cls(keys, p, registers=registers)
+
+    def mask(self, **filters):
+        # scalar -> equality, list/set/array -> membership, slice(lo, hi) -> inclusive range
+        selected = np.ones(len(self.keys), dtype=bool)
+        for col, value in filters.items():
+            if value is None:
+                continue
+            column = self.keys[col]
+            if isinstance(value, slice):
+                if value.start is not None:
+                    selected &= (column >= value.start).to_numpy()
+                if value.stop is not None:
+                    selected &= (column <= value.stop).to_numpy()
+            elif isinstance(value, (list, tuple, set, np.ndarray, pd.Index, pd.Series)):
+                selected &= column.isin(list(value)).to_numpy()
+            else:
+                selected &= (column == value).to_numpy()
+        return selected
+
+    def count(self, mask=None, **filters):
+        selected = self.mask(**filters) if mask is None else np.asarray(mask)
+        if not selected.any():
+            return 0
+        rows = np.flatnonzero(selected)
+        if self.exact:
+            return int(len(np.unique(np.concatenate([self.exact_ids[i] for i in rows]))))
+        return int(round(float(estimate(self.registers[rows].max(axis=0)))))
+
+    def count_by(self, col, mask=None, **filters):
+        # unique patients per value of one key column, e.g. per department
+        selected = self.mask(**filters) if mask is None else np.asarray(mask)
+        values = self.keys.loc[selected, col].unique()
+        counts = [self.count(selected & (self.keys[col] == v).to_numpy()) for v in values]
+        return pd.Series(counts, index=pd.Index(values, name=col), name='Unique_Patients').sort_index()
+
+    def merge(self, other):
+        # union of two sketch sets with the same key columns and precision
+        if self.p != other.p or self.exact != other.exact:
+            raise ValueError("Can only merge sketches with the same precision and mode")
+        keys = pd.concat([self.keys, other.keys], ignore_index=True)
+        cols = list(keys.columns)
+        grouped = keys.groupby(cols, sort=True, observed=True, dropna=False)
+        codes = grouped.ngroup().to_numpy()
+        merged_keys = grouped.size().reset_index()[cols]
+        if self.exact:
+            buckets = {}
+            for code, ids in zip(codes, list(self.exact_ids) + list(other.exact_ids)):
+                buckets.setdefault(code, []).append(ids)
+            exact_ids = [np.unique(np.concatenate(buckets[code])) for code in range(len(merged_keys))]
+            return PatientSketches(merged_keys, self.p, exact_ids=exact_ids)
+        registers = np.zeros((len(merged_keys), self.registers.shape[1]), dtype=np.uint8)
+        np.maximum.at(registers, codes, np.concatenate([self.registers, other.registers]))
+        return PatientSketches(merged_keys, self.p, registers=registers)
@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Timing instrumentation for the dashboard: every rerun is split into named
+# sections (load, filter, aggregate, figure, render) and the durations are kept
+# in rolling per page/section windows for the debug panel and the metrics file.
+
+SECTIONS = ['load', 'filter', 'aggregate', 'figure', 'render']
+HISTORY = int(os.environ.get("HOSPITAL_TIMING_HISTORY", "500"))
+# one JSON line per rerun is appended here when set
+METRICS_FILE = os.environ.get("HOSPITAL_METRICS_FILE")
+PROFILE_DIR = os.environ.get("HOSPITAL_PROFILE_DIR", "metrics")
+
+
+class TimingRegistry:
+    # process-wide rolling windows, shared by all sessions of one server
+    def __init__(self, history=HISTORY):
+        self._samples = defaultdict(lambda: deque(maxlen=history))
+        self._lock = threading.Lock()
+
+    def record(self, page, section, seconds):
+        with self._lock:
+            self._samples[(page, section)].append(seconds)
+
+    def samples(self, page, section):
+        with self._lock:
+            return np.array(self._samples.get((page, section), ()), dtype=float)
+
+    def summary(self, page=None):
+        with self._lock:
+            items = [(k, np.array(v, dtype=float)) for k, v in self._samples.items()
+                     if page is None or k[0] == page]
+        rows = [{
+            'Page': p,
+            'Section': s,
+            'Runs': len(v),
+            'Mean (ms)': v.mean() * 1000,
+            'P50 (ms)': np.percentile(v, 50) * 1000,
+            'P95 (ms)': np.percentile(v, 95) * 1000,
+            'Max (ms)': v.max() * 1000
+        } for (p, s), v in items if len(v)]
+        order = {s: i for i, s in enumerate(SECTIONS + ['total'])}
+        summary = pd.DataFrame(rows, columns=['Page', 'Section', 'Runs', 'Mean (ms)', 'P50 (ms)',
+                                              'P95 (ms)', 'Max (ms)'])
+        return summary.sort_values(['Page', 'Section'], key=lambda c: c.map(order) if c.name == 'Section' else c)
+
+    def histogram(self, page, section='total', bins=20):
+        values = self.samples(page, section) * 1000
+        if len(values) == 0:
+            return np.array([]), np.array([])
+        return np.histogram(values, bins=bins)
+
+
+class RerunTimer:
+    # lap timer: lap(section) books the time since the previous lap to that section
+    def __init__(self, registry, page=None):
+        self.registry = registry
+        self.page = page
+        self.sections = defaultdict(float)
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, section):
+        now = time.perf_counter()
+        self.sections[section] += now - self._last
+        self._last = now
+
+    def finish(self, metrics_file=METRICS_FILE):
+        total = time.perf_counter() - self._start
+        page = self.page or "unknown"
+        for section, seconds in self.sections.items():
+            self.registry.record(page, section, seconds)
+        self.registry.record(page, 'total', total)
+        if metrics_file:
+            write_metrics(metrics_file, page, dict(self.sections), total)
+        return total
+
+
+def write_metrics(path, page, sections, total):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+        'page': page,
+        'total_ms': round(total * 1000, 3),
+        'sections_ms': {k: round(v * 1000, 3) for k, v in sections.items()}
+    }
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+
+
+class RerunProfiler:
+    # optional cProfile / pyinstrument capture of one rerun
+    def __init__(self, mode):
+        self.mode = mode
+        self._profiler = None
+        if mode == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                self.mode = None
+                self.error = "pyinstrument is not installed"
+                return
+            self._profiler = Profiler()
+        elif mode == 'cprofile':
+            import cProfile
+            self._profiler = cProfile.Profile()
+        else:
+            self.mode = None
+        self.error = None
+
+    def start(self):
+        if self.mode == 'pyinstrument':
+            self._profiler.start()
+        elif self.mode == 'cprofile':
+            self._profiler.enable()
+
+    def stop(self, page, out_dir=PROFILE_DIR):
+        # returns (text report, saved path)
+        if self.mode is None:
+            return None, None
+        os.makedirs(out_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        slug = (page or "app").lower().replace(" ", "_")
+        if self.mode == 'pyinstrument':
+            self._profiler.stop()
+            path = os.path.join(out_dir, f"profile_{slug}_{stamp}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self._profiler.output_html())
+            return self._profiler.output_text(unicode=False, color=False), path
+
+        import pstats
+        self._profiler.disable()
+        path = os.path.join(out_dir, f"profile_{slug}_{stamp}.prof")
+        self._profiler.dump_stats(path)
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(30)
+        return stream.getvalue(), path
@@ -0,0 +1,117 @@
+import os
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from data_validation import DEPARTMENTS, BED_TYPES, ADMISSION_TYPES, GENDERS, INSURANCE_VALUES
+from patient_history import HISTORY_FEATURES, HISTORY_COLUMNS, load_history_features
+
+# Feature schema shared by the training script, the backtests and scoring.
+# Categories are fixed from the validation enums so every slice of the data
+# encodes to the same columns.
+
+NUMERIC_FEATURES = ['Age', 'Chronic_conditions', 'Length_of_stay']
+CATEGORICAL_FEATURES = {
+    'Gender': GENDERS,
+    'Admission_type': ADMISSION_TYPES,
+    'Department': DEPARTMENTS,
+    'Bed_type': BED_TYPES,
+    'Insurance_covered': INSURANCE_VALUES
+}
+TARGET = 'readmitted_30_days'
+# merged columns needed to encode one admission
+SCORING_COLUMNS = NUMERIC_FEATURES + list(CATEGORICAL_FEATURES) + HISTORY_COLUMNS
+# the 30-day label of an admission is only known this long after discharge
+LABEL_DELAY = pd.Timedelta(days=30)
+# trained model + calibrator + operating threshold, written by readmission_predicton.py
+MODEL_DIR = os.environ.get("HOSPITAL_MODEL_DIR", "models")
+BUNDLE_FILE = "readmission_bundle.joblib"
+# first stays have no earlier discharge, treat them like a gap of a year
+NO_PRIOR_DISCHARGE_DAYS = 365
+
+
+def encode_features(df, data_dir=None, history=True):
+    # float32 design matrix in the row order of df
+    parts = [df[NUMERIC_FEATURES].astype('float32').reset_index(drop=True)]
+    for col, categories in CATEGORICAL_FEATURES.items():
+        values = pd.Categorical(df[col], categories=categories)
+        parts.append(pd.get_dummies(values, prefix=col, drop_first=True, dtype='float32'))
+    if history:
+        parts.append(history_matrix(load_history_features(df, data_dir)))
+    return pd.concat(parts, axis=1)
+
+
+def history_matrix(features):
+    # history feature columns of the design matrix, from load_history_features output
+    features = features[HISTORY_FEATURES].fillna({'Days_since_last_discharge': NO_PRIOR_DISCHARGE_DAYS})
+    return features.astype('float32').reset_index(drop=True)
+
+
+def label_available_at(df):
+    return pd.to_datetime(df['Discharge_date']) + LABEL_DELAY
+
+
+def time_split(df, cutoff):
+    # train: labels observed before the cutoff, test: admissions from the cutoff on
+    cutoff = pd.Timestamp(cutoff)
+    train = (label_available_at(df) <= cutoff).to_numpy()
+    test = (pd.to_datetime(df['Admission_date']) >= cutoff).to_numpy()
+    return np.flatnonzero(train), np.flatnonzero(test)
+
+
+def make_model(name, **params):
+    # scikit-learn is imported here so scoring and the dashboard shell do not pay for it
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    if name == 'lr':
+        return LogisticRegression(max_iter=1000, **params)
+    if name == 'rf':
+        return RandomForestClassifier(**{'n_estimators': 200, 'max_depth': 8, 'random_state': 42, **params})
+    raise ValueError(f"Unknown model: {name}")
+
+
+def bundle_path(model_dir=None):
+    return os.path.join(model_dir or MODEL_DIR, BUNDLE_FILE)
+
+
+def make_bundle(model, model_name, columns, calibrator, threshold, **meta):
+    return {
+        'model': model,
+        'model_name': model_name,
+        'columns': list(columns),
+        'calibrator': calibrator,
+        'threshold': threshold,
+        'version': datetime.now().strftime('%Y%m%d%H%M%S'),
+        **meta
+    }
+
+
+def save_bundle(bundle, path=None):
+    path = path or bundle_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(bundle, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def load_bundle(path=None):
+    path = path or bundle_path()
+    return joblib.load(path) if os.path.exists(path) else None
+
+
+def predict_risk(bundle, X):
+    # calibrated readmission probability per row
+    X = X.reindex(columns=bundle['columns'], fill_value=0).to_numpy()
+    scores = bundle['model'].predict_proba(X)[:, 1]
+    return bundle['calibrator'].transform(scores) if bundle['calibrator'] is not None else scores
+
+
+def score_frame(bundle, data, data_dir=None):
+    # Admission_ID and calibrated risk for merged rows holding SCORING_COLUMNS
+    return pd.DataFrame({
+        'Admission_ID': data['Admission_ID'].to_numpy(),
+        'Risk_probability': predict_risk(bundle, encode_features(data, data_dir))
+    })
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier #randomforestclassifier is used for classification tasks
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import (
@@ -8,44 +7,27 @@ from sklearn.metrics import (
     roc_auc_score,# to compute the Area Under the Receiver Operating Characteristic Curve 
     confusion_matrix # to evaluate the performance of classification models
 )
-# Load the datasets
-patients = pd.read_csv("C:\\Users\\asus\\OneDrive\\Desktop\\.vscode\\.project\\data\\patients.csv")
-admissions = pd.read_csv("C:\\Users\\asus\\OneDrive\\Desktop\\.vscode\\.project\\data\\admissions.csv")
-billing = pd.read_csv("C:\\Users\\asus\\OneDrive\\Desktop\\.vscode\\.project\\data\\billing.csv")
-
-admissions['Admission_date'] = pd.to_datetime(admissions['Admission_date'])
-admissions['Discharge_date'] = pd.to_datetime(admissions['Discharge_date'])
-
-admissions['Length_of_stay'] = (
-    admissions['Discharge_date'] - admissions['Admission_date']
-).dt.days
-
-df = (
-    admissions
-    .merge(patients, on="Patient_ID", how="left")
-    .merge(billing, on="Admission_ID", how="left")
-)
-# Feature Engineering
-X= df[
-    ['Age',
-     'Gender',
-     'Chronic_conditions',
-     'Admission_type',
-     'Department',
-     'Bed_type',
-     'Length_of_stay',
-     'Insurance_covered'
-    ]
-]
-y= df['readmitted_30_days']
-X= pd.get_dummies(X, drop_first=True)
-X_train,X_test,y_train,y_test= train_test_split(X,y,test_size=0.2,random_state=42, stratify=y)
+from data_loader import load_data
+from readmission_model import TARGET, encode_features, time_split, make_bundle, save_bundle
+from calibration import Calibrator, threshold_curve, choose_threshold
+from drift_monitor import set_reference
+# Load the datasets (all facility shards)
+df = load_data()[0]
+# Feature Engineering - demographics, stay attributes and patient history (prior stays)
+X= encode_features(df)
+y= df[TARGET]
+# Time-based split: the last 20% of the admission period is the test set, training only
+# uses stays whose 30-day label was already known at the cutoff (see backtest.py for rolling folds)
+cutoff = df['Admission_date'].quantile(0.8).normalize()
+train_idx, test_idx = time_split(df, cutoff)
+X_train,X_test,y_train,y_test= X.iloc[train_idx],X.iloc[test_idx],y.iloc[train_idx],y.iloc[test_idx]
+print(f"Cutoff {cutoff.date()}: {len(train_idx)} training / {len(test_idx)} test admissions")
 # Model Training and Evaluation
 lr_model = LogisticRegression(max_iter=1000)
-lr_model.fit(X_train, y_train)
+lr_model.fit(X_train.to_numpy(), y_train)
 #evaluate logistic regression
-lr_preds=lr_model.predict(X_test)
-lr_probs= lr_model.predict_proba(X_test)[:,1] #probabilities for the positive class
+lr_preds=lr_model.predict(X_test.to_numpy())
+lr_probs= lr_model.predict_proba(X_test.to_numpy())[:,1] #probabilities for the positive class
 
 print("Logistic Regression Results")
 print(classification_report(y_test,lr_preds))
@@ -63,10 +45,10 @@ rf_model= RandomForestClassifier(
     max_depth=8,#ddepth of each tree
     random_state=42#for reproducibility
 )
-rf_model.fit(X_train,y_train)
+rf_model.fit(X_train.to_numpy(),y_train)
 #evaluate random forest
-rf_preds = rf_model.predict(X_test)
-rf_probs = rf_model.predict_proba(X_test)[:, 1]
+rf_preds = rf_model.predict(X_test.to_numpy())
+rf_probs = rf_model.predict_proba(X_test.to_numpy())[:, 1]
 
 print("Random Forest Results")
 print(classification_report(y_test, rf_preds))
@@ -86,4 +68,36 @@ model_comparision = pd.DataFrame({
         roc_auc_score(y_test,rf_probs)
     ]
 })
-print(model_comparision)
\ No newline at end of file
+print(model_comparision)
+# Calibration and operating threshold
+# the first half of the test period calibrates the better model, the second half checks it
+best_name, best_model, best_probs = max(
+    [('lr', lr_model, lr_probs), ('rf', rf_model, rf_probs)],
+    key=lambda m: roc_auc_score(y_test, m[2])
+)
+test_dates = df['Admission_date'].iloc[test_idx]
+calibration_end = test_dates.min() + (test_dates.max() - test_dates.min()) / 2
+in_calibration = (test_dates < calibration_end).to_numpy()
+calibrator = Calibrator('isotonic').fit(best_probs[in_calibration], y_test[in_calibration])
+calibration_days = max((calibration_end - test_dates.min()).days, 1)
+
+curve = threshold_curve(calibrator.transform(best_probs[in_calibration]), y_test[in_calibration],
+                        days=calibration_days)
+threshold = choose_threshold(curve, objective='cost')
+print(f"Operating threshold ({best_name}): {threshold['Threshold']:.3f} - precision {threshold['Precision']:.2f}, "
+      f"recall {threshold['Recall']:.2f}, {threshold['Flagged_per_day']:.1f} alerts/day")
+
+holdout = threshold_curve(calibrator.transform(best_probs[~in_calibration]), y_test[~in_calibration])
+checked = holdout[holdout['Threshold'] >= threshold['Threshold']]
+if len(checked):
+    print(f"Held-out check: precision {checked['Precision'].iloc[-1]:.2f}, recall {checked['Recall'].iloc[-1]:.2f}")
+
+path = save_bundle(make_bundle(
+    best_model, best_name, X.columns, calibrator, threshold,
+    cutoff=str(cutoff.date()), roc_auc=float(roc_auc_score(y_test, best_probs)),
+    # baseline of the per-admission logistic regression explanations
+    feature_means=X_train.mean().to_numpy()
+))
+print("Model bundle written:", path)
+# the training admissions are the reference distribution for the drift monitor
+set_reference(df.iloc[train_idx])
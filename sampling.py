@@ -0,0 +1,54 @@
+import os
+import numpy as np
+
+# Approximate mode for the exploratory charts: a stratified sample (Department x
+# readmission status, proportional allocation) with inverse-probability weights, so
+# weighted counts estimate the full data and binomial intervals give the error.
+
+SAMPLE_SIZE = int(os.environ.get("HOSPITAL_SAMPLE_SIZE", "50000"))
+STRATA = ['Department', 'readmitted_30_days']
+WEIGHT_COLUMN = 'Sample_weight'
+Z_95 = 1.96
+
+
+def stratified_sample(df, size=SAMPLE_SIZE, strata=STRATA, seed=42):
+    # every stratum keeps its share of rows (at least one); Sample_weight = stratum rows / sampled rows
+    strata = [c for c in strata if c in df.columns]
+    if len(df) <= size or not strata:
+        return df.assign(**{WEIGHT_COLUMN: 1.0})
+    rng = np.random.default_rng(seed)
+    group = df.groupby(strata, sort=False, observed=True).ngroup().to_numpy()
+    sizes = np.bincount(group)
+    quota = np.maximum(np.round(sizes * size / len(df)).astype(np.int64), 1)
+
+    # random order inside each stratum: sort by (stratum, random key), rank = position - stratum start
+    order = np.lexsort((rng.random(len(df)), group))
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+    rank = np.arange(len(df)) - starts[group[order]]
+    keep = np.sort(order[rank < quota[group[order]]])
+
+    sample = df.iloc[keep]
+    return sample.assign(**{WEIGHT_COLUMN: (sizes / quota)[group[keep]]})
+
+
+def is_sample(df):
+    return WEIGHT_COLUMN in df.columns
+
+
+def weighted_histogram(values, weights, bins=30):
+    # (edges, estimated counts, lower, upper) with a 95% normal interval per bin
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    valid = ~np.isnan(values)
+    values, weights = values[valid], weights[valid]
+    edges = np.histogram_bin_edges(values, bins=bins)
+    estimate, _ = np.histogram(values, bins=edges, weights=weights)
+    # variance of a weighted count: sum of w * (w - 1) over the sampled rows in the bin
+    variance, _ = np.histogram(values, bins=edges, weights=weights * (weights - 1))
+    margin = Z_95 * np.sqrt(variance)
+    return edges, estimate, np.maximum(estimate - margin, 0), estimate + margin
+
+
+def sample_note(sample, total):
+    return (f"Approximate: {len(sample):,} of {total:,} rows, stratified by Department and readmission status. "
+            "Histogram bars show 95% intervals.")
@@ -0,0 +1,124 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import numpy as np
+
+# Cold-start benchmark of the dashboard. Every measurement runs in a fresh interpreter, as on
+# a newly started replica: the import time of the app shell and of each page module, and the
+# time until the first rerun of the app (and optionally the first visit of every page) has
+# rendered, through Streamlit's AppTest. --script times another version of the app file, e.g.
+# an older one from git, so both can be compared on the same data.
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+SHELL_MODULE = "dashboard_pages.common"
+# libraries the shell should not load before a page needs them (streamlit itself may load some)
+HEAVY_MODULES = ['sklearn', 'scipy', 'plotly.express', 'plotly.graph_objects', 'plotly.subplots']
+
+_IMPORT_PROBE = """
+import importlib, json, sys, time
+import streamlit
+before = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(json.dumps({'seconds': time.perf_counter() - start, 'modules': len(set(sys.modules) - before),
+                  'heavy': [m for m in json.loads(sys.argv[2]) if m in sys.modules and m not in before]}))
+"""
+
+_APP_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=600)
+app.run()
+seconds = {'first render': time.perf_counter() - start}
+heavy = [m for m in json.loads(sys.argv[3]) if m in sys.modules and m not in before]
+pages = app.sidebar.radio[0].options if sys.argv[2] == 'all' else json.loads(sys.argv[2])
+for page in pages:
+    start = time.perf_counter()
+    app.sidebar.radio[0].set_value(page).run()
+    seconds[page] = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'modules': len(sys.modules), 'heavy': heavy,
+                  'error': str(app.exception[0].message) if app.exception else None}))
+"""
+
+
+def run_probe(code, *args):
+    # one fresh interpreter per measurement, result printed as the last line of stdout
+    result = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True,
+                            cwd=os.path.dirname(APP_FILE))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "probe failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_times(modules, repeat=3):
+    # module -> median / min import seconds (on top of streamlit), modules and heavy libraries it pulls in
+    rows = {}
+    for module in modules:
+        runs = [run_probe(_IMPORT_PROBE, module, json.dumps(HEAVY_MODULES)) for _ in range(repeat)]
+        seconds = [r['seconds'] for r in runs]
+        rows[module] = {'median': float(np.median(seconds)), 'min': float(np.min(seconds)),
+                        'modules': runs[-1]['modules'], 'heavy': runs[-1]['heavy']}
+    return rows
+
+
+def cold_start(script=APP_FILE, pages=(), repeat=3):
+    # step -> median / min seconds of the first render and of the first visit of each page
+    runs = [run_probe(_APP_PROBE, script, pages if pages == 'all' else json.dumps(list(pages)),
+                      json.dumps(HEAVY_MODULES)) for _ in range(repeat)]
+    errors = [r['error'] for r in runs if r['error']]
+    steps = {step: {'median': float(np.median([r['seconds'][step] for r in runs])),
+                    'min': float(np.min([r['seconds'][step] for r in runs]))} for step in runs[0]['seconds']}
+    return {'steps': steps, 'heavy_at_start': runs[-1]['heavy'], 'modules': runs[-1]['modules'],
+            'errors': errors}
+
+
+def print_table(title, rows, extra=()):
+    print(f"\n{title}")
+    width = max(len(name) for name in rows)
+    for name, row in rows.items():
+        details = "  ".join(f"{key}={row[key]}" for key in extra if row.get(key))
+        print(f"  {name:<{width}}  {row['median'] * 1000:8.0f} ms  (min {row['min'] * 1000:.0f} ms)  {details}")
+
+
+def main(argv=None):
+    from dashboard_pages import PAGES
+
+    parser = argparse.ArgumentParser(description="Measure import times and cold start of the dashboard.")
+    parser.add_argument("--script", default=APP_FILE, help="app file to start (default: app.py)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement")
+    parser.add_argument("--pages", nargs="*", default=None,
+                        help="also time the first visit of these pages (no names: every page)")
+    parser.add_argument("--skip-imports", action="store_true", help="only time the app start")
+    parser.add_argument("--json", default=None, help="append the results as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    record = {'timestamp': datetime.now().isoformat(timespec='seconds'), 'script': args.script}
+    if not args.skip_imports:
+        modules = [SHELL_MODULE] + [f"dashboard_pages.{name}" for name in PAGES.values()]
+        record['imports'] = import_times(modules, args.repeat)
+        print_table("Import time on top of streamlit (fresh interpreter)", record['imports'], ['modules', 'heavy'])
+
+    pages = 'all' if args.pages == [] else (args.pages or ())
+    record['cold_start'] = cold_start(args.script, pages, args.repeat)
+    print_table(f"Cold start of {os.path.basename(args.script)} (including the streamlit import)",
+                record['cold_start']['steps'])
+    print(f"\n  modules loaded after the first render (background warm-up included): "
+          f"{record['cold_start']['modules']}, heavy: "
+          f"{', '.join(record['cold_start']['heavy_at_start']) or 'none'}")
+    for error in record['cold_start']['errors']:
+        print(f"  error: {error}")
+
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
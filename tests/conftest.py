@@ -0,0 +1,79 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_validation import DEPARTMENTS, BED_TYPES, ADMISSION_TYPES, GENDERS, INSURANCE_VALUES, CLAIM_STATUSES
+
+# Small generated datasets in the CSV layout written by hospital_data.py.
+
+
+def write_dataset(data_dir, patients=60, admissions=200, unbilled=10, seed=0, facilities=()):
+    # flat single-hospital layout: data_dir/{patients,admissions,billing,doctors}.csv without Facility_ID,
+    # or with facilities one shard per facility under data_dir/facilities/<Facility_ID>/;
+    # the last `unbilled` admissions have no billing row
+    rng = np.random.default_rng(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    pd.DataFrame({
+        'Patient_ID': np.arange(1, patients + 1),
+        'Age': rng.integers(1, 90, patients),
+        'Gender': rng.choice(GENDERS, patients),
+        'Chronic_conditions': rng.integers(0, 4, patients),
+        'Admission_type': rng.choice(ADMISSION_TYPES, patients)
+    }).to_csv(os.path.join(data_dir, 'patients.csv'), index=False)
+    doctors = pd.DataFrame({
+        'Doctor_ID': np.arange(1, len(DEPARTMENTS) + 1),
+        'Department': DEPARTMENTS,
+        'Patients_handled': rng.integers(10, 200, len(DEPARTMENTS)),
+        'Avg_consult_time': rng.integers(5, 30, len(DEPARTMENTS))
+    })
+    admit = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 120, admissions), unit='D')
+    doctor = rng.integers(0, len(DEPARTMENTS), admissions)
+    frame = pd.DataFrame({
+        'Admission_ID': np.arange(1, admissions + 1),
+        'Patient_ID': rng.integers(1, patients + 1, admissions),
+        'Admission_date': admit.strftime('%Y-%m-%d'),
+        'Discharge_date': (admit + pd.to_timedelta(rng.integers(1, 15, admissions), unit='D')).strftime('%Y-%m-%d'),
+        'Department': np.array(DEPARTMENTS)[doctor],
+        'Bed_type': rng.choice(BED_TYPES, admissions),
+        'readmitted_30_days': rng.integers(0, 2, admissions),
+        'Doctor_ID': doctor + 1
+    })
+    billed = admissions - unbilled
+    billing = pd.DataFrame({
+        'Admission_ID': frame['Admission_ID'][:billed],
+        'Total_charges': rng.integers(500, 20000, billed),
+        'Insurance_covered': rng.choice(INSURANCE_VALUES, billed),
+        'Claim_status': rng.choice(CLAIM_STATUSES, billed)
+    })
+    if not facilities:
+        for name, table in [('admissions', frame), ('billing', billing), ('doctors', doctors)]:
+            table.to_csv(os.path.join(data_dir, f"{name}.csv"), index=False)
+        return data_dir
+    # every facility has its own doctors, Doctor_IDs stay unique across the network
+    facility = rng.integers(0, len(facilities), admissions)
+    frame = frame.assign(Doctor_ID=frame['Doctor_ID'] + facility * len(DEPARTMENTS),
+                         Facility_ID=np.array(facilities)[facility])
+    billing = billing.assign(Facility_ID=frame['Facility_ID'][:billed].to_numpy())
+    for i, name in enumerate(facilities):
+        shard = os.path.join(data_dir, 'facilities', name)
+        os.makedirs(shard, exist_ok=True)
+        frame[frame['Facility_ID'] == name].to_csv(os.path.join(shard, 'admissions.csv'), index=False)
+        billing[billing['Facility_ID'] == name].to_csv(os.path.join(shard, 'billing.csv'), index=False)
+        doctors.assign(Doctor_ID=doctors['Doctor_ID'] + i * len(DEPARTMENTS),
+                       Facility_ID=name).to_csv(os.path.join(shard, 'doctors.csv'), index=False)
+    return data_dir
+
+
+@pytest.fixture
+def flat_data_dir(tmp_path):
+    return write_dataset(str(tmp_path / 'data'))
+
+
+@pytest.fixture
+def sharded_data_dir(tmp_path):
+    return write_dataset(str(tmp_path / 'data'), facilities=('F01', 'F02', 'F03'))
@@ -0,0 +1,78 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from aggregate_cube import AggregateCube, CUBE_COLUMNS, MEASURES, cube_kpis
+from data_handle import DataHandle
+
+
+def _frame(data_dir):
+    return DataHandle(data_dir).merged(CUBE_COLUMNS).sort_values('Admission_date', ignore_index=True)
+
+
+def test_unbilled_admissions_do_not_turn_revenue_nan(flat_data_dir):
+    df = _frame(flat_data_dir)
+    assert df['Total_charges'].isna().any()
+    kpis = cube_kpis(AggregateCube.build(df), {})
+
+    assert kpis['total_admissions'] == len(df)
+    assert kpis['total_revenue'] == np.float64(df['Total_charges'].sum())
+    assert kpis['billed_admissions'] == df['Total_charges'].notna().sum()
+    assert np.isclose(kpis['avg_revenue'], df['Total_charges'].mean())
+
+
+def test_add_rows_matches_a_full_build(flat_data_dir):
+    df = _frame(flat_data_dir)
+    # the added rows extend the day axis on both sides
+    middle = slice(len(df) // 4, 3 * len(df) // 4)
+    rest = df.drop(index=df.index[middle])
+    cube = AggregateCube.build(df.iloc[middle]).add_rows(rest)
+    full = AggregateCube.build(df)
+
+    assert cube.labels['Admission_day'].equals(full.labels['Admission_day'])
+    assert np.allclose(cube.values, full.values)
+    assert np.allclose(cube.prefix, full.prefix)
+    assert list(cube.total({})) == MEASURES
+
+
+def test_add_no_rows(flat_data_dir):
+    df = _frame(flat_data_dir)
+    cube = AggregateCube.build(df)
+    assert np.array_equal(cube.add_rows(df.iloc[:0]).values, cube.values)
+
+
+def _ingest_again(data_dir, edit):
+    # rewrite admissions.csv with edit applied, then let the handle pick up the new generation
+    path = os.path.join(data_dir, 'admissions.csv')
+    edit(pd.read_csv(path)).to_csv(path, index=False)
+    os.utime(path, (time.time() + 10, time.time() + 10))
+
+
+def test_appended_admissions_are_added_to_the_cube(flat_data_dir):
+    handle = DataHandle(flat_data_dir)
+    before = handle.version
+    rows = len(handle.merged(CUBE_COLUMNS))
+
+    def append(admissions):
+        new = admissions.tail(20).assign(Admission_ID=admissions['Admission_ID'].max() + np.arange(1, 21),
+                                         Admission_date='2025-06-01', Discharge_date='2025-06-03')
+        return pd.concat([admissions, new], ignore_index=True)
+
+    _ingest_again(flat_data_dir, append)
+    assert handle.refresh()
+    assert handle.appended_since(before) == rows
+    assert handle.appended_since(handle.version) == rows + 20
+
+    df = handle.merged(CUBE_COLUMNS)
+    cube = AggregateCube.build(df.iloc[:rows]).add_rows(df.iloc[rows:])
+    assert np.allclose(cube.values, AggregateCube.build(df).values)
+
+
+def test_changed_admissions_need_a_full_build(flat_data_dir):
+    handle = DataHandle(flat_data_dir)
+    before = handle.version
+    _ingest_again(flat_data_dir, lambda admissions: admissions.assign(Bed_type='ICU'))
+    assert handle.refresh()
+    assert handle.appended_since(before) is None
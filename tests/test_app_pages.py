@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Every page of the dashboard rendered through Streamlit's AppTest, in a fresh interpreter
+# so HOSPITAL_DATA_DIR and HOSPITAL_MODEL_DIR apply to every module the app imports.
+_VISIT_PAGES = """
+import json, sys
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=300)
+app.run()
+if sys.argv[2]:
+    app.sidebar.selectbox[0].set_value(sys.argv[2]).run()
+errors = {'start': [str(e.message) for e in app.exception]}
+pages = app.sidebar.radio[0].options if sys.argv[3] == 'all' else json.loads(sys.argv[3])
+for page in pages:
+    app.sidebar.radio[0].set_value(page).run()
+    errors[page] = [str(e.message) for e in app.exception]
+print(json.dumps(errors))
+"""
+
+
+def _visit_pages(data_dir, tmp_path, facility=None, pages='all'):
+    env = dict(os.environ, HOSPITAL_DATA_DIR=data_dir, HOSPITAL_MODEL_DIR=str(tmp_path / 'models'))
+    pages = pages if pages == 'all' else json.dumps(pages)
+    result = subprocess.run([sys.executable, "-c", _VISIT_PAGES, os.path.join(ROOT, "app.py"), facility or "", pages],
+                            capture_output=True, text=True, cwd=ROOT, env=env, timeout=900)
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize('layout', ['flat_data_dir', 'sharded_data_dir'])
+def test_every_page_renders(layout, request, tmp_path):
+    errors = _visit_pages(request.getfixturevalue(layout), tmp_path)
+    assert len(errors) > 2
+    assert {page: e for page, e in errors.items() if e} == {}
+
+
+def test_forecast_pages_render_for_an_empty_facility(sharded_data_dir, tmp_path):
+    # a facility shard without admissions: no series to forecast, the pages still render
+    empty = os.path.join(sharded_data_dir, 'facilities', 'F04')
+    os.makedirs(empty)
+    for table in ['admissions', 'billing', 'doctors']:
+        pd.read_csv(os.path.join(sharded_data_dir, 'facilities', 'F01', f"{table}.csv")).head(0).to_csv(
+            os.path.join(empty, f"{table}.csv"), index=False)
+    errors = _visit_pages(sharded_data_dir, tmp_path, 'F04', ["Home Overview", "Department Performance"])
+    assert {page: e for page, e in errors.items() if e} == {}
@@ -0,0 +1,28 @@
+import pandas as pd
+
+from batch_scoring import merge_scores
+
+
+def _scores(ids, probability, scored_at):
+    return pd.DataFrame({
+        'Admission_ID': ids,
+        'Risk_probability': [probability] * len(ids),
+        'Model_version': pd.Categorical(['v1'] * len(ids), categories=['v1']),
+        'Scored_at': pd.Timestamp(scored_at)
+    })
+
+
+def test_as_of_scores_are_merged_by_admission():
+    stored = _scores([1, 2, 3, 4], 0.1, '2025-06-01')
+    as_of = _scores([3, 5], 0.9, '2025-06-02')
+    merged = merge_scores(stored, as_of).set_index('Admission_ID')
+
+    assert sorted(merged.index) == [1, 2, 3, 4, 5]
+    assert merged.loc[[3, 5], 'Risk_probability'].tolist() == [0.9, 0.9]
+    assert merged.loc[[1, 2, 4], 'Risk_probability'].tolist() == [0.1, 0.1, 0.1]
+    assert isinstance(merged['Model_version'].dtype, pd.CategoricalDtype)
+
+
+def test_merge_without_stored_scores():
+    as_of = _scores([3, 5], 0.9, '2025-06-02')
+    assert merge_scores(None, as_of) is as_of
@@ -0,0 +1,46 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_handle import DataHandle
+from drift_monitor import DRIFT_FEATURES, PSI_SIGNIFICANT, histograms, load_state
+
+
+def _ingest_again(data_dir, edit):
+    path = os.path.join(data_dir, 'admissions.csv')
+    edit(pd.read_csv(path)).to_csv(path, index=False)
+    os.utime(path, (time.time() + 10, time.time() + 10))
+    handle = DataHandle(data_dir)
+    handle.refresh()
+    return handle
+
+
+def test_appended_admissions_are_one_batch(flat_data_dir):
+    handle = DataHandle(flat_data_dir)
+    rows = len(handle.merged(DRIFT_FEATURES))
+    assert load_state(flat_data_dir)['reference_rows'] == rows
+
+    def append(admissions):
+        new = admissions.tail(20).assign(Admission_ID=admissions['Admission_ID'].max() + np.arange(1, 21))
+        return pd.concat([admissions, new], ignore_index=True)
+
+    _ingest_again(flat_data_dir, append)
+    state = load_state(flat_data_dir)
+    assert [(b['rows'], b['rebinned']) for b in state['batches']] == [(20, False)]
+    assert state['rows'] == rows + 20
+
+
+def test_regenerated_drop_with_the_same_ids_is_rebinned(flat_data_dir):
+    DataHandle(flat_data_dir).merged(DRIFT_FEATURES)
+    state = load_state(flat_data_dir)
+    handle = _ingest_again(flat_data_dir, lambda admissions: admissions.assign(Bed_type='ICU'))
+
+    after = load_state(flat_data_dir)
+    assert after['watermark'] == state['watermark']
+    assert after['generation'] == handle.version != state['generation']
+    assert [(b['rows'], b['rebinned']) for b in after['batches']] == [(state['rows'], True)]
+    # the re-binned table replaces the running totals rather than adding to them
+    assert after['cumulative'] == {f: c.tolist() for f, c in histograms(handle.merged(DRIFT_FEATURES)).items()}
+    assert after['batches'][-1]['stats']['batch']['psi']['Bed_type'] > PSI_SIGNIFICANT
@@ -0,0 +1,59 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import hospital_operation_kpi as kpi
+from data_handle import DataHandle
+from financial_engine import FINANCIAL_COLUMNS, UNBILLED, financial_partials, rollup, totals
+from kpi_report import FINANCIAL_SECTIONS, compute_sections
+
+
+def _frame(data_dir):
+    return DataHandle(data_dir).merged(FINANCIAL_COLUMNS)
+
+
+def test_unbilled_admissions_are_kept(flat_data_dir):
+    df = _frame(flat_data_dir)
+    unbilled = df['Total_charges'].isna()
+    assert unbilled.sum() == 10
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        partials = financial_partials(df)
+    total = totals(partials)
+
+    assert total['Admissions'] == len(df)
+    assert total['Billed'] == (~unbilled).sum()
+    assert total['Revenue_cents'] == round(df['Total_charges'].sum() * 100)
+    # rates are over every admission, average revenue over the billed ones
+    assert np.isclose(total['Insurance_rate'], (df['Insurance_covered'] == 'Yes').sum() / len(df) * 100)
+    assert np.isclose(total['Approval_rate'], (df['Claim_status'] == 'Approved').sum() / len(df) * 100)
+    assert np.isclose(total['Avg_revenue'], df['Total_charges'].mean())
+
+    claims = rollup(partials, ['Claim_status'])
+    assert claims.loc[UNBILLED, 'Admissions'] == unbilled.sum()
+    assert claims.loc[UNBILLED, 'Revenue_cents'] == 0
+    assert pd.isna(claims.loc[UNBILLED, 'Min_cents'])
+    assert rollup(partials, ['Insurance_covered']).loc[UNBILLED, 'Admissions'] == unbilled.sum()
+
+
+def test_missing_department_and_date_are_kept(flat_data_dir):
+    df = _frame(flat_data_dir)
+    position = np.arange(len(df))
+    df = df.assign(Department=df['Department'].where(position >= 5),
+                   Admission_date=df['Admission_date'].where((position < 5) | (position >= 10)))
+    partials = financial_partials(df)
+
+    assert totals(partials)['Admissions'] == len(df)
+    assert rollup(partials, ['Department']).loc['Unknown', 'Admissions'] == 5
+
+
+def test_report_computes_partials_once(flat_data_dir, monkeypatch):
+    df = _frame(flat_data_dir)
+    calls = []
+    monkeypatch.setattr(kpi, 'financial_partials', lambda frame: calls.append(1) or financial_partials(frame))
+    results = compute_sections(df, FINANCIAL_SECTIONS, workers=2)
+
+    assert list(results) == FINANCIAL_SECTIONS
+    assert calls == []
+    assert results['claim_status']['Percentage'].sum() == 100
@@ -0,0 +1,26 @@
+import json
+
+from data_loader import list_facilities, load_data
+from facility_aggregation import NETWORK, network_aggregates, network_kpis, facility_comparison
+
+
+def test_network_aggregates_on_flat_layout(flat_data_dir):
+    # no facility shards and no Facility_ID column: one network-wide partial
+    assert list_facilities(flat_data_dir) == []
+    agg = network_aggregates(flat_data_dir)
+    df = load_data(flat_data_dir)[0]
+
+    assert list(agg['sums']['Facility_ID'].unique()) == [NETWORK]
+    assert network_kpis(agg)['total_admissions'] == len(df)
+    assert list(facility_comparison(agg)['Facility_ID']) == [NETWORK]
+
+
+def test_kpi_api_on_flat_layout(flat_data_dir):
+    from kpi_api import KpiService
+
+    service = KpiService(flat_data_dir)
+    for path in ['/health', '/kpis', '/kpis/financial', '/departments', '/facilities']:
+        body, etag = service.response(path, {})
+        assert etag
+    body, _ = service.response('/facilities', {})
+    assert [row['Facility_ID'] for row in json.loads(body)['rows']] == [NETWORK]
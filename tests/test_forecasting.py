@@ -0,0 +1,28 @@
+import pandas as pd
+
+from data_handle import DataHandle
+from forecasting import HISTORY_COLUMNS, FORECAST_COLUMNS, TOTAL, daily_series, forecast_frame, history_frame, update_forecasts
+
+COLUMNS = ['Department', 'Admission_date', 'Discharge_date']
+
+
+def test_no_admissions_give_empty_forecasts(tmp_path):
+    df = pd.DataFrame({'Department': pd.Series([], dtype=object),
+                       'Admission_date': pd.Series([], dtype='datetime64[ns]'),
+                       'Discharge_date': pd.Series([], dtype='datetime64[ns]')})
+    assert daily_series(df) == {}
+    models, series = update_forecasts(df, str(tmp_path))
+    assert models == {}
+    assert list(forecast_frame(models, series).columns) == FORECAST_COLUMNS
+    assert list(history_frame(series).columns) == HISTORY_COLUMNS
+
+
+def test_undated_admissions_are_left_out(flat_data_dir):
+    df = DataHandle(flat_data_dir).merged(COLUMNS)
+    undated = df.assign(Admission_date=df['Admission_date'].where(df['Department'] != df['Department'].iloc[0]))
+    series = daily_series(undated)
+
+    assert (df['Department'].iloc[0], 'Admissions') not in series
+    assert series[(TOTAL, 'Admissions')].sum() == undated['Admission_date'].notna().sum()
+    models, _ = update_forecasts(undated, flat_data_dir, workers=1)
+    assert {name.split("|")[0] for name in models} == {key[0] for key in series}
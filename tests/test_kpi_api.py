@@ -0,0 +1,55 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from kpi_api import ApiError, KpiRequestHandler, KpiService
+
+
+def test_cache_key_ignores_unread_params(flat_data_dir):
+    service = KpiService(flat_data_dir)
+    first = service.response('/kpis', {})
+    for i in range(20):
+        assert service.response('/kpis', {'nocache': str(i)}) == first
+    assert len([k for k in service._cache if k[0] == 'response']) == 1
+    assert set(service._key_locks) <= set(service._cache)
+
+
+def test_response_cache_is_bounded(flat_data_dir):
+    service = KpiService(flat_data_dir, max_responses=2)
+    for path in ['/kpis', '/departments', '/facilities', '/kpis/overview']:
+        service.response(path, {})
+    responses = [k for k in service._cache if k[0] == 'response']
+    assert responses == [('response', 'facilities'), ('response', 'kpis', 'overview', None)]
+    # the shared aggregates are not evicted with the responses
+    assert ('aggregates',) in service._cache
+    assert set(service._key_locks) <= set(service._cache)
+
+
+def test_invalid_params_are_rejected_before_caching(flat_data_dir):
+    service = KpiService(flat_data_dir)
+    with pytest.raises(ApiError):
+        service.response('/kpis', {'facility': 'F99'})
+    with pytest.raises(ApiError):
+        service.response('/risk/scores', {'limit': 'all'})
+    assert not service._cache
+    assert not service._key_locks
+
+
+def test_unexpected_error_returns_json_500(flat_data_dir, monkeypatch):
+    service = KpiService(flat_data_dir)
+    monkeypatch.setattr(service, 'kpis', lambda facility: 1 / 0)
+    KpiRequestHandler.service, KpiRequestHandler.quiet = service, True
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KpiRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/kpis", timeout=30)
+        assert error.value.code == 500
+        assert json.loads(error.value.read()) == {'error': 'Internal server error'}
+    finally:
+        server.shutdown()
+        server.server_close()
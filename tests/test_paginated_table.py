@@ -0,0 +1,31 @@
+from streamlit.elements.lib import policies
+from streamlit.testing.v1 import AppTest
+
+
+def _table_app():
+    import pandas as pd
+    from paginated_table import paginated_table
+
+    df = pd.DataFrame({'Patient_ID': range(1000), 'Department': ['Cardiology', 'Neurology'] * 500,
+                       'Risk_Score': [i / 1000 for i in range(1000)]})
+    paginated_table(df, key="t", default_sort='Risk_Score', search_cols=['Patient_ID', 'Department'])
+
+
+def test_page_is_clamped_when_the_search_narrows(monkeypatch):
+    # Streamlit logs (once per process) when a widget has a default value and a Session State value
+    warnings = []
+    monkeypatch.setattr(policies, '_shown_default_value_warning', False)
+    monkeypatch.setattr(policies._LOGGER, 'warning', lambda message, *args, **kwargs: warnings.append(message % args))
+    app = AppTest.from_function(_table_app)
+    app.run()
+    assert app.number_input(key="t_page").value == 1
+
+    app.number_input(key="t_page").set_value(15).run()
+    assert app.number_input(key="t_page").value == 15
+    # "99" matches 19 patient ids: a single page of 50 rows
+    app.text_input(key="t_search").input("99").run()
+
+    assert not app.exception
+    assert app.number_input(key="t_page").value == 1
+    assert app.caption[-1].value == "Showing rows 1-19 of 19 (page 1 of 1)"
+    assert not warnings
@@ -0,0 +1,19 @@
+import pyarrow.feather as feather
+from pandas.testing import assert_frame_equal
+
+from data_handle import DataHandle
+from patient_history import HISTORY_COLUMNS, HISTORY_FEATURES, history_features, history_path, load_history_features
+
+
+def test_subset_uses_network_history_and_keeps_cache(flat_data_dir):
+    network = DataHandle(flat_data_dir).merged(HISTORY_COLUMNS + ['Department'])
+    expected = history_features(network).set_index('Admission_ID')[HISTORY_FEATURES]
+
+    # a subset first: features still come from every stay of the patients
+    subset = network[network['Department'] == network['Department'].iloc[0]]
+    features = load_history_features(subset, flat_data_dir)
+    assert_frame_equal(features, expected.loc[subset['Admission_ID']].reset_index(drop=True), check_dtype=False)
+    assert len(feather.read_feather(history_path(flat_data_dir))) == len(network)
+
+    full = load_history_features(network, flat_data_dir)
+    assert_frame_equal(full, expected.reset_index(drop=True), check_dtype=False)